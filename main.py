@@ -4,10 +4,14 @@ AI Stack - Enhanced local multi-model AI system with generic model swappability
 Main entry point for AI stack application
 """
 import argparse
+import atexit
 import json
+import logging
+import queue
 import sys
 import os
 import time
+from logging.handlers import QueueHandler, QueueListener
 
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -61,6 +65,23 @@ def check_basic_components():
         return True
 
 
+def setup_logging(verbose: bool = False):
+    """Send log records to stderr from a background thread so writes don't stall the workflow"""
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.INFO if verbose else logging.WARNING)
+
+
 def create_enhanced_parser():
     """Create enhanced argument parser with new options"""
     parser = argparse.ArgumentParser(
@@ -369,10 +390,10 @@ def handle_cloud_command(controller, args):
                 print(f"⚠️ {provider}: No API key configured")
 
 
-def handle_index_command(args):
+def handle_index_command(args, system_config=None):
     """Handle RAG index building command"""
     try:
-        from src.rag import CodeIndexer, CodeEmbedder, FAISSVectorStore
+        from src.rag import CodeIndexer, CodeEmbedder, FAISSVectorStore, index_type_for_size
         
         project_path = args.index
         if not os.path.exists(project_path):
@@ -389,9 +410,6 @@ def handle_index_command(args):
         print("📦 Loading embedding model...")
         embedder = CodeEmbedder(model_name="BAAI/bge-small-en-v1.5")
         
-        print("📦 Initializing vector store...")
-        vector_store = FAISSVectorStore(index_type="Flat", dimension=embedder.get_embedding_dimension())
-        
         # Index files
         print("📄 Indexing code files...")
         chunks = indexer.index_directory(project_path)
@@ -408,6 +426,19 @@ def handle_index_command(args):
         embeddings = embedder.embed_texts(texts)
         print(f"✅ Generated {len(embeddings)} embeddings")
         
+        # Large corpora get a quantized IVF index unless the config pins a type
+        dimension = embedder.get_embedding_dimension()
+        index_type = system_config.rag_index_type if system_config else "auto"
+        if index_type == "auto":
+            index_type = index_type_for_size(len(embeddings), dimension)
+        
+        print(f"📦 Initializing vector store ({index_type})...")
+        vector_store = FAISSVectorStore(
+            index_type=index_type,
+            dimension=dimension,
+            nprobe=system_config.rag_nprobe if system_config else 8
+        )
+        
         # Add to vector store
         print("💾 Adding embeddings to vector store...")
         vector_store.add_embeddings(embeddings, chunks)
@@ -445,6 +476,7 @@ def main():
     """Main entry point"""
     parser = create_enhanced_parser()
     args = parser.parse_args()
+    setup_logging(args.verbose)
     
     # Handle special modes first
     if args.quick_setup:
@@ -507,7 +539,7 @@ def main():
         return
     
     if args.index:
-        handle_index_command(args)
+        handle_index_command(args, controller.config.get_system_config())
         return
     
     if args.interactive:
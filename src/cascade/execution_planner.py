@@ -6,8 +6,8 @@ executed by AI models, with proper workflow orchestration.
 """
 
 import logging
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
 from .constraint_extractor import Constraint, ConstraintType
@@ -76,6 +76,11 @@ class ExecutionPlan:
     workflow_type: str
     parallelizable: bool
     checkpoint_interval: int
+    # Bumped by every ExecutionPlanner status change so a ProgressMonitor can
+    # tell in O(1) whether its counters still describe the plan
+    status_version: int = field(default=0, repr=False, compare=False)
+    # (subtask_id, status) of the latest change if it touched a single subtask
+    last_status_change: Optional[Tuple[str, TaskStatus]] = field(default=None, repr=False, compare=False)
 
 
 class ExecutionPlanner:
@@ -425,7 +430,7 @@ class ExecutionPlanner:
     def _adjust_template(self, template: List[Dict[str, Any]],
                         constraints: List[Constraint]) -> List[Dict[str, Any]]:
         """Adjust subtask template based on constraints."""
-        adjusted = template.copy()
+        adjusted = list(template)
         
         # Check for scope constraint
         scope_constraint = None
@@ -568,6 +573,8 @@ Instructions:
         for subtask in plan.subtasks:
             if subtask.id == subtask_id:
                 subtask.status = status
+                plan.status_version += 1
+                plan.last_status_change = (subtask_id, status)
                 break
         
         return plan
@@ -646,4 +653,6 @@ Instructions:
             if subtask.status == TaskStatus.FAILED:
                 subtask.status = TaskStatus.PENDING
         
+        plan.status_version += 1
+        plan.last_status_change = None
         return plan
\ No newline at end of file
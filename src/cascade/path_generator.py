@@ -6,15 +6,21 @@ the system to adapt when constraints prevent the optimal path.
 """
 
 import logging
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Sequence
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 
 from .constraint_extractor import Constraint, ConstraintType
 from .feasibility_validator import FeasibilityResult, FeasibilityStatus
 
 logger = logging.getLogger(__name__)
 
+# Extras appended to the base pattern for THOROUGH paths
+_THOROUGH_STEPS = ('Add comprehensive tests', 'Performance optimization', 'Security review')
+_THOROUGH_SKILLS = ('optimization', 'security', 'scalability')
+_THOROUGH_RESOURCES = ('profiling tools', 'security scanner', 'CI/CD')
+
 
 class PathType(Enum):
     """Types of execution paths"""
@@ -26,19 +32,140 @@ class PathType(Enum):
     WORKAROUND = "workaround"
 
 
+# Pros and cons reported for each path type
+_PATH_PROS = {
+    PathType.OPTIMAL: (
+        'Balanced approach',
+        'Good quality and speed',
+        'Meets most requirements'
+    ),
+    PathType.FAST: (
+        'Quick completion',
+        'Minimal time investment',
+        'Fast feedback'
+    ),
+    PathType.THOROUGH: (
+        'High quality output',
+        'Comprehensive coverage',
+        'Long-term maintainability'
+    ),
+    PathType.MINIMAL: (
+        'Fastest completion',
+        'Lowest cost',
+        'Quick validation'
+    ),
+    PathType.ALTERNATIVE: (
+        'Different perspective',
+        'May avoid specific issues',
+        'Creative approach'
+    ),
+    PathType.WORKAROUND: (
+        'Bypasses constraints',
+        'Practical solution',
+        'Quick implementation'
+    )
+}
+
+_PATH_CONS = {
+    PathType.OPTIMAL: (
+        'May not excel in any area',
+        'Compromise on extremes'
+    ),
+    PathType.FAST: (
+        'Lower quality',
+        'May miss edge cases',
+        'Limited features'
+    ),
+    PathType.THOROUGH: (
+        'Time-consuming',
+        'May be overkill',
+        'Higher cost'
+    ),
+    PathType.MINIMAL: (
+        'Limited functionality',
+        'May not meet all needs',
+        'Lower quality'
+    ),
+    PathType.ALTERNATIVE: (
+        'Unproven approach',
+        'May have unknown issues',
+        'Learning curve'
+    ),
+    PathType.WORKAROUND: (
+        'Not ideal solution',
+        'May create technical debt',
+        'Temporary fix'
+    )
+}
+
+
+def _adjust_skills(base_skills: Sequence[str], path_type: PathType) -> Sequence[str]:
+    """Adjust required skills based on path type."""
+    if path_type == PathType.MINIMAL:
+        # Keep only essential skills
+        return base_skills[:1]
+    elif path_type == PathType.FAST:
+        # Remove advanced skills
+        return base_skills[:-1] if len(base_skills) > 1 else base_skills
+    elif path_type == PathType.THOROUGH:
+        # Add advanced skills
+        return (*base_skills, *_THOROUGH_SKILLS)
+    else:
+        return base_skills
+
+
+def _adjust_resources(base_resources: Sequence[str], path_type: PathType) -> Sequence[str]:
+    """Adjust required resources based on path type."""
+    if path_type == PathType.MINIMAL:
+        # Keep only essential resources
+        return base_resources[:1]
+    elif path_type == PathType.FAST:
+        # Remove advanced resources
+        return base_resources[:-1] if len(base_resources) > 1 else base_resources
+    elif path_type == PathType.THOROUGH:
+        # Add advanced resources
+        return (*base_resources, *_THOROUGH_RESOURCES)
+    else:
+        return base_resources
+
+
 @dataclass
 class ExecutionPath:
-    """An execution path for completing a task"""
+    """
+    An execution path for completing a task.
+    
+    Skills, resources, pros and cons are derived from the path type on first
+    access, so paths that are only ranked or pruned never build them. Steps
+    stay eager because the time and cost estimates depend on them.
+    """
     path_type: PathType
     description: str
     steps: List[str]
     estimated_time: float
     estimated_cost: float
-    required_skills: List[str]
-    required_resources: List[str]
-    pros: List[str]
-    cons: List[str]
     confidence: float
+    base_skills: Sequence[str] = field(default=(), repr=False)
+    base_resources: Sequence[str] = field(default=(), repr=False)
+    
+    @cached_property
+    def required_skills(self) -> Sequence[str]:
+        """Skills required for this path."""
+        return _adjust_skills(self.base_skills, self.path_type)
+    
+    @cached_property
+    def required_resources(self) -> Sequence[str]:
+        """Resources required for this path."""
+        return _adjust_resources(self.base_resources, self.path_type)
+    
+    @cached_property
+    def pros(self) -> Sequence[str]:
+        """Advantages of this path."""
+        return _PATH_PROS.get(self.path_type, ())
+    
+    @cached_property
+    def cons(self) -> Sequence[str]:
+        """Drawbacks of this path."""
+        return _PATH_CONS.get(self.path_type, ())
 
 
 class PathGenerator:
@@ -156,8 +283,6 @@ class PathGenerator:
         Returns:
             List of execution paths
         """
-        paths = []
-        
         # Detect task type
         task_type = self._detect_task_type(task_description)
         
@@ -166,48 +291,69 @@ class PathGenerator:
         base_skills = self.task_patterns.get(task_type, {}).get('skills', [])
         base_resources = self.task_patterns.get(task_type, {}).get('resources', [])
         
-        # Generate different path types
-        if feasibility_result and feasibility_result.status == FeasibilityStatus.FEASIBLE:
+        # Choose path types from feasibility
+        status = feasibility_result.status if feasibility_result else None
+        if status == FeasibilityStatus.FEASIBLE:
             # If feasible, generate optimal and thorough paths
-            paths.append(self._generate_path(
-                PathType.OPTIMAL, task_description, constraints,
-                base_steps, base_skills, base_resources, context
-            ))
-            paths.append(self._generate_path(
-                PathType.THOROUGH, task_description, constraints,
-                base_steps, base_skills, base_resources, context
-            ))
-        elif feasibility_result and feasibility_result.status == FeasibilityStatus.MARGINALLY_FEASIBLE:
+            path_types = (PathType.OPTIMAL, PathType.THOROUGH)
+        elif status == FeasibilityStatus.MARGINALLY_FEASIBLE:
             # If marginally feasible, generate fast and minimal paths
-            paths.append(self._generate_path(
-                PathType.FAST, task_description, constraints,
-                base_steps, base_skills, base_resources, context
-            ))
-            paths.append(self._generate_path(
-                PathType.MINIMAL, task_description, constraints,
-                base_steps, base_skills, base_resources, context
-            ))
+            path_types = (PathType.FAST, PathType.MINIMAL)
         else:
             # If infeasible, generate alternative and workaround paths
-            paths.append(self._generate_path(
-                PathType.ALTERNATIVE, task_description, constraints,
-                base_steps, base_skills, base_resources, context
-            ))
-            paths.append(self._generate_path(
-                PathType.WORKAROUND, task_description, constraints,
-                base_steps, base_skills, base_resources, context
-            ))
+            path_types = (PathType.ALTERNATIVE, PathType.WORKAROUND)
         
         # Always add a minimal path as fallback
-        if not any(p.path_type == PathType.MINIMAL for p in paths):
-            paths.append(self._generate_path(
-                PathType.MINIMAL, task_description, constraints,
+        if PathType.MINIMAL not in path_types:
+            path_types += (PathType.MINIMAL,)
+        
+        paths = [
+            self._generate_path(
+                path_type, task_description, constraints,
                 base_steps, base_skills, base_resources, context
-            ))
+            )
+            for path_type in path_types
+        ]
+        
+        # Drop paths that another candidate beats on every axis
+        paths = self._prune_dominated(paths)
         
         logger.info(f"Generated {len(paths)} execution paths for task")
         return paths
     
+    def _prune_dominated(self, paths: List[ExecutionPath]) -> List[ExecutionPath]:
+        """
+        Remove paths that are dominated by another candidate.
+        
+        A path is dominated when another path is no slower, no more expensive,
+        no less confident and of no lower quality, while being strictly better
+        on at least one of those axes. Quality comes from the path template so
+        that cheap, low-quality paths (e.g. MINIMAL) do not eliminate the
+        richer alternatives.
+        
+        Args:
+            paths: Candidate execution paths
+            
+        Returns:
+            Paths that are not dominated, in their original order
+        """
+        def metrics(path: ExecutionPath):
+            quality = self.path_templates[path.path_type]['quality_multiplier']
+            return (path.estimated_time, path.estimated_cost, -path.confidence, -quality)
+        
+        scored = [(path, metrics(path)) for path in paths]
+        kept = []
+        for path, p_metrics in scored:
+            dominated = any(
+                q is not path
+                and all(a <= b for a, b in zip(q_metrics, p_metrics))
+                and q_metrics != p_metrics
+                for q, q_metrics in scored
+            )
+            if not dominated:
+                kept.append(path)
+        return kept
+    
     def _detect_task_type(self, task_description: str) -> str:
         """
         Detect the type of task from description.
@@ -238,7 +384,7 @@ class PathGenerator:
     
     def _generate_path(self, path_type: PathType, task_description: str,
                       constraints: List[Constraint], base_steps: List[str],
-                      base_skills: List[str], base_resources: List[str],
+                      base_skills: Sequence[str], base_resources: Sequence[str],
                       context: Optional[Dict[str, Any]] = None) -> ExecutionPath:
         """
         Generate a specific execution path.
@@ -266,14 +412,6 @@ class PathGenerator:
         # Estimate cost (simplified - could be more sophisticated)
         estimated_cost = self._estimate_cost(steps, constraints)
         
-        # Adjust skills and resources
-        required_skills = self._adjust_skills(base_skills, path_type)
-        required_resources = self._adjust_resources(base_resources, path_type)
-        
-        # Generate pros and cons
-        pros = self._generate_pros(path_type)
-        cons = self._generate_cons(path_type)
-        
         # Calculate confidence
         confidence = self._calculate_confidence(path_type, constraints)
         
@@ -283,11 +421,9 @@ class PathGenerator:
             steps=steps,
             estimated_time=estimated_time,
             estimated_cost=estimated_cost,
-            required_skills=required_skills,
-            required_resources=required_resources,
-            pros=pros,
-            cons=cons,
-            confidence=confidence
+            confidence=confidence,
+            base_skills=base_skills,
+            base_resources=base_resources
         )
     
     def _adjust_steps(self, base_steps: List[str], path_type: PathType) -> List[str]:
@@ -302,8 +438,7 @@ class PathGenerator:
             return [step for i, step in enumerate(base_steps) if i not in skip_indices]
         elif path_type == PathType.THOROUGH:
             # Add additional steps
-            additional_steps = ['Add comprehensive tests', 'Performance optimization', 'Security review']
-            return base_steps + additional_steps
+            return [*base_steps, *_THOROUGH_STEPS]
         elif path_type == PathType.ALTERNATIVE:
             # Reorder steps
             return base_steps[2:4] + base_steps[0:2] + base_steps[4:]
@@ -363,107 +498,6 @@ class PathGenerator:
         
         return base_cost
     
-    def _adjust_skills(self, base_skills: List[str], path_type: PathType) -> List[str]:
-        """Adjust required skills based on path type."""
-        if path_type == PathType.MINIMAL:
-            # Keep only essential skills
-            return base_skills[:1]
-        elif path_type == PathType.FAST:
-            # Remove advanced skills
-            return base_skills[:-1] if len(base_skills) > 1 else base_skills
-        elif path_type == PathType.THOROUGH:
-            # Add advanced skills
-            additional_skills = ['optimization', 'security', 'scalability']
-            return base_skills + additional_skills
-        else:
-            return base_skills
-    
-    def _adjust_resources(self, base_resources: List[str], path_type: PathType) -> List[str]:
-        """Adjust required resources based on path type."""
-        if path_type == PathType.MINIMAL:
-            # Keep only essential resources
-            return base_resources[:1]
-        elif path_type == PathType.FAST:
-            # Remove advanced resources
-            return base_resources[:-1] if len(base_resources) > 1 else base_resources
-        elif path_type == PathType.THOROUGH:
-            # Add advanced resources
-            additional_resources = ['profiling tools', 'security scanner', 'CI/CD']
-            return base_resources + additional_resources
-        else:
-            return base_resources
-    
-    def _generate_pros(self, path_type: PathType) -> List[str]:
-        """Generate pros for a path type."""
-        pros_map = {
-            PathType.OPTIMAL: [
-                'Balanced approach',
-                'Good quality and speed',
-                'Meets most requirements'
-            ],
-            PathType.FAST: [
-                'Quick completion',
-                'Minimal time investment',
-                'Fast feedback'
-            ],
-            PathType.THOROUGH: [
-                'High quality output',
-                'Comprehensive coverage',
-                'Long-term maintainability'
-            ],
-            PathType.MINIMAL: [
-                'Fastest completion',
-                'Lowest cost',
-                'Quick validation'
-            ],
-            PathType.ALTERNATIVE: [
-                'Different perspective',
-                'May avoid specific issues',
-                'Creative approach'
-            ],
-            PathType.WORKAROUND: [
-                'Bypasses constraints',
-                'Practical solution',
-                'Quick implementation'
-            ]
-        }
-        return pros_map.get(path_type, [])
-    
-    def _generate_cons(self, path_type: PathType) -> List[str]:
-        """Generate cons for a path type."""
-        cons_map = {
-            PathType.OPTIMAL: [
-                'May not excel in any area',
-                'Compromise on extremes'
-            ],
-            PathType.FAST: [
-                'Lower quality',
-                'May miss edge cases',
-                'Limited features'
-            ],
-            PathType.THOROUGH: [
-                'Time-consuming',
-                'May be overkill',
-                'Higher cost'
-            ],
-            PathType.MINIMAL: [
-                'Limited functionality',
-                'May not meet all needs',
-                'Lower quality'
-            ],
-            PathType.ALTERNATIVE: [
-                'Unproven approach',
-                'May have unknown issues',
-                'Learning curve'
-            ],
-            PathType.WORKAROUND: [
-                'Not ideal solution',
-                'May create technical debt',
-                'Temporary fix'
-            ]
-        }
-        return cons_map.get(path_type, [])
-    
     def _calculate_confidence(self, path_type: PathType, constraints: List[Constraint]) -> float:
         """Calculate confidence score for a path."""
         base_confidence = 0.7
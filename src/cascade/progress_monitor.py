@@ -6,8 +6,14 @@ and provides progress reporting and alerts.
 """
 
 import logging
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+import operator
+import re
+import threading
+import time
+from array import array
+from typing import Deque, List, Dict, Any, Optional, Sequence, Tuple
+from collections import Counter, deque
+from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timedelta
 
@@ -15,6 +21,9 @@ from .execution_planner import ExecutionPlan, Subtask, TaskStatus
 
 logger = logging.getLogger(__name__)
 
+# (subtask_id, status, output, error) as accepted by update_progress_many
+ProgressEvent = Tuple[str, TaskStatus, Optional[str], Optional[str]]
+
 
 class ObstacleType(Enum):
     """Types of obstacles that can occur"""
@@ -27,6 +36,89 @@ class ObstacleType(Enum):
     UNKNOWN = "unknown"
 
 
+# Error keywords grouped by the obstacle type they indicate. Each group is
+# named after the ObstacleType value; earlier groups win when an error
+# mentions several kinds of problem.
+_ERROR_KEYWORDS = (
+    (ObstacleType.TIMEOUT, ('timeout', 'timed out')),
+    (ObstacleType.RESOURCE_LIMIT, ('memory', 'resource')),
+    (ObstacleType.DEPENDENCY_FAILURE, ('dependency',)),
+)
+_ERROR_TYPE_PRIORITY = {
+    obstacle_type: rank for rank, (obstacle_type, _) in enumerate(_ERROR_KEYWORDS)
+}
+_ERROR_KEYWORD_RE = re.compile(
+    '|'.join(
+        f"(?P<{obstacle_type.value}>{'|'.join(map(re.escape, keywords))})"
+        for obstacle_type, keywords in _ERROR_KEYWORDS
+    ),
+    re.IGNORECASE
+)
+
+
+def _classify_error(error: str) -> ObstacleType:
+    """Classify an error message with a single scan over the text."""
+    best = ObstacleType.ERROR
+    for match in _ERROR_KEYWORD_RE.finditer(error):
+        obstacle_type = ObstacleType(match.lastgroup)
+        if obstacle_type == ObstacleType.TIMEOUT:
+            return obstacle_type
+        if best == ObstacleType.ERROR or \
+                _ERROR_TYPE_PRIORITY[obstacle_type] < _ERROR_TYPE_PRIORITY[best]:
+            best = obstacle_type
+    return best
+
+
+# Suggested actions attached to each detected obstacle
+_SUGGESTED_ACTIONS: Dict[ObstacleType, Tuple[str, ...]] = {
+    ObstacleType.TIMEOUT: (
+        "Increase timeout threshold",
+        "Break task into smaller chunks",
+        "Use a faster model",
+    ),
+    ObstacleType.RESOURCE_LIMIT: (
+        "Reduce model size",
+        "Free up system resources",
+        "Process data in batches",
+    ),
+    ObstacleType.DEPENDENCY_FAILURE: (
+        "Check dependency status",
+        "Retry failed dependencies",
+        "Consider alternative approach",
+    ),
+    ObstacleType.ERROR: (
+        "Review error details",
+        "Check input data",
+        "Retry with modified parameters",
+    ),
+    ObstacleType.PERFORMANCE_ISSUE: (
+        "Consider using a faster model",
+        "Optimize prompt complexity",
+        "Reduce output requirements",
+    ),
+}
+
+# Recovery suggestions per obstacle type seen during a run
+_RECOVERY_SUGGESTIONS: Dict[ObstacleType, Tuple[str, ...]] = {
+    ObstacleType.TIMEOUT: (
+        "Consider increasing timeout thresholds",
+        "Break complex tasks into smaller subtasks",
+    ),
+    ObstacleType.RESOURCE_LIMIT: (
+        "Reduce model size or batch size",
+        "Free up system memory",
+    ),
+    ObstacleType.ERROR: (
+        "Review error messages and adjust approach",
+        "Check input data for issues",
+    ),
+    ObstacleType.PERFORMANCE_ISSUE: (
+        "Optimize prompts for faster execution",
+        "Consider using faster models for simple tasks",
+    ),
+}
+
+
 class AlertLevel(Enum):
     """Severity levels for alerts"""
     INFO = "info"
@@ -35,7 +127,7 @@ class AlertLevel(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True)
 class Obstacle:
     """An obstacle encountered during execution"""
     obstacle_type: ObstacleType
@@ -43,11 +135,26 @@ class Obstacle:
     subtask_id: str
     timestamp: datetime
     severity: AlertLevel
-    suggested_actions: List[str]
+    suggested_actions: Sequence[str]
     context: Dict[str, Any]
+    _alert: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def alert(self) -> Dict[str, Any]:
+        """Alert describing this obstacle, built on first access."""
+        if self._alert is None:
+            self._alert = {
+                'level': self.severity.value,
+                'type': self.obstacle_type.value,
+                'message': self.description,
+                'subtask_id': self.subtask_id,
+                'timestamp': self.timestamp.isoformat() if self.timestamp else None,
+                'suggested_actions': self.suggested_actions
+            }
+        return self._alert
 
 
-@dataclass
+@dataclass(slots=True)
 class ProgressReport:
     """A progress report for task execution"""
     task_id: str
@@ -58,28 +165,220 @@ class ProgressReport:
     current_subtask: Optional[str]
     elapsed_time: float
     estimated_time_remaining: float
-    obstacles: List[Obstacle]
-    alerts: List[Dict[str, Any]]
+    obstacles: Tuple[Obstacle, ...]
+    
+    @property
+    def alerts(self) -> Tuple[Dict[str, Any], ...]:
+        """Alerts for the obstacles in this report."""
+        return tuple(o.alert for o in self.obstacles)
 
 
 class ProgressMonitor:
     """Tracks task completion, detects obstacles, and reports progress."""
     
-    def __init__(self):
-        """Initialize the progress monitor."""
-        self.obstacles: List[Obstacle] = []
-        self.alerts: List[Dict[str, Any]] = []
+    def __init__(self, max_obstacles: int = 1024):
+        """
+        Initialize the progress monitor.
+        
+        Args:
+            max_obstacles: Most recent obstacles kept for reports and
+                filtered lookups; totals are still counted for all of them
+        """
+        # Guards all mutable monitor state; held only for short sections
+        self._lock = threading.Lock()
+        
+        self.max_obstacles = max_obstacles
+        self.obstacles: Deque[Obstacle] = deque(maxlen=max_obstacles)
+        self._obstacles_by_severity: Dict[AlertLevel, Deque[Obstacle]] = {}
+        self._obstacle_total = 0
+        self._severity_totals: Counter = Counter()
+        self._type_totals: Counter = Counter()
+        self._clear_obstacles()
         self.start_time: Optional[datetime] = None
         self.last_update_time: Optional[datetime] = None
+        self._start_monotonic: Optional[float] = None
         
         # Obstacle detection thresholds
         self.timeout_threshold = 300  # 5 minutes
         self.error_threshold = 3  # Max errors before critical
         self.performance_threshold = 2.0  # 2x slower than expected
         
-        # Progress tracking
-        self.subtask_start_times: Dict[str, datetime] = {}
+        # Progress tracking (start times are time.monotonic() readings)
+        self.subtask_start_times: Dict[str, float] = {}
         self.subtask_durations: Dict[str, float] = {}
+        
+        # Actual vs. expected seconds for timed subtasks with an estimate,
+        # stored column-wise for the report's performance ratio
+        self._timed_ids: List[str] = []
+        self._timed_slots: Dict[str, int] = {}
+        self._actual_durations = array('d')
+        self._expected_durations = array('d')
+        
+        # Subtask lookup by ID, rebuilt when the plan's subtask list changes
+        self._subtask_index: Dict[str, Subtask] = {}
+        self._subtask_index_key: Optional[Tuple[int, int]] = None
+        
+        # Running counters, updated on subtask status transitions
+        self._tracked_task_id: Optional[str] = None
+        self._tracked_status_version = 0
+        self._subtask_status: Dict[str, TaskStatus] = {}
+        self._subtask_position: Dict[str, int] = {}
+        self._status_counts: Counter = Counter()
+        self._in_progress: Dict[str, None] = {}
+        self._pending_time_remaining = 0.0
+    
+    def _clear_obstacles(self) -> None:
+        """Drop all obstacles along with their indices and totals."""
+        self.obstacles = deque(maxlen=self.max_obstacles)
+        self._obstacles_by_severity = {
+            level: deque(maxlen=self.max_obstacles) for level in AlertLevel
+        }
+        self._obstacle_total = 0
+        self._severity_totals = Counter()
+        self._type_totals = Counter()
+    
+    @property
+    def alerts(self) -> List[Dict[str, Any]]:
+        """Alerts for the retained obstacles."""
+        with self._lock:
+            obstacles = list(self.obstacles)
+        return [o.alert for o in obstacles]
+    
+    def _clear_timings(self) -> None:
+        """Drop the recorded actual/expected duration columns."""
+        self._timed_ids = []
+        self._timed_slots = {}
+        self._actual_durations = array('d')
+        self._expected_durations = array('d')
+    
+    def _record_duration(self, plan: ExecutionPlan, subtask_id: str,
+                         duration: float) -> None:
+        """
+        Record how long a subtask took.
+        
+        Args:
+            plan: Execution plan
+            subtask_id: ID of the finished subtask
+            duration: Elapsed seconds
+        """
+        self.subtask_durations[subtask_id] = duration
+        
+        subtask = self._index(plan).get(subtask_id)
+        expected = subtask.estimated_time * 3600 if subtask else 0.0
+        if expected <= 0:
+            return
+        
+        slot = self._timed_slots.get(subtask_id)
+        if slot is None:
+            self._timed_slots[subtask_id] = len(self._timed_ids)
+            self._timed_ids.append(subtask_id)
+            self._actual_durations.append(duration)
+            self._expected_durations.append(expected)
+        else:
+            self._actual_durations[slot] = duration
+            self._expected_durations[slot] = expected
+    
+    def _index(self, plan: ExecutionPlan) -> Dict[str, Subtask]:
+        """
+        Get the subtask ID index for a plan.
+        
+        Args:
+            plan: Execution plan
+            
+        Returns:
+            Mapping of subtask ID to subtask
+        """
+        key = (id(plan.subtasks), len(plan.subtasks))
+        if key != self._subtask_index_key:
+            self._subtask_index = {s.id: s for s in plan.subtasks}
+            self._subtask_index_key = key
+        return self._subtask_index
+    
+    def _sync_counters(self, plan: ExecutionPlan) -> None:
+        """
+        Rebuild the subtask status counters from a plan.
+        
+        Args:
+            plan: Execution plan
+        """
+        self._tracked_task_id = plan.task_id
+        self._tracked_status_version = plan.status_version
+        self._subtask_status = {s.id: s.status for s in plan.subtasks}
+        self._subtask_position = {s.id: i for i, s in enumerate(plan.subtasks)}
+        self._status_counts = Counter(self._subtask_status.values())
+        self._in_progress = {
+            s.id: None for s in plan.subtasks if s.status == TaskStatus.IN_PROGRESS
+        }
+        self._pending_time_remaining = sum(
+            s.estimated_time * 3600 for s in plan.subtasks
+            if s.status == TaskStatus.PENDING
+        )
+    
+    def _ensure_counters(self, plan: ExecutionPlan) -> None:
+        """Bring the counters up to date with this plan."""
+        if (self._tracked_task_id != plan.task_id
+                or len(self._subtask_status) != len(plan.subtasks)):
+            self._sync_counters(plan)
+            return
+        
+        # Catch up on changes made through the ExecutionPlanner; a single
+        # subtask change is applied in place, anything else means a rebuild
+        missed = plan.status_version - self._tracked_status_version
+        if missed == 0:
+            return
+        if missed == 1 and plan.last_status_change is not None:
+            self._tracked_status_version = plan.status_version
+            self._apply_status(plan, *plan.last_status_change)
+        else:
+            self._sync_counters(plan)
+    
+    def _track_status(self, plan: ExecutionPlan, subtask_id: str,
+                      status: TaskStatus) -> None:
+        """
+        Apply a subtask status transition to the running counters.
+        
+        Args:
+            plan: Execution plan
+            subtask_id: ID of subtask being updated
+            status: New status of subtask
+        """
+        self._ensure_counters(plan)
+        self._apply_status(plan, subtask_id, status)
+    
+    def _apply_status(self, plan: ExecutionPlan, subtask_id: str,
+                      status: TaskStatus) -> None:
+        """Move one subtask's contribution between the counters."""
+        if subtask_id not in self._subtask_status:
+            return
+        
+        previous = self._subtask_status[subtask_id]
+        if previous == status:
+            return
+        
+        self._subtask_status[subtask_id] = status
+        self._status_counts[previous] -= 1
+        self._status_counts[status] += 1
+        
+        if previous == TaskStatus.IN_PROGRESS:
+            self._in_progress.pop(subtask_id, None)
+        elif status == TaskStatus.IN_PROGRESS:
+            self._in_progress[subtask_id] = None
+        
+        subtask = self._index(plan).get(subtask_id)
+        estimated = subtask.estimated_time * 3600 if subtask else 0.0
+        if previous == TaskStatus.PENDING:
+            self._pending_time_remaining -= estimated
+        elif status == TaskStatus.PENDING:
+            self._pending_time_remaining += estimated
+    
+    def _record_obstacle(self, obstacle: Obstacle) -> None:
+        """Store and index an obstacle and raise its alert."""
+        self.obstacles.append(obstacle)
+        self._obstacles_by_severity[obstacle.severity].append(obstacle)
+        self._obstacle_total += 1
+        self._severity_totals[obstacle.severity] += 1
+        self._type_totals[obstacle.obstacle_type] += 1
+        self._generate_alert(obstacle)
     
     def start_monitoring(self, plan: ExecutionPlan) -> None:
         """
@@ -88,14 +387,19 @@ class ProgressMonitor:
         Args:
             plan: Execution plan to monitor
         """
-        self.start_time = datetime.now()
-        self.last_update_time = self.start_time
-        self.obstacles = []
-        self.alerts = []
-        self.subtask_start_times = {}
-        self.subtask_durations = {}
-        
-        logger.info(f"Started monitoring task {plan.task_id}")
+        with self._lock:
+            self.start_time = datetime.now()
+            self.last_update_time = self.start_time
+            self._start_monotonic = time.monotonic()
+            self._clear_obstacles()
+            self.subtask_start_times = {}
+            self.subtask_durations = {}
+            self._clear_timings()
+            self._subtask_index = {}
+            self._subtask_index_key = None
+            self._sync_counters(plan)
+        
+        logger.info("Started monitoring task %s", plan.task_id)
     
     def update_progress(self, plan: ExecutionPlan, subtask_id: str,
                        status: TaskStatus, output: Optional[str] = None,
@@ -113,37 +417,73 @@ class ProgressMonitor:
         Returns:
             Progress report
         """
-        self.last_update_time = datetime.now()
+        return self.update_progress_many(plan, [(subtask_id, status, output, error)])
+    
+    def update_progress_many(self, plan: ExecutionPlan,
+                             events: List[ProgressEvent]) -> ProgressReport:
+        """
+        Apply several subtask status updates and report once.
+        
+        Args:
+            plan: Execution plan
+            events: (subtask_id, status, output, error) tuples, applied in order
+            
+        Returns:
+            Progress report after all events are applied
+        """
+        now = datetime.now()
+        tick = time.monotonic()
+        
+        with self._lock:
+            self.last_update_time = now
+            
+            for subtask_id, status, output, error in events:
+                self._apply_update(plan, subtask_id, status, error, now, tick)
+            
+            # Generate progress report
+            report = self._build_report(plan, now)
+        
+        logger.info("Updated progress for task %s: %.1f%%", plan.task_id, report.progress_percentage)
+        return report
+    
+    def _apply_update(self, plan: ExecutionPlan, subtask_id: str,
+                      status: TaskStatus, error: Optional[str],
+                      now: datetime, tick: float) -> None:
+        """
+        Apply a single subtask status update without building a report.
         
+        Args:
+            plan: Execution plan
+            subtask_id: ID of subtask being updated
+            status: New status of subtask
+            error: Optional error message
+            now: Wall-clock time of the update
+            tick: time.monotonic() reading of the update
+        """
         # Track subtask timing
         if status == TaskStatus.IN_PROGRESS:
             if subtask_id not in self.subtask_start_times:
-                self.subtask_start_times[subtask_id] = datetime.now()
+                self.subtask_start_times[subtask_id] = tick
         elif status in [TaskStatus.COMPLETED, TaskStatus.FAILED]:
-            if subtask_id in self.subtask_start_times:
-                duration = (datetime.now() - self.subtask_start_times[subtask_id]).total_seconds()
-                self.subtask_durations[subtask_id] = duration
-                del self.subtask_start_times[subtask_id]
+            started = self.subtask_start_times.pop(subtask_id, None)
+            if started is not None:
+                self._record_duration(plan, subtask_id, tick - started)
+        
+        self._track_status(plan, subtask_id, status)
         
         # Detect obstacles
         if status == TaskStatus.FAILED and error:
-            obstacle = self._detect_error_obstacle(subtask_id, error, plan)
+            obstacle = self._detect_error_obstacle(subtask_id, error, plan, now)
             if obstacle:
-                self.obstacles.append(obstacle)
-                self._generate_alert(obstacle)
+                self._record_obstacle(obstacle)
         
         # Check for performance issues
         if status == TaskStatus.COMPLETED:
-            self._check_performance(subtask_id, plan)
-        
-        # Generate progress report
-        report = self.generate_report(plan)
-        
-        logger.info(f"Updated progress for task {plan.task_id}: {report.progress_percentage:.1f}%")
-        return report
+            self._check_performance(subtask_id, plan, now)
     
     def _detect_error_obstacle(self, subtask_id: str, error: str,
-                              plan: ExecutionPlan) -> Optional[Obstacle]:
+                              plan: ExecutionPlan,
+                              now: Optional[datetime] = None) -> Optional[Obstacle]:
         """
         Detect and categorize an error obstacle.
         
@@ -151,21 +491,13 @@ class ProgressMonitor:
             subtask_id: ID of subtask with error
             error: Error message
             plan: Execution plan
+            now: Optional timestamp of the update (defaults to current time)
             
         Returns:
             Obstacle or None
         """
-        error_lower = error.lower()
-        
         # Determine obstacle type
-        if 'timeout' in error_lower or 'timed out' in error_lower:
-            obstacle_type = ObstacleType.TIMEOUT
-        elif 'memory' in error_lower or 'resource' in error_lower:
-            obstacle_type = ObstacleType.RESOURCE_LIMIT
-        elif 'dependency' in error_lower:
-            obstacle_type = ObstacleType.DEPENDENCY_FAILURE
-        else:
-            obstacle_type = ObstacleType.ERROR
+        obstacle_type = _classify_error(error)
         
         # Determine severity
         severity = AlertLevel.ERROR
@@ -178,13 +510,13 @@ class ProgressMonitor:
         suggested_actions = self._generate_suggested_actions(obstacle_type, error)
         
         # Get subtask
-        subtask = next((s for s in plan.subtasks if s.id == subtask_id), None)
+        subtask = self._index(plan).get(subtask_id)
         
         return Obstacle(
             obstacle_type=obstacle_type,
             description=error,
             subtask_id=subtask_id,
-            timestamp=datetime.now(),
+            timestamp=now or datetime.now(),
             severity=severity,
             suggested_actions=suggested_actions,
             context={
@@ -194,136 +526,110 @@ class ProgressMonitor:
         )
     
     def _generate_suggested_actions(self, obstacle_type: ObstacleType,
-                                   error: str) -> List[str]:
+                                   error: str) -> Sequence[str]:
         """Generate suggested actions for an obstacle."""
-        actions = []
-        
-        if obstacle_type == ObstacleType.TIMEOUT:
-            actions.append("Increase timeout threshold")
-            actions.append("Break task into smaller chunks")
-            actions.append("Use a faster model")
-        elif obstacle_type == ObstacleType.RESOURCE_LIMIT:
-            actions.append("Reduce model size")
-            actions.append("Free up system resources")
-            actions.append("Process data in batches")
-        elif obstacle_type == ObstacleType.DEPENDENCY_FAILURE:
-            actions.append("Check dependency status")
-            actions.append("Retry failed dependencies")
-            actions.append("Consider alternative approach")
-        elif obstacle_type == ObstacleType.ERROR:
-            actions.append("Review error details")
-            actions.append("Check input data")
-            actions.append("Retry with modified parameters")
-        
-        return actions
+        return _SUGGESTED_ACTIONS.get(obstacle_type, ())
     
-    def _check_performance(self, subtask_id: str, plan: ExecutionPlan) -> None:
+    def _check_performance(self, subtask_id: str, plan: ExecutionPlan,
+                          now: Optional[datetime] = None) -> None:
         """
         Check for performance issues in a completed subtask.
         
         Args:
             subtask_id: ID of completed subtask
             plan: Execution plan
+            now: Optional timestamp of the update (defaults to current time)
         """
         if subtask_id not in self.subtask_durations:
             return
         
         actual_duration = self.subtask_durations[subtask_id]
-        subtask = next((s for s in plan.subtasks if s.id == subtask_id), None)
+        subtask = self._index(plan).get(subtask_id)
         
         if not subtask:
             return
         
         expected_duration = subtask.estimated_time * 3600  # Convert hours to seconds
         
+        # Nothing to compare against without an estimate
+        if expected_duration <= 0:
+            return
+        
         if actual_duration > expected_duration * self.performance_threshold:
             # Performance issue detected
             obstacle = Obstacle(
                 obstacle_type=ObstacleType.PERFORMANCE_ISSUE,
                 description=f"Subtask took {actual_duration:.1f}s, expected {expected_duration:.1f}s",
                 subtask_id=subtask_id,
-                timestamp=datetime.now(),
+                timestamp=now or datetime.now(),
                 severity=AlertLevel.WARNING,
-                suggested_actions=[
-                    "Consider using a faster model",
-                    "Optimize prompt complexity",
-                    "Reduce output requirements"
-                ],
+                suggested_actions=_SUGGESTED_ACTIONS[ObstacleType.PERFORMANCE_ISSUE],
                 context={
                     'actual_duration': actual_duration,
                     'expected_duration': expected_duration,
                     'ratio': actual_duration / expected_duration
                 }
             )
-            self.obstacles.append(obstacle)
-            self._generate_alert(obstacle)
+            self._record_obstacle(obstacle)
     
     def _generate_alert(self, obstacle: Obstacle) -> None:
-        """Generate an alert for an obstacle."""
-        alert = {
-            'level': obstacle.severity.value,
-            'type': obstacle.obstacle_type.value,
-            'message': obstacle.description,
-            'subtask_id': obstacle.subtask_id,
-            'timestamp': obstacle.timestamp.isoformat(),
-            'suggested_actions': obstacle.suggested_actions
-        }
-        self.alerts.append(alert)
-        
-        logger.warning(f"Alert generated: {alert['level']} - {alert['message']}")
+        """Log the alert for an obstacle; the alert dict is built on demand."""
+        logger.warning("Alert generated: %s - %s", obstacle.severity.value, obstacle.description)
     
-    def generate_report(self, plan: ExecutionPlan) -> ProgressReport:
+    def generate_report(self, plan: ExecutionPlan,
+                        now: Optional[datetime] = None) -> ProgressReport:
         """
         Generate a progress report for an execution plan.
         
         Args:
             plan: Execution plan
+            now: Optional report timestamp (defaults to current time)
             
         Returns:
             Progress report
         """
+        if now is None:
+            now = datetime.now()
+        with self._lock:
+            return self._build_report(plan, now)
+    
+    def _build_report(self, plan: ExecutionPlan, now: datetime) -> ProgressReport:
+        """Build a progress report; the caller must hold the lock."""
+        self._ensure_counters(plan)
+        
         # Calculate progress
         total_subtasks = len(plan.subtasks)
-        completed_subtasks = sum(1 for s in plan.subtasks 
-                                if s.status == TaskStatus.COMPLETED)
+        completed_subtasks = self._status_counts[TaskStatus.COMPLETED]
         progress_percentage = (completed_subtasks / total_subtasks * 100) if total_subtasks > 0 else 0
         
-        # Find current subtask
-        current_subtask = next((s.id for s in plan.subtasks 
-                               if s.status == TaskStatus.IN_PROGRESS), None)
+        # Find current subtask (earliest in plan order)
+        current_subtask = min(self._in_progress, key=self._subtask_position.__getitem__,
+                              default=None)
         
         # Calculate elapsed time
         elapsed_time = 0.0
-        if self.start_time:
-            elapsed_time = (datetime.now() - self.start_time).total_seconds()
+        if self._start_monotonic is not None:
+            elapsed_time = time.monotonic() - self._start_monotonic
         
         # Estimate time remaining
-        estimated_time_remaining = sum(
-            s.estimated_time * 3600 for s in plan.subtasks
-            if s.status == TaskStatus.PENDING
-        )
+        estimated_time_remaining = max(0.0, self._pending_time_remaining)
         
         # Adjust based on actual performance
-        if self.subtask_durations:
-            avg_performance_ratio = sum(
-                self.subtask_durations[sid] / (s.estimated_time * 3600)
-                for sid, s in [(sid, next((st for st in plan.subtasks if st.id == sid), None))
-                              for sid in self.subtask_durations]
-                if s
-            ) / len(self.subtask_durations)
-            estimated_time_remaining *= avg_performance_ratio
+        if self._timed_ids:
+            total_ratio = sum(map(operator.truediv,
+                                  self._actual_durations, self._expected_durations))
+            estimated_time_remaining *= total_ratio / len(self._timed_ids)
         
         return ProgressReport(
             task_id=plan.task_id,
-            timestamp=datetime.now(),
+            timestamp=now,
             progress_percentage=progress_percentage,
             completed_subtasks=completed_subtasks,
             total_subtasks=total_subtasks,
             current_subtask=current_subtask,
             elapsed_time=elapsed_time,
             estimated_time_remaining=estimated_time_remaining,
-            obstacles=self.obstacles.copy(),
-            alerts=self.alerts.copy()
+            obstacles=tuple(self.obstacles)
         )
     
     def get_obstacles(self, severity: Optional[AlertLevel] = None) -> List[Obstacle]:
@@ -336,9 +642,10 @@ class ProgressMonitor:
         Returns:
             List of obstacles
         """
-        if severity:
-            return [o for o in self.obstacles if o.severity == severity]
-        return self.obstacles.copy()
+        with self._lock:
+            if severity:
+                return list(self._obstacles_by_severity[severity])
+            return list(self.obstacles)
     
     def get_alerts(self, level: Optional[AlertLevel] = None) -> List[Dict[str, Any]]:
         """
@@ -350,9 +657,9 @@ class ProgressMonitor:
         Returns:
             List of alerts
         """
-        if level:
-            return [a for a in self.alerts if a['level'] == level.value]
-        return self.alerts.copy()
+        with self._lock:
+            obstacles = list(self._obstacles_by_severity[level] if level else self.obstacles)
+        return [o.alert for o in obstacles]
     
     def has_critical_obstacles(self) -> bool:
         """
@@ -361,7 +668,7 @@ class ProgressMonitor:
         Returns:
             True if critical obstacles exist
         """
-        return any(o.severity == AlertLevel.CRITICAL for o in self.obstacles)
+        return self._severity_totals[AlertLevel.CRITICAL] > 0
     
     def should_stop_execution(self) -> bool:
         """
@@ -375,9 +682,7 @@ class ProgressMonitor:
             return True
         
         # Stop if too many errors
-        error_count = sum(1 for o in self.obstacles 
-                         if o.obstacle_type == ObstacleType.ERROR)
-        if error_count >= self.error_threshold:
+        if self._type_totals[ObstacleType.ERROR] >= self.error_threshold:
             return True
         
         return False
@@ -391,38 +696,34 @@ class ProgressMonitor:
         """
         suggestions = []
         
-        # Group obstacles by type
-        obstacle_types = {}
-        for obstacle in self.obstacles:
-            if obstacle.obstacle_type not in obstacle_types:
-                obstacle_types[obstacle.obstacle_type] = []
-            obstacle_types[obstacle.obstacle_type].append(obstacle)
+        # Obstacle types in order of first occurrence
+        with self._lock:
+            obstacle_types = list(self._type_totals)
         
         # Generate suggestions for each type
-        for obstacle_type, obstacles in obstacle_types.items():
-            if obstacle_type == ObstacleType.TIMEOUT:
-                suggestions.append("Consider increasing timeout thresholds")
-                suggestions.append("Break complex tasks into smaller subtasks")
-            elif obstacle_type == ObstacleType.RESOURCE_LIMIT:
-                suggestions.append("Reduce model size or batch size")
-                suggestions.append("Free up system memory")
-            elif obstacle_type == ObstacleType.ERROR:
-                suggestions.append("Review error messages and adjust approach")
-                suggestions.append("Check input data for issues")
-            elif obstacle_type == ObstacleType.PERFORMANCE_ISSUE:
-                suggestions.append("Optimize prompts for faster execution")
-                suggestions.append("Consider using faster models for simple tasks")
+        for obstacle_type in obstacle_types:
+            suggestions.extend(_RECOVERY_SUGGESTIONS.get(obstacle_type, ()))
         
         return suggestions
     
     def reset(self) -> None:
         """Reset the progress monitor."""
-        self.obstacles = []
-        self.alerts = []
-        self.start_time = None
-        self.last_update_time = None
-        self.subtask_start_times = {}
-        self.subtask_durations = {}
+        with self._lock:
+            self._clear_obstacles()
+            self.start_time = None
+            self.last_update_time = None
+            self._start_monotonic = None
+            self.subtask_start_times = {}
+            self.subtask_durations = {}
+            self._clear_timings()
+            self._subtask_index = {}
+            self._subtask_index_key = None
+            self._tracked_task_id = None
+            self._subtask_status = {}
+            self._subtask_position = {}
+            self._status_counts = Counter()
+            self._in_progress = {}
+            self._pending_time_remaining = 0.0
         
         logger.info("Progress monitor reset")
     
@@ -433,14 +734,15 @@ class ProgressMonitor:
         Returns:
             Summary dictionary
         """
-        return {
-            'start_time': self.start_time.isoformat() if self.start_time else None,
-            'last_update_time': self.last_update_time.isoformat() if self.last_update_time else None,
-            'total_obstacles': len(self.obstacles),
-            'total_alerts': len(self.alerts),
-            'critical_obstacles': sum(1 for o in self.obstacles if o.severity == AlertLevel.CRITICAL),
-            'error_obstacles': sum(1 for o in self.obstacles if o.obstacle_type == ObstacleType.ERROR),
-            'performance_obstacles': sum(1 for o in self.obstacles if o.obstacle_type == ObstacleType.PERFORMANCE_ISSUE),
-            'completed_subtasks': len(self.subtask_durations),
-            'in_progress_subtasks': len(self.subtask_start_times)
-        }
\ No newline at end of file
+        with self._lock:
+            return {
+                'start_time': self.start_time.isoformat() if self.start_time else None,
+                'last_update_time': self.last_update_time.isoformat() if self.last_update_time else None,
+                'total_obstacles': self._obstacle_total,
+                'total_alerts': self._obstacle_total,
+                'critical_obstacles': self._severity_totals[AlertLevel.CRITICAL],
+                'error_obstacles': self._type_totals[ObstacleType.ERROR],
+                'performance_obstacles': self._type_totals[ObstacleType.PERFORMANCE_ISSUE],
+                'completed_subtasks': len(self.subtask_durations),
+                'in_progress_subtasks': len(self.subtask_start_times)
+            }
\ No newline at end of file
@@ -6,12 +6,15 @@ obstacles, and performance metrics to improve task completion rates.
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+import re
+import sys
+from types import MappingProxyType
+from typing import List, Dict, Any, Iterator, Mapping, Optional
 from dataclasses import dataclass
 from enum import Enum
 
 from .execution_planner import Subtask, TaskStatus
-from .progress_monitor import Obstacle, ObstacleType, AlertLevel
+from .progress_monitor import Obstacle, ObstacleType
 
 # Import test configuration if available
 try:
@@ -40,7 +43,240 @@ class AdjustmentType(Enum):
     BREAK_DOWN = "break_down"
 
 
-@dataclass
+# Adjustment strategies for different obstacle types. These tables are shared
+# by every PromptAdjuster, so they are read-only views.
+_ADJUSTMENT_STRATEGIES = MappingProxyType({
+    ObstacleType.TIMEOUT: (
+        AdjustmentType.SIMPLIFY,
+        AdjustmentType.REDUCE_SCOPE,
+        AdjustmentType.CHANGE_MODEL
+    ),
+    ObstacleType.ERROR: (
+        AdjustmentType.REFINE,
+        AdjustmentType.ADD_CONTEXT,
+        AdjustmentType.RESTRUCTURE
+    ),
+    ObstacleType.RESOURCE_LIMIT: (
+        AdjustmentType.SIMPLIFY,
+        AdjustmentType.REDUCE_SCOPE,
+        AdjustmentType.CHANGE_MODEL
+    ),
+    ObstacleType.DEPENDENCY_FAILURE: (
+        AdjustmentType.ADD_CONTEXT,
+        AdjustmentType.REFINE
+    ),
+    ObstacleType.QUALITY_ISSUE: (
+        AdjustmentType.EXPAND,
+        AdjustmentType.REFINE,
+        AdjustmentType.ADD_CONTEXT
+    ),
+    ObstacleType.PERFORMANCE_ISSUE: (
+        AdjustmentType.SIMPLIFY,
+        AdjustmentType.REDUCE_SCOPE,
+        AdjustmentType.CHANGE_MODEL
+    )
+})
+
+# Prompt templates for adjustments
+_ADJUSTMENT_TEMPLATES = MappingProxyType({
+    AdjustmentType.SIMPLIFY: MappingProxyType({
+        'prefix': 'Simplified version: ',
+        'suffix': ' Keep it brief and direct.',
+        'instructions': 'Focus on the core requirement only'
+    }),
+    AdjustmentType.EXPAND: MappingProxyType({
+        'prefix': 'Comprehensive version: ',
+        'suffix': ' Provide detailed explanations and examples.',
+        'instructions': 'Include thorough details and context'
+    }),
+    AdjustmentType.REFINE: MappingProxyType({
+        'prefix': 'Refined version: ',
+        'suffix': ' Ensure clarity and precision.',
+        'instructions': 'Improve clarity and specificity'
+    }),
+    AdjustmentType.RESTRUCTURE: MappingProxyType({
+        'prefix': 'Restructured version: ',
+        'suffix': ' Organize logically.',
+        'instructions': 'Reorganize for better flow'
+    }),
+    AdjustmentType.ADD_CONTEXT: MappingProxyType({
+        'prefix': 'With additional context: ',
+        'suffix': ' Consider the broader context.',
+        'instructions': 'Add relevant background information'
+    }),
+    AdjustmentType.REDUCE_SCOPE: MappingProxyType({
+        'prefix': 'Reduced scope version: ',
+        'suffix': ' Focus on essential elements only.',
+        'instructions': 'Limit to minimum viable output'
+    }),
+    AdjustmentType.CHANGE_MODEL: MappingProxyType({
+        'prefix': 'Optimized for different model: ',
+        'suffix': ' Use clear, unambiguous language.',
+        'instructions': 'Optimize for model capabilities'
+    }),
+    AdjustmentType.BREAK_DOWN: MappingProxyType({
+        'prefix': 'Broken down version: ',
+        'suffix': ' Address one aspect at a time.',
+        'instructions': 'Split into smaller, focused tasks'
+    })
+})
+
+# Model-specific optimizations used outside test mode
+_DEFAULT_MODEL_OPTIMIZATIONS = MappingProxyType({
+    'llama3.1:8b': MappingProxyType({
+        'max_tokens': 2048,
+        'temperature': 0.7,
+        'style': 'concise',
+        'avoid': ('complex reasoning', 'multi-step logic')
+    }),
+    'qwen2.5:14b': MappingProxyType({
+        'max_tokens': 4096,
+        'temperature': 0.8,
+        'style': 'detailed',
+        'avoid': ('overly complex', 'ambiguous')
+    })
+})
+
+# Variations offered, in order, by generate_alternative_prompts
+_ALTERNATIVE_VARIATIONS = (
+    AdjustmentType.SIMPLIFY,
+    AdjustmentType.EXPAND,
+    AdjustmentType.REFINE,
+    AdjustmentType.RESTRUCTURE
+)
+
+# Reason templates per adjustment type; "{}" is filled with the obstacle type
+_REASON_TEMPLATES = {
+    AdjustmentType.SIMPLIFY: "Simplifying to address {}",
+    AdjustmentType.EXPAND: "Expanding to improve quality and completeness",
+    AdjustmentType.REFINE: "Refining to resolve {}",
+    AdjustmentType.RESTRUCTURE: "Restructuring for better clarity",
+    AdjustmentType.ADD_CONTEXT: "Adding context to improve understanding",
+    AdjustmentType.REDUCE_SCOPE: "Reducing scope to fit constraints",
+    AdjustmentType.CHANGE_MODEL: "Optimizing for model capabilities",
+    AdjustmentType.BREAK_DOWN: "Breaking down into manageable steps"
+}
+
+_IMPROVEMENT_TEXTS = {
+    AdjustmentType.SIMPLIFY: "Faster execution, lower resource usage",
+    AdjustmentType.EXPAND: "Higher quality, more comprehensive output",
+    AdjustmentType.REFINE: "Better accuracy, fewer errors",
+    AdjustmentType.RESTRUCTURE: "Improved clarity, better flow",
+    AdjustmentType.ADD_CONTEXT: "Better understanding, more relevant output",
+    AdjustmentType.REDUCE_SCOPE: "Faster completion, lower complexity",
+    AdjustmentType.CHANGE_MODEL: "Better model fit, improved performance",
+    AdjustmentType.BREAK_DOWN: "More manageable, better progress tracking"
+}
+
+# Adjustments that are known to work well for an obstacle type, with the
+# confidence they earn; every other pairing gets _BASE_CONFIDENCE
+_BASE_CONFIDENCE = 0.7
+_PREFERRED_ADJUSTMENTS = {
+    ObstacleType.TIMEOUT: ((AdjustmentType.SIMPLIFY, AdjustmentType.REDUCE_SCOPE), 0.9),
+    ObstacleType.ERROR: ((AdjustmentType.REFINE, AdjustmentType.ADD_CONTEXT), 0.8),
+    ObstacleType.RESOURCE_LIMIT: ((AdjustmentType.SIMPLIFY, AdjustmentType.CHANGE_MODEL), 0.85)
+}
+
+
+def _preferred_confidence(adjustment_type: AdjustmentType, obstacle_type: ObstacleType) -> float:
+    preferred, confidence = _PREFERRED_ADJUSTMENTS.get(obstacle_type, ((), _BASE_CONFIDENCE))
+    return confidence if adjustment_type in preferred else _BASE_CONFIDENCE
+
+
+# Fully formed reason and confidence for every (adjustment, obstacle) pairing,
+# so generating an adjustment is a lookup rather than string formatting. The
+# reason and improvement strings are interned so comparing them across
+# adjustments is an identity check.
+_EXPECTED_IMPROVEMENTS = {
+    adjustment_type: sys.intern(improvement)
+    for adjustment_type, improvement in _IMPROVEMENT_TEXTS.items()
+}
+_REASON_TABLE = {
+    (adjustment_type, obstacle_type): sys.intern(
+        _REASON_TEMPLATES[adjustment_type].format(obstacle_type.value)
+    )
+    for adjustment_type in AdjustmentType
+    for obstacle_type in ObstacleType
+}
+_CONFIDENCE_TABLE = {
+    (adjustment_type, obstacle_type): _preferred_confidence(adjustment_type, obstacle_type)
+    for adjustment_type in AdjustmentType
+    for obstacle_type in ObstacleType
+}
+
+# Filler phrases dropped (or shortened) when simplifying a prompt
+_SIMPLIFY_MAP = {
+    'Please ensure that': '',
+    'Make sure to': '',
+    'It is important to': '',
+    'Provide a comprehensive': 'Provide a',
+    'Create a detailed': 'Create a'
+}
+_SIMPLIFY_RE = re.compile('|'.join(re.escape(phrase) for phrase in _SIMPLIFY_MAP))
+
+# Fixed sections appended by the expand, reduce-scope and break-down adjustments
+_EXPAND_SUFFIX = (
+    "\n\nAdditional Requirements:\n"
+    "- Provide detailed explanations\n"
+    "- Include relevant examples\n"
+    "- Consider edge cases\n"
+    "- Explain your reasoning\n"
+)
+_REDUCE_SUFFIX = (
+    "\n\nScope Limitation:\n"
+    "Focus only on the essential elements. "
+    "Skip optional features and nice-to-have additions."
+)
+_BREAKDOWN_SUFFIX = (
+    "\n\nStep-by-Step Approach:\n"
+    "1. Analyze the requirements\n"
+    "2. Plan your approach\n"
+    "3. Execute step by step\n"
+    "4. Review and refine\n"
+)
+_REFINE_NOTE_ERROR = (
+    "\n\nNote: Previous attempt encountered an error. "
+    "Please ensure your output is valid and complete."
+)
+_REFINE_NOTE_QUALITY = (
+    "\n\nNote: Previous output had quality issues. "
+    "Please focus on accuracy and completeness."
+)
+
+# Markers that switch _restructure_prompt into a section. Each group is named
+# after its section; earlier groups win when a line has several markers.
+_SECTION_MARKERS = (
+    ('task', ('task:', 'description:')),
+    ('context', ('context:', 'background:')),
+    ('instructions', ('instruction', 'requirement'))
+)
+_SECTION_PRIORITY = {section: rank for rank, (section, _) in enumerate(_SECTION_MARKERS)}
+_SECTION_RE = re.compile(
+    '|'.join(
+        f"(?P<{section}>{'|'.join(map(re.escape, markers))})"
+        for section, markers in _SECTION_MARKERS
+    ),
+    re.IGNORECASE
+)
+
+
+def _line_section(line: str) -> Optional[str]:
+    """Return the section a line's markers switch to, if any."""
+    best = None
+    for match in _SECTION_RE.finditer(line):
+        section = match.lastgroup
+        if section == 'task':
+            return section
+        if best is None or _SECTION_PRIORITY[section] < _SECTION_PRIORITY[best]:
+            best = section
+    return best
+
+
+# Result keywords used to score an adjustment, grouped by what they indicate
+_OUTCOME_RE = re.compile(r'(?P<error>error|failed)|(?P<success>success|completed)', re.IGNORECASE)
+
+
+@dataclass(slots=True, frozen=True)
 class PromptAdjustment:
     """A prompt adjustment suggestion"""
     adjustment_type: AdjustmentType
@@ -63,101 +299,35 @@ class PromptAdjuster:
         """
         self.test_mode = test_mode or TEST_MODE
         
-        # Adjustment strategies for different obstacle types
-        self.adjustment_strategies = {
-            ObstacleType.TIMEOUT: [
-                AdjustmentType.SIMPLIFY,
-                AdjustmentType.REDUCE_SCOPE,
-                AdjustmentType.CHANGE_MODEL
-            ],
-            ObstacleType.ERROR: [
-                AdjustmentType.REFINE,
-                AdjustmentType.ADD_CONTEXT,
-                AdjustmentType.RESTRUCTURE
-            ],
-            ObstacleType.RESOURCE_LIMIT: [
-                AdjustmentType.SIMPLIFY,
-                AdjustmentType.REDUCE_SCOPE,
-                AdjustmentType.CHANGE_MODEL
-            ],
-            ObstacleType.DEPENDENCY_FAILURE: [
-                AdjustmentType.ADD_CONTEXT,
-                AdjustmentType.REFINE
-            ],
-            ObstacleType.QUALITY_ISSUE: [
-                AdjustmentType.EXPAND,
-                AdjustmentType.REFINE,
-                AdjustmentType.ADD_CONTEXT
-            ],
-            ObstacleType.PERFORMANCE_ISSUE: [
-                AdjustmentType.SIMPLIFY,
-                AdjustmentType.REDUCE_SCOPE,
-                AdjustmentType.CHANGE_MODEL
-            ]
-        }
-        
-        # Prompt templates for adjustments
-        self.adjustment_templates = {
-            AdjustmentType.SIMPLIFY: {
-                'prefix': 'Simplified version: ',
-                'suffix': ' Keep it brief and direct.',
-                'instructions': 'Focus on the core requirement only'
-            },
-            AdjustmentType.EXPAND: {
-                'prefix': 'Comprehensive version: ',
-                'suffix': ' Provide detailed explanations and examples.',
-                'instructions': 'Include thorough details and context'
-            },
-            AdjustmentType.REFINE: {
-                'prefix': 'Refined version: ',
-                'suffix': ' Ensure clarity and precision.',
-                'instructions': 'Improve clarity and specificity'
-            },
-            AdjustmentType.RESTRUCTURE: {
-                'prefix': 'Restructured version: ',
-                'suffix': ' Organize logically.',
-                'instructions': 'Reorganize for better flow'
-            },
-            AdjustmentType.ADD_CONTEXT: {
-                'prefix': 'With additional context: ',
-                'suffix': ' Consider the broader context.',
-                'instructions': 'Add relevant background information'
-            },
-            AdjustmentType.REDUCE_SCOPE: {
-                'prefix': 'Reduced scope version: ',
-                'suffix': ' Focus on essential elements only.',
-                'instructions': 'Limit to minimum viable output'
-            },
-            AdjustmentType.CHANGE_MODEL: {
-                'prefix': 'Optimized for different model: ',
-                'suffix': ' Use clear, unambiguous language.',
-                'instructions': 'Optimize for model capabilities'
-            },
-            AdjustmentType.BREAK_DOWN: {
-                'prefix': 'Broken down version: ',
-                'suffix': ' Address one aspect at a time.',
-                'instructions': 'Split into smaller, focused tasks'
-            }
-        }
+        self.adjustment_strategies = _ADJUSTMENT_STRATEGIES
+        self.adjustment_templates = _ADJUSTMENT_TEMPLATES
         
         # Model-specific optimizations
         if self.test_mode:
             self.model_optimizations = TEST_MODEL_OPTIMIZATIONS
         else:
-            self.model_optimizations = {
-                'llama3.1:8b': {
-                    'max_tokens': 2048,
-                    'temperature': 0.7,
-                    'style': 'concise',
-                    'avoid': ['complex reasoning', 'multi-step logic']
-                },
-                'qwen2.5:14b': {
-                    'max_tokens': 4096,
-                    'temperature': 0.8,
-                    'style': 'detailed',
-                    'avoid': ['overly complex', 'ambiguous']
-                }
-            }
+            self.model_optimizations = _DEFAULT_MODEL_OPTIMIZATIONS
+        
+        # Adjustment handlers: each takes the template-wrapped prompt parts and
+        # returns the finished prompt
+        self._adjust_dispatch = {
+            AdjustmentType.SIMPLIFY: lambda parts, obstacle, subtask, context:
+                self._simplify_prompt("".join(parts)),
+            AdjustmentType.RESTRUCTURE: lambda parts, obstacle, subtask, context:
+                self._restructure_prompt("".join(parts)),
+            AdjustmentType.EXPAND: lambda parts, obstacle, subtask, context:
+                "".join((*parts, self._expand_section())),
+            AdjustmentType.REFINE: lambda parts, obstacle, subtask, context:
+                "".join((*parts, self._refine_section(obstacle))),
+            AdjustmentType.ADD_CONTEXT: lambda parts, obstacle, subtask, context:
+                "".join((*parts, *self._context_section(context))),
+            AdjustmentType.REDUCE_SCOPE: lambda parts, obstacle, subtask, context:
+                "".join((*parts, self._reduce_scope_section())),
+            AdjustmentType.CHANGE_MODEL: lambda parts, obstacle, subtask, context:
+                "".join((*parts, *self._model_section(subtask.required_model))),
+            AdjustmentType.BREAK_DOWN: lambda parts, obstacle, subtask, context:
+                "".join((*parts, self._break_down_section()))
+        }
     
     def analyze_obstacle(self, obstacle: Obstacle, subtask: Subtask,
                         context: Optional[Dict[str, Any]] = None) -> List[PromptAdjustment]:
@@ -172,10 +342,26 @@ class PromptAdjuster:
         Returns:
             List of prompt adjustments
         """
-        adjustments = []
+        adjustments = list(self.iter_adjustments(obstacle, subtask, context))
         
+        logger.info("Generated %d prompt adjustments for %s", len(adjustments), obstacle.obstacle_type.value)
+        return adjustments
+    
+    def iter_adjustments(self, obstacle: Obstacle, subtask: Subtask,
+                         context: Optional[Dict[str, Any]] = None) -> Iterator[PromptAdjustment]:
+        """
+        Lazily generate prompt adjustments for an obstacle.
+        
+        Args:
+            obstacle: The obstacle encountered
+            subtask: The subtask that encountered the obstacle
+            context: Optional context
+            
+        Yields:
+            Prompt adjustments, one per applicable strategy
+        """
         # Get adjustment strategies for this obstacle type
-        strategies = self.adjustment_strategies.get(obstacle.obstacle_type, [])
+        strategies = self.adjustment_strategies.get(obstacle.obstacle_type, ())
         
         # Generate adjustments for each strategy
         for strategy in strategies:
@@ -183,10 +369,33 @@ class PromptAdjuster:
                 strategy, obstacle, subtask, context
             )
             if adjustment:
-                adjustments.append(adjustment)
+                yield adjustment
+    
+    def select_best(self, obstacle: Obstacle, subtask: Subtask,
+                    context: Optional[Dict[str, Any]] = None) -> Optional[PromptAdjustment]:
+        """
+        Generate only the best prompt adjustment for an obstacle.
         
-        logger.info(f"Generated {len(adjustments)} prompt adjustments for {obstacle.obstacle_type.value}")
-        return adjustments
+        Confidence doesn't depend on the adjusted prompt, so the winning
+        strategy is picked first and only its prompt is built.
+        
+        Args:
+            obstacle: The obstacle encountered
+            subtask: The subtask that encountered the obstacle
+            context: Optional context
+            
+        Returns:
+            Best adjustment or None
+        """
+        strategies = [
+            strategy for strategy in self.adjustment_strategies.get(obstacle.obstacle_type, ())
+            if strategy in self.adjustment_templates
+        ]
+        if not strategies:
+            return None
+        
+        best = max(strategies, key=lambda x: self._calculate_confidence(x, obstacle, subtask))
+        return self._generate_adjustment(best, obstacle, subtask, context)
     
     def _generate_adjustment(self, adjustment_type: AdjustmentType,
                             obstacle: Obstacle, subtask: Subtask,
@@ -233,8 +442,8 @@ class PromptAdjuster:
         )
     
     def _apply_adjustment(self, adjustment_type: AdjustmentType,
-                         original_prompt: str, template: Dict[str, Any],
-                         obstacle: Obstacle, subtask: Subtask,
+                         original_prompt: str, template: Mapping[str, Any],
+                         obstacle: Optional[Obstacle], subtask: Subtask,
                          context: Optional[Dict[str, Any]] = None) -> str:
         """
         Apply an adjustment to a prompt.
@@ -243,78 +452,41 @@ class PromptAdjuster:
             adjustment_type: Type of adjustment
             original_prompt: Original prompt
             template: Adjustment template
-            obstacle: The obstacle
+            obstacle: The obstacle, or None when not adjusting for one
             subtask: The subtask
             context: Optional context
             
         Returns:
             Adjusted prompt
         """
-        adjusted = original_prompt
-        
-        # Apply prefix
-        if 'prefix' in template:
-            adjusted = template['prefix'] + adjusted
-        
-        # Apply suffix
-        if 'suffix' in template:
-            adjusted = adjusted + template['suffix']
-        
-        # Add specific instructions based on adjustment type
-        if adjustment_type == AdjustmentType.SIMPLIFY:
-            adjusted = self._simplify_prompt(adjusted)
-        elif adjustment_type == AdjustmentType.EXPAND:
-            adjusted = self._expand_prompt(adjusted)
-        elif adjustment_type == AdjustmentType.REFINE:
-            adjusted = self._refine_prompt(adjusted, obstacle)
-        elif adjustment_type == AdjustmentType.RESTRUCTURE:
-            adjusted = self._restructure_prompt(adjusted)
-        elif adjustment_type == AdjustmentType.ADD_CONTEXT:
-            adjusted = self._add_context(adjusted, context)
-        elif adjustment_type == AdjustmentType.REDUCE_SCOPE:
-            adjusted = self._reduce_scope(adjusted)
-        elif adjustment_type == AdjustmentType.CHANGE_MODEL:
-            adjusted = self._optimize_for_model(adjusted, subtask.required_model)
-        elif adjustment_type == AdjustmentType.BREAK_DOWN:
-            adjusted = self._break_down(adjusted)
-        
-        return adjusted
+        # Template prefix and suffix wrap the prompt; the result is assembled once
+        parts = (template.get('prefix', ''), original_prompt, template.get('suffix', ''))
+        
+        # Rewrite the wrapped prompt or append instructions based on adjustment type
+        handler = self._adjust_dispatch.get(adjustment_type)
+        if handler is None:
+            return "".join(parts)
+        
+        return handler(parts, obstacle, subtask, context)
     
     def _simplify_prompt(self, prompt: str) -> str:
         """Simplify a prompt by removing complexity."""
-        # Remove redundant phrases
-        simplified = prompt.replace('Please ensure that', '')
-        simplified = simplified.replace('Make sure to', '')
-        simplified = simplified.replace('It is important to', '')
-        
-        # Simplify instructions
-        simplified = simplified.replace('Provide a comprehensive', 'Provide a')
-        simplified = simplified.replace('Create a detailed', 'Create a')
-        
-        return simplified.strip()
+        # Remove redundant phrases and simplify instructions in one pass
+        return _SIMPLIFY_RE.sub(lambda match: _SIMPLIFY_MAP[match.group(0)], prompt).strip()
     
-    def _expand_prompt(self, prompt: str) -> str:
-        """Expand a prompt by adding detail."""
-        # Add expansion instructions
-        expansion = "\n\nAdditional Requirements:\n"
-        expansion += "- Provide detailed explanations\n"
-        expansion += "- Include relevant examples\n"
-        expansion += "- Consider edge cases\n"
-        expansion += "- Explain your reasoning\n"
-        
-        return prompt + expansion
+    def _expand_section(self) -> str:
+        """Section that expands a prompt with more detail."""
+        return _EXPAND_SUFFIX
     
-    def _refine_prompt(self, prompt: str, obstacle: Obstacle) -> str:
-        """Refine a prompt based on obstacle."""
-        refined = prompt
-        
-        # Add specific refinement based on obstacle
-        if obstacle.obstacle_type == ObstacleType.ERROR:
-            refined += "\n\nNote: Previous attempt encountered an error. Please ensure your output is valid and complete."
-        elif obstacle.obstacle_type == ObstacleType.QUALITY_ISSUE:
-            refined += "\n\nNote: Previous output had quality issues. Please focus on accuracy and completeness."
-        
-        return refined
+    def _refine_section(self, obstacle: Optional[Obstacle]) -> str:
+        """Note that refines a prompt based on the obstacle."""
+        obstacle_type = obstacle.obstacle_type if obstacle else None
+        if obstacle_type == ObstacleType.ERROR:
+            return _REFINE_NOTE_ERROR
+        if obstacle_type == ObstacleType.QUALITY_ISSUE:
+            return _REFINE_NOTE_QUALITY
+        
+        return ''
     
     def _restructure_prompt(self, prompt: str) -> str:
         """Restructure a prompt for better flow."""
@@ -330,121 +502,67 @@ class PromptAdjuster:
         
         current_section = 'task'
         for line in lines:
-            line_lower = line.lower()
-            if 'task:' in line_lower or 'description:' in line_lower:
-                current_section = 'task'
-            elif 'context:' in line_lower or 'background:' in line_lower:
-                current_section = 'context'
-            elif 'instruction' in line_lower or 'requirement' in line_lower:
-                current_section = 'instructions'
-            
+            current_section = _line_section(line) or current_section
             sections[current_section].append(line)
         
         # Rebuild with clear structure
-        restructured = "Task:\n" + "\n".join(sections['task']) + "\n\n"
+        parts = ["Task:\n", "\n".join(sections['task']), "\n\n"]
         if sections['context']:
-            restructured += "Context:\n" + "\n".join(sections['context']) + "\n\n"
+            parts += ("Context:\n", "\n".join(sections['context']), "\n\n")
         if sections['instructions']:
-            restructured += "Instructions:\n" + "\n".join(sections['instructions'])
+            parts += ("Instructions:\n", "\n".join(sections['instructions']))
         
-        return restructured
+        return "".join(parts)
     
-    def _add_context(self, prompt: str, context: Optional[Dict[str, Any]]) -> str:
-        """Add context to a prompt."""
+    def _context_section(self, context: Optional[Dict[str, Any]]) -> List[str]:
+        """Lines that add context to a prompt."""
         if not context:
-            return prompt
+            return []
         
-        context_section = "\n\nAdditional Context:\n"
-        for key, value in context.items():
-            context_section += f"- {key}: {value}\n"
+        lines = ["\n\nAdditional Context:\n"]
+        lines.extend(f"- {key}: {value}\n" for key, value in context.items())
         
-        return prompt + context_section
+        return lines
     
-    def _reduce_scope(self, prompt: str) -> str:
-        """Reduce the scope of a prompt."""
-        # Add scope reduction instruction
-        reduction = "\n\nScope Limitation:\n"
-        reduction += "Focus only on the essential elements. "
-        reduction += "Skip optional features and nice-to-have additions."
-        
-        return prompt + reduction
+    def _reduce_scope_section(self) -> str:
+        """Section that reduces the scope of a prompt."""
+        return _REDUCE_SUFFIX
     
-    def _optimize_for_model(self, prompt: str, model: str) -> str:
-        """Optimize prompt for a specific model."""
-        optimizations = self.model_optimizations.get(model, {})
+    def _model_section(self, model: str) -> List[str]:
+        """Lines that optimize a prompt for a specific model."""
+        optimizations = self.model_optimizations.get(model)
         
         if not optimizations:
-            return prompt
+            return []
         
-        optimized = prompt
+        lines = []
         
         # Add model-specific instructions
-        if 'style' in optimizations:
-            optimized += f"\n\nStyle: {optimizations['style']}"
+        if (style := optimizations.get('style')) is not None:
+            lines.append(f"\n\nStyle: {style}")
         
-        if 'avoid' in optimizations:
-            optimized += "\n\nAvoid: " + ", ".join(optimizations['avoid'])
+        if (avoid := optimizations.get('avoid')) is not None:
+            lines.append("\n\nAvoid: " + ", ".join(avoid))
         
-        return optimized
+        return lines
     
-    def _break_down(self, prompt: str) -> str:
-        """Break down a complex prompt into steps."""
-        breakdown = "\n\nStep-by-Step Approach:\n"
-        breakdown += "1. Analyze the requirements\n"
-        breakdown += "2. Plan your approach\n"
-        breakdown += "3. Execute step by step\n"
-        breakdown += "4. Review and refine\n"
-        
-        return prompt + breakdown
+    def _break_down_section(self) -> str:
+        """Section that breaks a complex prompt down into steps."""
+        return _BREAKDOWN_SUFFIX
     
     def _generate_reason(self, adjustment_type: AdjustmentType,
                         obstacle: Obstacle) -> str:
         """Generate a reason for the adjustment."""
-        reasons = {
-            AdjustmentType.SIMPLIFY: f"Simplifying to address {obstacle.obstacle_type.value}",
-            AdjustmentType.EXPAND: "Expanding to improve quality and completeness",
-            AdjustmentType.REFINE: f"Refining to resolve {obstacle.obstacle_type.value}",
-            AdjustmentType.RESTRUCTURE: "Restructuring for better clarity",
-            AdjustmentType.ADD_CONTEXT: "Adding context to improve understanding",
-            AdjustmentType.REDUCE_SCOPE: "Reducing scope to fit constraints",
-            AdjustmentType.CHANGE_MODEL: "Optimizing for model capabilities",
-            AdjustmentType.BREAK_DOWN: "Breaking down into manageable steps"
-        }
-        
-        return reasons.get(adjustment_type, "Adjustment to improve execution")
+        return _REASON_TABLE[(adjustment_type, obstacle.obstacle_type)]
     
     def _generate_expected_improvement(self, adjustment_type: AdjustmentType) -> str:
         """Generate expected improvement description."""
-        improvements = {
-            AdjustmentType.SIMPLIFY: "Faster execution, lower resource usage",
-            AdjustmentType.EXPAND: "Higher quality, more comprehensive output",
-            AdjustmentType.REFINE: "Better accuracy, fewer errors",
-            AdjustmentType.RESTRUCTURE: "Improved clarity, better flow",
-            AdjustmentType.ADD_CONTEXT: "Better understanding, more relevant output",
-            AdjustmentType.REDUCE_SCOPE: "Faster completion, lower complexity",
-            AdjustmentType.CHANGE_MODEL: "Better model fit, improved performance",
-            AdjustmentType.BREAK_DOWN: "More manageable, better progress tracking"
-        }
-        
-        return improvements.get(adjustment_type, "Improved execution")
+        return _EXPECTED_IMPROVEMENTS[adjustment_type]
     
     def _calculate_confidence(self, adjustment_type: AdjustmentType,
                              obstacle: Obstacle, subtask: Subtask) -> float:
         """Calculate confidence in the adjustment."""
-        base_confidence = 0.7
-        
-        # Adjust based on obstacle type
-        if obstacle.obstacle_type == ObstacleType.TIMEOUT:
-            if adjustment_type in [AdjustmentType.SIMPLIFY, AdjustmentType.REDUCE_SCOPE]:
-                base_confidence = 0.9
-        elif obstacle.obstacle_type == ObstacleType.ERROR:
-            if adjustment_type in [AdjustmentType.REFINE, AdjustmentType.ADD_CONTEXT]:
-                base_confidence = 0.8
-        elif obstacle.obstacle_type == ObstacleType.RESOURCE_LIMIT:
-            if adjustment_type in [AdjustmentType.SIMPLIFY, AdjustmentType.CHANGE_MODEL]:
-                base_confidence = 0.85
-        
-        return base_confidence
+        return _CONFIDENCE_TABLE[(adjustment_type, obstacle.obstacle_type)]
     
     def select_best_adjustment(self, adjustments: List[PromptAdjustment],
                               context: Optional[Dict[str, Any]] = None) -> Optional[PromptAdjustment]:
@@ -461,10 +579,8 @@ class PromptAdjuster:
         if not adjustments:
             return None
         
-        # Sort by confidence
-        sorted_adjustments = sorted(adjustments, key=lambda x: x.confidence, reverse=True)
-        
-        return sorted_adjustments[0]
+        # Highest confidence wins; ties go to the earliest adjustment
+        return max(adjustments, key=lambda x: x.confidence)
     
     def apply_adjustment(self, subtask: Subtask, adjustment: PromptAdjustment) -> Subtask:
         """
@@ -492,28 +608,15 @@ class PromptAdjuster:
         Returns:
             List of alternative prompts
         """
-        alternatives = []
-        
-        # Generate different variations
-        variations = [
-            AdjustmentType.SIMPLIFY,
-            AdjustmentType.EXPAND,
-            AdjustmentType.REFINE,
-            AdjustmentType.RESTRUCTURE
+        # Alternatives aren't tied to an obstacle, so no obstacle-specific
+        # refinement is applied
+        return [
+            self._apply_adjustment(
+                variation, subtask.prompt, self.adjustment_templates[variation],
+                None, subtask
+            )
+            for variation in _ALTERNATIVE_VARIATIONS[:num_alternatives]
         ]
-        
-        for i, variation in enumerate(variations[:num_alternatives]):
-            template = self.adjustment_templates.get(variation)
-            if template:
-                alternative = self._apply_adjustment(
-                    variation, subtask.prompt, template,
-                    Obstacle(ObstacleType.UNKNOWN, "Generating alternative", 
-                           subtask.id, None, AlertLevel.INFO, [], {}),
-                    subtask
-                )
-                alternatives.append(alternative)
-        
-        return alternatives
     
     def evaluate_adjustment_effectiveness(self, original_prompt: str,
                                          adjusted_prompt: str,
@@ -530,10 +633,16 @@ class PromptAdjuster:
             Evaluation metrics
         """
         # Simple evaluation based on result length and quality indicators
+        outcomes = set()
+        for match in _OUTCOME_RE.finditer(result):
+            outcomes.add(match.lastgroup)
+            if len(outcomes) == 2:
+                break
+        
         evaluation = {
             'result_length': len(result),
-            'has_error': 'error' in result.lower() or 'failed' in result.lower(),
-            'has_success': 'success' in result.lower() or 'completed' in result.lower(),
+            'has_error': 'error' in outcomes,
+            'has_success': 'success' in outcomes,
             'prompt_complexity_reduction': len(adjusted_prompt) / len(original_prompt) if original_prompt else 1.0
         }
         
@@ -5,6 +5,9 @@ This configuration uses smaller, faster models for testing.
 """
 
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Final, Mapping, Sequence
 
 # Test mode configuration
 TEST_MODE = True
@@ -17,8 +20,21 @@ class TaskPriority(Enum):
     MEDIUM = "medium"
     LOW = "low"
 
+
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# The tables below are shared by every planner and adjuster in test mode, so
+# they are frozen to keep one component from changing them under another.
+
 # Model mappings for testing (use smaller models)
-TEST_MODEL_CAPABILITIES = {
+TEST_MODEL_CAPABILITIES: Final = _freeze({
     'coding': {
         'simple': 'mistral:latest',      # 4.4 GB - fastest
         'moderate': 'qwen2.5:7b',         # 4.7 GB - smaller than 14B
@@ -39,10 +55,10 @@ TEST_MODEL_CAPABILITIES = {
         'moderate': 'qwen2.5:7b',
         'complex': 'llama3.1:8b'
     }
-}
+})
 
 # Model optimizations for testing
-TEST_MODEL_OPTIMIZATIONS = {
+TEST_MODEL_OPTIMIZATIONS: Final = _freeze({
     'mistral:latest': {
         'max_tokens': 1024,      # Reduced for speed
         'temperature': 0.7,
@@ -61,20 +77,20 @@ TEST_MODEL_OPTIMIZATIONS = {
         'style': 'detailed',
         'avoid': ['overly complex', 'ambiguous']
     }
-}
+})
 
 # Timeout settings for testing (shorter timeouts)
-TEST_TIMEOUTS = {
+TEST_TIMEOUTS: Final = _freeze({
     'model_call': 30,           # Reduced from 60s
     'validation': 30,           # Reduced from 60s
     'health_check': 5           # Reduced from 10s
-}
+})
 
 # Performance thresholds for testing
 TEST_PERFORMANCE_THRESHOLD = 1.5  # 1.5x slower than expected (reduced from 2.0)
 
 # Subtask templates for testing (fewer steps)
-TEST_SUBTASK_TEMPLATES = {
+TEST_SUBTASK_TEMPLATES: Final = _freeze({
     'coding': [
         {
             'description': 'Analyze requirements',
@@ -155,7 +171,7 @@ TEST_SUBTASK_TEMPLATES = {
             'output_format': 'summary'
         }
     ]
-}
+})
 
 
 def get_test_model(task_type: str, complexity: str) -> str:
@@ -163,12 +179,13 @@ def get_test_model(task_type: str, complexity: str) -> str:
     return TEST_MODEL_CAPABILITIES.get(task_type, {}).get(complexity, 'mistral:latest')
 
 
-def get_test_model_optimizations(model: str) -> dict:
-    """Get test model optimizations."""
+@lru_cache(maxsize=None)
+def get_test_model_optimizations(model: str) -> Mapping[str, Any]:
+    """Get test model optimizations (cached; the table is frozen)."""
     return TEST_MODEL_OPTIMIZATIONS.get(model, TEST_MODEL_OPTIMIZATIONS['mistral:latest'])
 
 
-def get_test_subtask_template(task_type: str) -> list:
+def get_test_subtask_template(task_type: str) -> Sequence[Mapping[str, Any]]:
     """Get test subtask template for a task type."""
     return TEST_SUBTASK_TEMPLATES.get(task_type, TEST_SUBTASK_TEMPLATES['coding'])
 
@@ -1,8 +1,8 @@
 """
 Configuration - Centralized settings for the AI stack
 """
-from typing import Dict, Any, List
-from dataclasses import dataclass
+from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, replace
 from enum import Enum
 
 
@@ -12,7 +12,7 @@ class ModelType(Enum):
     EXECUTOR = "executor"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelConfig:
     """Configuration for a specific model"""
     name: str
@@ -21,10 +21,10 @@ class ModelConfig:
     temperature: float
     max_tokens: int
     memory_gb: float
-    alternative: str = None
+    alternative: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MemoryConfig:
     """Memory management configuration"""
     safety_buffer_gb: float = 2.0
@@ -34,7 +34,7 @@ class MemoryConfig:
     cleanup_on_failure: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OllamaConfig:
     """Ollama connection configuration"""
     base_url: str = "http://localhost:11434"
@@ -42,7 +42,7 @@ class OllamaConfig:
     health_check_interval: int = 10
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PerformanceConfig:
     """Performance optimization settings"""
     thermal_adjustment_enabled: bool = True
@@ -51,11 +51,37 @@ class PerformanceConfig:
     performance_monitoring: bool = True
 
 
+# update_setting sections held as frozen dataclasses on AIStackConfig
+_SECTION_ATTRS = frozenset({"memory", "ollama", "performance"})
+
+
+def _copy_nested(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a dict of plain values and nested dicts so callers can't edit the cache"""
+    return {
+        key: _copy_nested(value) if isinstance(value, dict) else value
+        for key, value in data.items()
+    }
+
+
 class AIStackConfig:
     """Main configuration class for the AI stack"""
     
+    __slots__ = (
+        "models", "_by_ollama_name", "_model_families", "_model_config_cache",
+        "memory", "ollama", "performance",
+        "system_memory_gb", "apple_silicon", "metal_acceleration",
+        "_dict_cache", "_opt_cache"
+    )
+    
     def __init__(self):
         self.models = self._init_models()
+        self._by_ollama_name = {config.ollama_name: config for config in self.models.values()}
+        # Model family ("qwen2.5" for "qwen2.5-14b") used for partial matches
+        self._model_families = tuple(
+            (config.name.split("-")[0], config) for config in self.models.values()
+        )
+        # Resolved model names; model configs don't change after init
+        self._model_config_cache: Dict[str, ModelConfig] = {}
         self.memory = MemoryConfig()
         self.ollama = OllamaConfig()
         self.performance = PerformanceConfig()
@@ -64,6 +90,10 @@ class AIStackConfig:
         self.system_memory_gb = 16.0
         self.apple_silicon = True
         self.metal_acceleration = True
+        
+        # Serialized views, rebuilt after update_setting changes a value
+        self._dict_cache: Optional[Dict[str, Any]] = None
+        self._opt_cache: Optional[Dict[str, Any]] = None
     
     def _init_models(self) -> Dict[str, ModelConfig]:
         """Initialize model configurations"""
@@ -98,13 +128,31 @@ class AIStackConfig:
     
     def get_model_config(self, model_name: str) -> ModelConfig:
         """Get configuration for a specific model"""
+        # Callers mostly pass a config key or the exact Ollama name
+        config = self.models.get(model_name) or self._by_ollama_name.get(model_name)
+        if config is not None:
+            return config
+        
+        config = self._model_config_cache.get(model_name)
+        if config is None:
+            config = self._model_config_cache[model_name] = self._resolve_model_config(model_name)
+        return config
+    
+    def _resolve_model_config(self, model_name: str) -> ModelConfig:
+        """Find the configuration matching a model name"""
+        # Tagged name of a configured model, e.g. "mistral:latest"
+        config = self.models.get(model_name.split(":", 1)[0])
+        if config is not None:
+            return config
+        
         for config in self.models.values():
             if config.name in model_name or model_name in config.name:
                 return config
         
         # Try partial match
-        for config in self.models.values():
-            if config.name.split("-")[0] in model_name.lower():
+        model_name_lower = model_name.lower()
+        for family, config in self._model_families:
+            if family in model_name_lower:
                 return config
         
         raise ValueError(f"Model configuration not found for: {model_name}")
@@ -131,21 +179,24 @@ class AIStackConfig:
     def validate_configuration(self) -> List[str]:
         """Validate the current configuration"""
         issues = []
+        memory_budget = self.system_memory_gb - self.memory.safety_buffer_gb
         
-        # Check memory constraints
-        total_model_memory = sum(config.memory_gb for config in self.models.values())
-        if total_model_memory > self.system_memory_gb - self.memory.safety_buffer_gb:
-            issues.append(f"Total model memory ({total_model_memory}GB) exceeds system limits")
-        
-        # Check individual models
-        for name, config in self.models.items():
-            if config.memory_gb > self.system_memory_gb - self.memory.safety_buffer_gb:
-                issues.append(f"Model {name} ({config.memory_gb}GB) may exceed memory limits")
-        
-        # Check temperatures
+        # Check individual models' memory and temperature in one pass
+        total_model_memory = 0
+        memory_issues = []
+        temperature_issues = []
         for name, config in self.models.items():
+            total_model_memory += config.memory_gb
+            if config.memory_gb > memory_budget:
+                memory_issues.append(f"Model {name} ({config.memory_gb}GB) may exceed memory limits")
             if not 0.0 <= config.temperature <= 2.0:
-                issues.append(f"Invalid temperature for {name}: {config.temperature}")
+                temperature_issues.append(f"Invalid temperature for {name}: {config.temperature}")
+        
+        # Check memory constraints
+        if total_model_memory > memory_budget:
+            issues.append(f"Total model memory ({total_model_memory}GB) exceeds system limits")
+        issues.extend(memory_issues)
+        issues.extend(temperature_issues)
         
         # Check Ollama settings
         if self.ollama.timeout < 30:
@@ -155,6 +206,11 @@ class AIStackConfig:
     
     def get_optimization_settings(self) -> Dict[str, Any]:
         """Get performance optimization settings"""
+        if self._opt_cache is None:
+            self._opt_cache = self._build_optimization_settings()
+        return _copy_nested(self._opt_cache)
+    
+    def _build_optimization_settings(self) -> Dict[str, Any]:
         return {
             "apple_silicon_optimized": self.apple_silicon,
             "metal_acceleration": self.metal_acceleration,
@@ -176,6 +232,11 @@ class AIStackConfig:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary"""
+        if self._dict_cache is None:
+            self._dict_cache = self._build_dict()
+        return _copy_nested(self._dict_cache)
+    
+    def _build_dict(self) -> Dict[str, Any]:
         return {
             "models": {name: {
                 "name": config.name,
@@ -213,16 +274,16 @@ class AIStackConfig:
     
     def update_setting(self, section: str, key: str, value: Any) -> None:
         """Update a specific configuration setting"""
-        if section == "memory":
-            setattr(self.memory, key, value)
-        elif section == "ollama":
-            setattr(self.ollama, key, value)
-        elif section == "performance":
-            setattr(self.performance, key, value)
+        # Section configs are frozen, so changes replace the whole section
+        if section in _SECTION_ATTRS:
+            setattr(self, section, replace(getattr(self, section), **{key: value}))
         elif section == "system":
             setattr(self, key, value)
         else:
             raise ValueError(f"Unknown configuration section: {section}")
+        
+        self._model_config_cache.clear()
+        self._dict_cache = self._opt_cache = None
     
     def reset_to_defaults(self) -> None:
         """Reset configuration to defaults"""
@@ -4,17 +4,83 @@ Main Controller - Orchestrates the AI stack workflow
 import json
 import time
 import asyncio
+import logging
 import subprocess
-from typing import Dict, Any, Optional, List, Tuple
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from typing import Callable, Dict, Any, Iterator, Optional, List, Tuple, Union
 from dataclasses import dataclass
+from functools import cached_property
 
 from src.model_manager import ModelManager, ModelState
 from src.prompt_templates import PromptTemplates, PromptConfig
-from src.memory_manager import MemoryManager
+from src.memory_manager import MemoryManager, MemorySnapshot
 from src.config import AIStackConfig, ModelType
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Seconds an error path waits for an in-flight executor prefetch before unloading everything
+PREFETCH_CLEANUP_TIMEOUT = 5.0
+
+
+def _json_loads(text: Union[str, bytes]) -> Any:
+    """Parse JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _extract_json(text: str) -> str:
+    """Cut the first top-level JSON object out of a model response wrapped in prose or fences"""
+    stripped = text.strip()
+    if stripped.startswith("{") and stripped.endswith("}"):
+        return stripped
+    
+    start = text.find("{")
+    if start == -1:
+        return text
+    
+    depth = 0
+    in_string = escaped = False
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:index + 1]
+    
+    # Unbalanced braces; let the parser report the error on the full text
+    return text
+
+
+def _json_dumps_pretty(data: Any) -> str:
+    """Serialize JSON with two-space indentation, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+@dataclass(slots=True)
 class WorkflowResult:
     """Result of a workflow execution"""
     success: bool
@@ -31,12 +97,37 @@ class AIStackController:
     
     def __init__(self, config: Optional[AIStackConfig] = None):
         self.config = config or AIStackConfig()
-        self.model_manager = ModelManager()
-        self.memory_manager = MemoryManager()
-        self.prompt_templates = PromptTemplates()
-        
-        # Take initial memory snapshot
-        self.initial_memory = self.memory_manager.take_memory_snapshot()
+        # (monotonic time, model names) from the last successful `ollama list`
+        self._model_list_cache: Tuple[float, Optional[List[str]]] = (0.0, None)
+        # (plan, serialized plan) for the plan most recently put into a prompt
+        self._plan_json_cache: Tuple[Optional[Dict[str, Any]], str] = (None, "")
+    
+    # Managers are created on first use so constructing a controller that is
+    # only asked for status stays cheap
+    @cached_property
+    def model_manager(self) -> ModelManager:
+        return ModelManager()
+    
+    @cached_property
+    def memory_manager(self) -> MemoryManager:
+        return MemoryManager()
+    
+    @cached_property
+    def prompt_templates(self) -> PromptTemplates:
+        return PromptTemplates()
+    
+    @cached_property
+    def _phase_prompts(self) -> Dict[str, Tuple[PromptConfig, str]]:
+        """Prompt config and system-prompt prefix for each workflow phase"""
+        return {
+            phase: (prompt_config, prompt_config.system_prompt + "\n\n")
+            for phase, prompt_config in self.prompt_templates.get_all_configs().items()
+        }
+    
+    @cached_property
+    def initial_memory(self) -> MemorySnapshot:
+        """Memory snapshot taken before the first workflow loads any model"""
+        return self.memory_manager.take_memory_snapshot()
     
     def health_check(self) -> Dict[str, Any]:
         """Perform system health check"""
@@ -53,22 +144,7 @@ class AIStackController:
         health["ollama_running"] = self.model_manager.check_ollama_status()
         
         # Check available models
-        try:
-            result = subprocess.run(
-                ["ollama", "list"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                models = []
-                for line in result.stdout.strip().split('\n')[1:]:
-                    if line.strip():
-                        model_name = line.split()[0]
-                        models.append(model_name)
-                health["models_available"] = models
-        except Exception:
-            pass
+        health["models_available"] = self._list_models_cached()
         
         # System memory
         health["system_memory"] = self.memory_manager.get_memory_report()
@@ -88,30 +164,114 @@ class AIStackController:
         
         return health
     
-    def call_ollama(self, model_name: str, prompt: str, config: PromptConfig) -> str:
-        """Call Ollama API with a model and prompt"""
+    def _list_models_cached(self) -> List[str]:
+        """List installed Ollama models, reusing a recent successful listing"""
+        listed_at, models = self._model_list_cache
+        if models is not None and \
+                time.monotonic() - listed_at < self.config.ollama.health_check_interval:
+            return list(models)
+        
         try:
-            # Build the command
-            cmd = ["ollama", "run", model_name, prompt]
-            
-            # Execute the command
             result = subprocess.run(
-                cmd,
+                ["ollama", "list"],
                 capture_output=True,
                 text=True,
+                timeout=10
+            )
+            if result.returncode == 0:
+                lines = iter(result.stdout.splitlines())
+                next(lines, None)  # header row
+                models = [line.split(None, 1)[0] for line in lines
+                          if line and not line.isspace()]
+                self._model_list_cache = (time.monotonic(), models)
+                return list(models)
+        except Exception:
+            pass
+        
+        return []
+    
+    @cached_property
+    def http_session(self) -> "requests.Session":
+        """Keep-alive session for the Ollama HTTP API"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
+    def call_ollama(self, model_name: str, prompt: str, config: PromptConfig) -> str:
+        """Call Ollama API with a model and prompt"""
+        if requests is None:
+            raise RuntimeError("The requests package is required to call Ollama")
+        
+        try:
+            # Reuse the pooled connection instead of spawning the CLI per call
+            response = self.http_session.post(
+                f"{self.config.ollama.base_url}/api/generate",
+                json=self._generate_payload(model_name, prompt, config, stream=False),
                 timeout=self.config.ollama.timeout
             )
             
-            if result.returncode != 0:
-                raise RuntimeError(f"Ollama call failed: {result.stderr}")
+            if response.status_code != 200:
+                raise RuntimeError(f"Ollama call failed: {response.text}")
             
-            return result.stdout.strip()
+            return response.json()["response"].strip()
             
-        except subprocess.TimeoutExpired:
+        except requests.exceptions.Timeout:
             raise RuntimeError(f"Model call timed out after {self.config.ollama.timeout}s")
         except Exception as e:
             raise RuntimeError(f"Error calling model {model_name}: {e}")
     
+    def call_ollama_stream(self, model_name: str, prompt: str, config: PromptConfig) -> Iterator[str]:
+        """Call Ollama API and yield response text as it is generated"""
+        if requests is None:
+            raise RuntimeError("The requests package is required to call Ollama")
+        
+        try:
+            with self.http_session.post(
+                f"{self.config.ollama.base_url}/api/generate",
+                json=self._generate_payload(model_name, prompt, config, stream=True),
+                timeout=self.config.ollama.timeout,
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    raise RuntimeError(f"Ollama call failed: {response.text}")
+                
+                # Ollama streams one JSON object per line
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = _json_loads(line)
+                    yield chunk.get("response", "")
+                    if chunk.get("done"):
+                        break
+        
+        except requests.exceptions.Timeout:
+            raise RuntimeError(f"Model call timed out after {self.config.ollama.timeout}s")
+        except Exception as e:
+            raise RuntimeError(f"Error calling model {model_name}: {e}")
+    
+    def _generate_payload(self, model_name: str, prompt: str, config: PromptConfig,
+                          stream: bool) -> Dict[str, Any]:
+        """Build the /api/generate request body"""
+        return {
+            "model": model_name,
+            "prompt": prompt,
+            "stream": stream,
+            "options": {
+                "temperature": config.temperature,
+                "num_predict": config.max_tokens
+            }
+        }
+    
+    def _plan_json(self, plan: Dict[str, Any]) -> str:
+        """Serialize a plan for a prompt, reusing the text while the same plan is passed around"""
+        cached_plan, plan_json = self._plan_json_cache
+        if cached_plan is not plan:
+            plan_json = _json_dumps_pretty(plan)
+            self._plan_json_cache = (plan, plan_json)
+        return plan_json
+    
     def planning_phase(self, user_input: str, context: str = "") -> Tuple[Optional[Dict[str, Any]], str]:
         """Execute the planning phase"""
         try:
@@ -123,21 +283,21 @@ class AIStackController:
                 return None, f"Failed to load planner model: {model_config.ollama_name}"
             
             # Create planner prompt
-            prompt_config = self.prompt_templates.get_planner_config()
+            prompt_config, system_prefix = self._phase_prompts["planner"]
             user_prompt = self.prompt_templates.format_prompt(
                 prompt_config.user_template,
                 user_input=user_input,
                 context=context
             )
             
-            full_prompt = f"{prompt_config.system_prompt}\n\n{user_prompt}"
+            full_prompt = system_prefix + user_prompt
             
             # Call the model
             response = self.call_ollama(model_config.ollama_name, full_prompt, prompt_config)
             
             # Parse JSON response
             try:
-                plan = json.loads(response)
+                plan = _json_loads(_extract_json(response))
                 # Validate plan structure
                 is_valid, risk_score = self.prompt_templates.validate_plan_quality(plan)
                 if not is_valid:
@@ -155,38 +315,39 @@ class AIStackController:
             # Unload planner model
             self.model_manager.unload_model(model_config.ollama_name)
     
-    def critique_phase(self, plan: Dict[str, Any], max_iterations: int = 3) -> Tuple[bool, Dict[str, Any], str]:
-        """Execute the critique phase with iterative refinement"""
+    def critique_phase(self, plan: Dict[str, Any], max_iterations: int = 3,
+                       on_model_loaded: Optional[Callable[[], None]] = None) -> Tuple[bool, Dict[str, Any], str]:
+        """Execute the critique phase with iterative refinement, calling on_model_loaded once the critic is up"""
         try:
             critic_config = self.config.get_critic_config()
-            refinement_config = self.prompt_templates.get_refinement_config()
+            prompt_config, system_prefix = self._phase_prompts["critic"]
+            refinement_config, refinement_prefix = self._phase_prompts["refinement"]
             
             current_plan = plan
-            iteration = 0
             
-            while iteration < max_iterations:
-                iteration += 1
-                
-                # Load critic model
-                critic_model = critic_config.ollama_name
-                state = self.model_manager.safe_load_model(critic_model)
-                
-                if state != ModelState.LOADED:
-                    return False, current_plan, f"Failed to load critic model: {critic_model}"
-                
-                try:
+            # Load critic model once for all iterations
+            critic_model = critic_config.ollama_name
+            state = self.model_manager.safe_load_model(critic_model)
+            
+            if state != ModelState.LOADED:
+                return False, current_plan, f"Failed to load critic model: {critic_model}"
+            
+            if on_model_loaded is not None:
+                on_model_loaded()
+            
+            try:
+                for iteration in range(1, max_iterations + 1):
                     # Create critique prompt
-                    prompt_config = self.prompt_templates.get_critic_config()
                     user_prompt = self.prompt_templates.format_prompt(
                         prompt_config.user_template,
-                        plan=json.dumps(current_plan, indent=2)
+                        plan=self._plan_json(current_plan)
                     )
                     
-                    full_prompt = f"{prompt_config.system_prompt}\n\n{user_prompt}"
+                    full_prompt = system_prefix + user_prompt
                     
                     # Get critique
                     critique_response = self.call_ollama(critic_model, full_prompt, prompt_config)
-                    critique = json.loads(critique_response)
+                    critique = _json_loads(_extract_json(critique_response))
                     
                     # Check if plan is valid
                     if critique.get("is_valid", False) and critique.get("risk_score", 1.0) < 0.3:
@@ -199,38 +360,33 @@ class AIStackController:
                     # Refine the plan
                     refinement_prompt = self.prompt_templates.format_prompt(
                         refinement_config.user_template,
-                        original_plan=json.dumps(current_plan, indent=2),
-                        critique=json.dumps(critique, indent=2)
+                        original_plan=self._plan_json(current_plan),
+                        critique=_json_dumps_pretty(critique)
                     )
                     
-                    full_refinement_prompt = f"{refinement_config.system_prompt}\n\n{refinement_prompt}"
+                    full_refinement_prompt = refinement_prefix + refinement_prompt
                     
                     # Get refined plan
                     refinement_response = self.call_ollama(critic_model, full_refinement_prompt, refinement_config)
-                    refined_plan = json.loads(refinement_response)
+                    refined_plan = _json_loads(_extract_json(refinement_response))
                     
-                    # Validate refined plan
+                    # Validate refined plan; keep the current plan if refinement is invalid
                     is_valid, risk_score = self.prompt_templates.validate_plan_quality(refined_plan)
                     if is_valid:
                         current_plan = refined_plan
-                    else:
-                        # Keep original plan if refinement is invalid
-                        pass
-                
-                finally:
-                    # Unload critic model
-                    self.model_manager.unload_model(critic_model)
-                
-                # Small delay between iterations
-                time.sleep(1)
+            
+            finally:
+                # Unload critic model
+                self.model_manager.unload_model(critic_model)
             
             return False, current_plan, "Critique loop completed without full validation"
             
         except Exception as e:
             return False, plan, f"Critique phase error: {e}"
     
-    def execution_phase(self, plan: Dict[str, Any], additional_context: str = "") -> Tuple[Optional[str], str]:
-        """Execute the final plan"""
+    def execution_phase(self, plan: Dict[str, Any], additional_context: str = "",
+                        on_chunk: Optional[Callable[[str], None]] = None) -> Tuple[Optional[str], str]:
+        """Execute the final plan, passing output to on_chunk as it streams in if given"""
         try:
             # Load executor model
             model_config = self.config.get_executor_config()
@@ -240,17 +396,24 @@ class AIStackController:
                 return None, f"Failed to load executor model: {model_config.ollama_name}"
             
             # Create executor prompt
-            prompt_config = self.prompt_templates.get_executor_config()
+            prompt_config, system_prefix = self._phase_prompts["executor"]
             user_prompt = self.prompt_templates.format_prompt(
                 prompt_config.user_template,
-                plan=json.dumps(plan, indent=2),
+                plan=self._plan_json(plan),
                 additional_context=additional_context
             )
             
-            full_prompt = f"{prompt_config.system_prompt}\n\n{user_prompt}"
+            full_prompt = system_prefix + user_prompt
             
             # Call the model
-            response = self.call_ollama(model_config.ollama_name, full_prompt, prompt_config)
+            if on_chunk is None:
+                response = self.call_ollama(model_config.ollama_name, full_prompt, prompt_config)
+            else:
+                chunks = []
+                for chunk in self.call_ollama_stream(model_config.ollama_name, full_prompt, prompt_config):
+                    on_chunk(chunk)
+                    chunks.append(chunk)
+                response = "".join(chunks).strip()
             
             return response, ""
             
@@ -261,10 +424,18 @@ class AIStackController:
             # Unload executor model
             self.model_manager.unload_model(model_config.ollama_name)
     
-    def process_request(self, user_input: str, context: str = "", additional_context: str = "") -> WorkflowResult:
-        """Process a user request through the full workflow"""
-        start_time = time.time()
+    def process_request(self, user_input: str, context: str = "", additional_context: str = "",
+                        on_chunk: Optional[Callable[[str], None]] = None) -> WorkflowResult:
+        """Process a user request through the full workflow, optionally streaming the output"""
+        start_time = time.monotonic()
         result = WorkflowResult(success=False)
+        initial_memory = self.initial_memory
+        prefetch: Optional[Future] = None
+        prefetch_cancel = threading.Event()
+        
+        def start_prefetch() -> None:
+            nonlocal prefetch
+            prefetch = self._prefetch_executor(prefetch_cancel)
         
         try:
             # Health check first
@@ -274,27 +445,31 @@ class AIStackController:
                 return result
             
             # Phase 1: Planning
-            print("Starting planning phase...")
+            logger.info("Starting planning phase...")
             plan, error = self.planning_phase(user_input, context)
             if error:
                 result.error = f"Planning failed: {error}"
                 return result
             
             result.plan = plan
-            print(f"Plan created with {len(plan.get('steps', []))} steps")
+            logger.info("Plan created with %d steps", len(plan.get("steps", [])))
             
-            # Phase 2: Critique
-            print("Starting critique phase...")
-            is_valid, final_plan, critique_error = self.critique_phase(plan)
+            # Phase 2: Critique, warming the executor model once the critic has loaded
+            logger.info("Starting critique phase...")
+            is_valid, final_plan, critique_error = self.critique_phase(plan, on_model_loaded=start_prefetch)
             if not is_valid and critique_error:
-                print(f"Critique warnings: {critique_error}")
+                logger.warning("Critique warnings: %s", critique_error)
             
             result.plan = final_plan
-            print("Critique phase completed")
+            logger.info("Critique phase completed")
+            
+            # Don't start a second load of the executor while the prefetch runs
+            if prefetch is not None:
+                prefetch.result()
             
             # Phase 3: Execution
-            print("Starting execution phase...")
-            output, error = self.execution_phase(final_plan, additional_context)
+            logger.info("Starting execution phase...")
+            output, error = self.execution_phase(final_plan, additional_context, on_chunk)
             if error:
                 result.error = f"Execution failed: {error}"
                 return result
@@ -304,25 +479,50 @@ class AIStackController:
             
             # Calculate execution metrics
             final_memory = self.memory_manager.take_memory_snapshot()
-            result.execution_time = time.time() - start_time
-            result.memory_used = final_memory.used_gb - self.initial_memory.used_gb
+            result.execution_time = time.monotonic() - start_time
+            result.memory_used = final_memory.used_gb - initial_memory.used_gb
             
-            print(f"Workflow completed in {result.execution_time:.2f}s")
+            logger.info("Workflow completed in %.2fs", result.execution_time)
             
         except Exception as e:
             result.error = f"Workflow error: {e}"
         
         finally:
-            # Ensure all models are unloaded
-            self.model_manager.unload_all_models()
+            # Stop a prefetch that is still loading rather than wait out the full load
+            if prefetch is not None:
+                prefetch_cancel.set()
+                if not prefetch.cancel():
+                    wait([prefetch], timeout=PREFETCH_CLEANUP_TIMEOUT)
+            # On success every phase has unloaded its own model. Otherwise a load may
+            # have timed out or an unload failed unseen, so ask ollama what is running.
+            if not result.success or self.model_manager.any_loaded():
+                self.model_manager.unload_all_models()
         
         return result
     
+    @cached_property
+    def _prefetch_pool(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-prefetch")
+    
+    def _prefetch_executor(self, cancel: threading.Event) -> Optional[Future]:
+        """Start loading the executor model in the background if it fits alongside the loaded critic"""
+        executor_model = self.config.get_executor_config().ollama_name
+        
+        # The critic is already loaded, so its memory shows up in the current usage
+        can_load, _ = self.model_manager.can_load_model(executor_model, self.config.memory.safety_buffer_gb)
+        if not can_load:
+            return None
+        
+        # Plain load_model never unloads, so it can't stop the critic mid-critique
+        return self._prefetch_pool.submit(self.model_manager.load_model, executor_model, cancel=cancel)
+    
     def get_system_status(self) -> Dict[str, Any]:
         """Get comprehensive system status"""
+        health = self.health_check()
         return {
-            "health": self.health_check(),
-            "memory": self.memory_manager.get_memory_report(),
+            "health": health,
+            # The health check already took a fresh memory report
+            "memory": health["system_memory"],
             "loaded_models": self.model_manager.get_loaded_models(),
             "config": self.config.get_optimization_settings()
         }
\ No newline at end of file
@@ -2,10 +2,22 @@
 Enhanced Configuration System - Dynamic model configuration with generic swappability
 """
 import json
+import marshal
+import mmap
 import os
+import threading
+from bisect import bisect_right
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+from types import MappingProxyType
+from typing import BinaryIO, Dict, Any, Iterator, Optional, List
+from dataclasses import dataclass, astuple
+from functools import cached_property, lru_cache
+from operator import attrgetter
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from src.model_registry import ModelRegistry
 from src.profile_manager import ProfileManager
@@ -14,6 +26,168 @@ from src.capabilities import ModelCapabilities, create_capabilities_from_dict
 from src.memory_manager import MemoryManager
 
 
+def _json_loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+# Files above this size are parsed straight from a memory map instead of a read() copy
+_MMAP_MIN_BYTES = 256 * 1024
+
+
+def _indent_json(data: bytes, depth: int) -> bytes:
+    """Shift indented JSON right by depth levels to nest it in a larger document"""
+    # Newlines inside JSON strings are escaped, so every raw newline is layout
+    return data.replace(b'\n', b'\n' + b'  ' * depth)
+
+
+def _sidecar_path(path: str) -> str:
+    """Get the path of the pre-parsed copy kept next to a config file"""
+    head, tail = os.path.split(path)
+    return os.path.join(head, f".{tail}.cache")
+
+
+def _read_sidecar(path: str, key: tuple) -> Optional[Any]:
+    """Load the pre-parsed copy of a config file if it was made from the same file version"""
+    try:
+        with open(_sidecar_path(path), 'rb') as f:
+            cached_key, data = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    return data if cached_key == key else None
+
+
+def _temp_path(path: str) -> str:
+    """Name a temp file next to path that no other process or thread writes to"""
+    return f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+def _write_sidecar(path: str, key: tuple, data: Any) -> None:
+    """Save a pre-parsed copy of a config file; a read-only config dir just skips it"""
+    sidecar = _sidecar_path(path)
+    temp_path = _temp_path(sidecar)
+    try:
+        with open(temp_path, 'wb') as f:
+            marshal.dump((key, data), f)
+        os.replace(temp_path, sidecar)
+    except (OSError, ValueError):
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+@contextmanager
+def _atomic_write(path: str) -> Iterator[BinaryIO]:
+    """Write a file through a temp copy that replaces it only once fully written"""
+    temp_path = _temp_path(path)
+    try:
+        with open(temp_path, 'wb', buffering=1 << 20) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+@lru_cache(maxsize=32)
+def _parse_json_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a JSON file; mtime and size are part of the key so edits are picked up"""
+    if orjson is None:
+        # The stdlib parser is a few times slower than loading a marshal copy, so
+        # keep one across runs; orjson parses about as fast as marshal loads
+        key = (mtime_ns, size, marshal.version)
+        data = _read_sidecar(path, key)
+        if data is None:
+            with open(path, 'rb') as f:
+                data = _json_loads(f.read())
+            _write_sidecar(path, key, data)
+        return data
+    
+    with open(path, 'rb') as f:
+        # Parse big files straight from the page cache instead of a bytes copy
+        if size < _MMAP_MIN_BYTES:
+            return _json_loads(f.read())
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mapped, 'madvise'):
+                mapped.madvise(mmap.MADV_WILLNEED)
+            with memoryview(mapped) as view:
+                return orjson.loads(view)
+
+
+def _load_json_file(path: str) -> Dict[str, Any]:
+    """Load a JSON config file, reusing the parsed data while the file is unchanged
+    
+    The result is shared between callers and must not be modified.
+    """
+    stat = os.stat(path)
+    return _parse_json_file(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+# A list override starting with {"__merge__": "append" | "merge" | "replace"} picks
+# how it combines with the list it overrides; plain lists replace
+_LIST_MERGE_KEY = "__merge__"
+
+
+def _merge_list(current: Any, override: List[Any]) -> List[Any]:
+    """Combine an overriding list with the current value using its merge strategy"""
+    head = override[0] if override else None
+    if not (isinstance(head, dict) and head.keys() == {_LIST_MERGE_KEY}):
+        return override
+    
+    strategy = head[_LIST_MERGE_KEY]
+    items = override[1:]
+    if not isinstance(current, list) or strategy == "replace":
+        return items
+    if strategy == "append":
+        return current + items
+    if strategy == "merge":
+        return current + [item for item in items if item not in current]
+    raise ValueError(f"Unknown list merge strategy: {strategy}")
+
+
+def _deep_merge(merged: Dict[str, Any], overrides: Dict[str, Any], owned: set) -> None:
+    """Recursively apply overrides to merged in place
+    
+    Nested dicts not listed in owned are shared with a source config, so they are
+    copied once before being written to.
+    """
+    stack = [(merged, overrides)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(value, dict):
+                # Merge into a fresh dict when there is nothing to merge with, so
+                # list strategy markers nested in the override are still resolved
+                if not isinstance(current, dict):
+                    current = target[key] = {}
+                    owned.add(id(current))
+                elif id(current) not in owned:
+                    current = target[key] = dict(current)
+                    owned.add(id(current))
+                stack.append((current, value))
+            elif isinstance(value, list):
+                target[key] = _merge_list(current, value)
+            else:
+                target[key] = value
+
+
 class ModelType:
     """Model role types"""
     PLANNER = "planner"
@@ -21,7 +195,29 @@ class ModelType:
     EXECUTOR = "executor"
 
 
-@dataclass
+# Role name to ModelType; unknown roles are treated as executors
+_ROLE_TO_TYPE = MappingProxyType({
+    "planner": ModelType.PLANNER,
+    "critic": ModelType.CRITIC,
+    "executor": ModelType.EXECUTOR
+})
+
+# Max tokens is context // divisor up to a cap, with the pair chosen by context size:
+# below 32k, 32k-64k, 64k-128k and 128k or more
+_CONTEXT_THRESHOLDS = (32000, 64000, 128000)
+_MAX_TOKEN_LIMITS = ((2000, 4), (4000, 8), (6000, 10), (8000, 16))
+
+# Fields of a ModelSelection reported by get_model_recommendations
+_SELECTION_FIELDS = attrgetter('model_name', 'capabilities', 'source', 'validation')
+
+_DEFAULT_TEMPERATURES = MappingProxyType({
+    ModelType.PLANNER: 0.2,
+    ModelType.CRITIC: 0.1,
+    ModelType.EXECUTOR: 0.3
+})
+
+
+@dataclass(slots=True)
 class ModelConfig:
     """Configuration for a specific model instance"""
     name: str
@@ -34,7 +230,7 @@ class ModelConfig:
     source: str = "ollama"  # ollama, openai, anthropic, etc.
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemConfig:
     """System-wide configuration"""
     enable_cloud_fallbacks: bool = False
@@ -43,14 +239,12 @@ class SystemConfig:
     auto_discover_models: bool = True
     validation_timeout_seconds: int = 60
     default_temperature: Dict[str, float] = None
+    rag_index_type: str = "auto"  # "auto" picks Flat or IVF-PQ by corpus size
+    rag_nprobe: int = 8
     
     def __post_init__(self):
         if self.default_temperature is None:
-            self.default_temperature = {
-                ModelType.PLANNER: 0.2,
-                ModelType.CRITIC: 0.1,
-                ModelType.EXECUTOR: 0.3
-            }
+            self.default_temperature = dict(_DEFAULT_TEMPERATURES)
 
 
 class AIStackConfig:
@@ -60,10 +254,18 @@ class AIStackConfig:
         self.config_path = config_path or "config/models.json"
         self.profile_name = profile_name
         
-        # Initialize core components
-        self.model_registry = ModelRegistry(self.config_path)
+        # Initialize core components; the model registry and memory manager are
+        # created on first use, since registry discovery shells out to Ollama
         self.profile_manager = ProfileManager()
-        self.memory_manager = MemoryManager()
+        self._role_mapper: Optional[RoleMapper] = None
+        # Set when the merged config changes; the registry catches up on next use
+        self._registry_stale = True
+        
+        # Results derived from the merged config, cleared whenever it is reloaded
+        self._role_cache: Dict[tuple, Optional[ModelConfig]] = {}
+        # ModelRegistry.last_discovery the role cache was filled against
+        self._role_cache_discovery = 0.0
+        self._system_config: Optional[SystemConfig] = None
         
         # Load configuration
         self._load_configuration()
@@ -78,74 +280,108 @@ class AIStackConfig:
     
     def _load_configuration(self) -> None:
         """Load and merge configuration from multiple sources"""
-        # Base configuration from file
-        base_config = {}
+        self._base_config = self._load_base()
+        self._profile_config = self._load_profile()
+        self._user_config = self._load_user()
+        self._recompute_merged()
+    
+    def _load_base(self) -> Dict[str, Any]:
+        """Load the base configuration file"""
         if os.path.exists(self.config_path):
             try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    base_config = json.load(f)
+                return _load_json_file(self.config_path)
             except Exception as e:
                 print(f"Error loading base configuration: {e}")
-        
-        # User profile overrides
-        profile_config = {}
+        return {}
+    
+    def _load_profile(self) -> Dict[str, Any]:
+        """Load the overrides of the selected or active profile"""
         if self.profile_name:
             profile = self.profile_manager.load_profile(self.profile_name)
-            if profile:
-                profile_config = {
-                    'role_mappings': profile.role_mappings,
-                    'system_settings': profile.system_settings,
-                    'selection_preferences': profile.selection_preferences,
-                    'cloud_settings': profile.cloud_settings
-                }
-        elif self.profile_manager.get_active_profile():
-            active_profile = self.profile_manager.get_active_profile()
-            profile_config = {
-                'role_mappings': active_profile.role_mappings,
-                'system_settings': active_profile.system_settings,
-                'selection_preferences': active_profile.selection_preferences,
-                'cloud_settings': active_profile.cloud_settings
-            }
+        else:
+            profile = self.profile_manager.get_active_profile()
         
-        # User global overrides
-        user_config = {}
+        return profile.as_overlay() if profile else {}
+    
+    def _load_user(self) -> Dict[str, Any]:
+        """Load the global user overrides"""
         user_config_path = "config/user_models.json"
         if os.path.exists(user_config_path):
             try:
-                with open(user_config_path, 'r', encoding='utf-8') as f:
-                    user_config = json.load(f)
+                return _load_json_file(user_config_path)
             except Exception as e:
                 print(f"Error loading user configuration: {e}")
-        
+        return {}
+    
+    def _recompute_merged(self) -> None:
+        """Merge the loaded sources and push the result to the registry"""
         # Merge configurations (priority: user > profile > base)
-        self.merged_config = self._merge_configs(base_config, profile_config, user_config)
+        self.merged_config = self._merge_configs(
+            self._base_config, self._profile_config, self._user_config
+        )
         
-        # Update registry with merged config
-        self.model_registry.config_data = self.merged_config
+        # Sections read for every model config built from a selection
+        self._default_temps = self.merged_config.get("system_settings", {}).get(
+            "default_temperature", _DEFAULT_TEMPERATURES
+        )
+        self._role_mappings = self.merged_config.get("role_mappings", {})
+        self._model_profiles = self.merged_config.get("model_profiles", {})
+        
+        # Cloud model settings by "provider:model" name
+        self._cloud_models = {
+            f"{provider}:{model_id}": model_config
+            for provider, provider_config in self.merged_config.get("cloud_providers", {}).items()
+            for model_id, model_config in provider_config.get("models", {}).items()
+        }
         
-        # Refresh model discovery
-        self.model_registry.refresh()
+        self._registry_stale = True
+        self._role_cache.clear()
+        self._system_config = None
+    
+    @cached_property
+    def _registry(self) -> ModelRegistry:
+        return ModelRegistry(self.config_path)
+    
+    @property
+    def model_registry(self) -> ModelRegistry:
+        """Model registry, synced with the merged config"""
+        return self._sync_registry()
+    
+    def _sync_registry(self) -> ModelRegistry:
+        """Push the merged config to the registry and rediscover models if it changed"""
+        registry = self._registry
+        if self._registry_stale:
+            # Update registry with merged config
+            registry.config_data = self.merged_config
+            
+            # Refresh model discovery
+            registry.refresh()
+            self._registry_stale = False
+        return registry
+    
+    @property
+    def role_mapper(self) -> RoleMapper:
+        """Role mapper over the synced model registry"""
+        registry = self._sync_registry()
+        # Only holds the registry, which is never replaced, so it is shared by all lookups
+        if self._role_mapper is None:
+            self._role_mapper = RoleMapper(registry)
+        return self._role_mapper
+    
+    @cached_property
+    def memory_manager(self) -> MemoryManager:
+        return MemoryManager()
     
     def _merge_configs(self, base: Dict[str, Any], profile: Dict[str, Any], user: Dict[str, Any]) -> Dict[str, Any]:
         """Merge configurations with user overrides"""
-        merged = {}
-        
         # Start with base config
-        merged.update(base)
+        merged = dict(base)
+        # Dicts created by this merge; everything else belongs to the sources
+        owned = {id(merged)}
         
-        # Apply profile overrides
-        for key, value in profile.items():
-            if isinstance(value, dict) and isinstance(merged.get(key), dict):
-                merged[key] = {**merged[key], **value}
-            else:
-                merged[key] = value
-        
-        # Apply user overrides
-        for key, value in user.items():
-            if isinstance(value, dict) and isinstance(merged.get(key), dict):
-                merged[key] = {**merged[key], **value}
-            else:
-                merged[key] = value
+        # Apply profile overrides, then user overrides
+        for overrides in (profile, user):
+            _deep_merge(merged, overrides, owned)
         
         return merged
     
@@ -160,9 +396,35 @@ class AIStackConfig:
         if not isinstance(role, str):
             role = role.value if hasattr(role, 'value') else str(role)
         
-        # Create role mapper
-        role_mapper = RoleMapper(self.model_registry)
+        # Choices made before the registry last rediscovered models may name
+        # models that are gone, or miss better ones that were added
+        last_discovery = self.model_registry.last_discovery
+        if last_discovery != self._role_cache_discovery:
+            self._role_cache.clear()
+            self._role_cache_discovery = last_discovery
+        
+        # Derived constraints only vary with the config (RoleMapper doesn't read
+        # available memory), so they share the None key until the next reload
+        cache_key = (
+            role,
+            astuple(system_constraints) if system_constraints is not None else None,
+            astuple(selection_criteria) if selection_criteria is not None else None,
+            self.profile_manager.get_active_profile_name()
+        )
+        if cache_key in self._role_cache:
+            return self._role_cache[cache_key]
         
+        model_config = self._select_model_config(role, system_constraints, selection_criteria)
+        self._role_cache[cache_key] = model_config
+        return model_config
+    
+    def _select_model_config(
+        self,
+        role: str,
+        system_constraints: Optional[SystemConstraints],
+        selection_criteria: Optional[SelectionCriteria]
+    ) -> Optional[ModelConfig]:
+        """Run model selection for a role and build its configuration"""
         # Get system constraints
         if system_constraints is None:
             system_constraints = SystemConstraints.from_memory_manager(
@@ -177,8 +439,8 @@ class AIStackConfig:
             user_preferences = active_profile.selection_preferences
         
         # Select best model
-        selection = role_mapper.select_model_for_role(
-            ModelType.PLANNER if role == "planner" else ModelType.CRITIC if role == "critic" else ModelType.EXECUTOR,
+        selection = self.role_mapper.select_model_for_role(
+            _ROLE_TO_TYPE.get(role, ModelType.EXECUTOR),
             system_constraints,
             selection_criteria,
             user_preferences
@@ -195,45 +457,26 @@ class AIStackConfig:
         """Create ModelConfig from selection result"""
         capabilities = selection.capabilities
         
-        # Get temperature defaults
-        system_settings = self.merged_config.get("system_settings", {})
-        default_temps = system_settings.get("default_temperature", {
-            "planner": 0.2,
-            "critic": 0.1,
-            "executor": 0.3
-        })
-        
-        # Check for role-specific overrides
-        role_mappings = self.merged_config.get("role_mappings", {})
-        role_config = role_mappings.get(role, {})
-        
         # Start with default temperature
-        temperature = default_temps.get(role, 0.2)
+        temperature = self._default_temps.get(role, 0.2)
         
         # Apply role-specific temperature if available
-        if "temperature" in role_config:
+        role_config = self._role_mappings.get(role)
+        if role_config and "temperature" in role_config:
             temperature = role_config["temperature"]
         
         # Apply model-specific temperature overrides
-        model_profiles = self.merged_config.get("model_profiles", {})
         model_name = selection.model_name
         
         # Handle cloud model names (provider:model)
-        base_model_name = model_name
         if ":" in model_name:
-            provider, model_id = model_name.split(":", 1)
-            # Look in cloud provider models
-            cloud_providers = self.merged_config.get("cloud_providers", {})
-            if provider in cloud_providers:
-                provider_models = cloud_providers[provider].get("models", {})
-                if model_id in provider_models:
-                    provider_config = provider_models[model_id]
-                    if "temperature" in provider_config:
-                        temperature = provider_config["temperature"]
+            provider_config = self._cloud_models.get(model_name)
+            if provider_config and "temperature" in provider_config:
+                temperature = provider_config["temperature"]
         else:
             # Look in model profiles
-            if model_name in model_profiles:
-                model_profile = model_profiles[model_name]
+            model_profile = self._model_profiles.get(model_name)
+            if model_profile:
                 temp_overrides = model_profile.get("temperature_defaults", {})
                 if role in temp_overrides:
                     temperature = temp_overrides[role]
@@ -255,18 +498,17 @@ class AIStackConfig:
     def _calculate_max_tokens_for_model(self, capabilities: ModelCapabilities) -> int:
         """Calculate appropriate max tokens based on model capabilities"""
         context_tokens = capabilities.context_length
-        
-        if context_tokens >= 128000:
-            return min(8000, context_tokens // 16)
-        elif context_tokens >= 64000:
-            return min(6000, context_tokens // 10)
-        elif context_tokens >= 32000:
-            return min(4000, context_tokens // 8)
-        else:
-            return min(2000, context_tokens // 4)
+        cap, divisor = _MAX_TOKEN_LIMITS[bisect_right(_CONTEXT_THRESHOLDS, context_tokens)]
+        return min(cap, context_tokens // divisor)
     
     def get_system_config(self) -> SystemConfig:
         """Get system configuration"""
+        if self._system_config is None:
+            self._system_config = self._build_system_config()
+        return self._system_config
+    
+    def _build_system_config(self) -> SystemConfig:
+        """Build the system configuration from the merged config"""
         system_settings = self.merged_config.get("system_settings", {})
         return SystemConfig(
             enable_cloud_fallbacks=system_settings.get("enable_cloud_fallbacks", False),
@@ -274,23 +516,27 @@ class AIStackConfig:
             thermal_threshold=system_settings.get("thermal_threshold", 0.8),
             auto_discover_models=system_settings.get("auto_discover_models", True),
             validation_timeout_seconds=system_settings.get("validation_timeout_seconds", 30),
-            default_temperature=system_settings.get("default_temperature", {
-                ModelType.PLANNER: 0.2,
-                ModelType.CRITIC: 0.1,
-                ModelType.EXECUTOR: 0.3
-            })
+            # Missing temperatures are filled with fresh defaults by SystemConfig
+            default_temperature=system_settings.get("default_temperature"),
+            rag_index_type=system_settings.get("rag_index_type", "auto"),
+            rag_nprobe=system_settings.get("rag_nprobe", 8)
         )
     
     def refresh_models(self) -> None:
         """Refresh model discovery"""
-        self.model_registry.refresh()
-        self._load_configuration()  # Reload with new models
+        # An explicit refresh rereads config files even if their stat looks unchanged
+        _parse_json_file.cache_clear()
+        self._load_configuration()
+        # Rediscover now rather than on next use
+        self._sync_registry()
     
     def switch_profile(self, profile_name: str) -> bool:
         """Switch to a different profile"""
         if self.profile_manager.set_active_profile(profile_name):
             self.profile_name = profile_name
-            self._load_configuration()
+            # Base and user files are unaffected by the profile
+            self._profile_config = self._load_profile()
+            self._recompute_merged()
             return True
         return False
     
@@ -310,44 +556,38 @@ class AIStackConfig:
     
     def get_model_recommendations(self, role: str, max_count: int = 5) -> List[Dict[str, Any]]:
         """Get model recommendations for a role"""
-        role_mapper = RoleMapper(self.model_registry)
         system_constraints = SystemConstraints.from_memory_manager(
             self.memory_manager, 
             self.model_registry
         )
         
-        model_type = (ModelType.PLANNER if role == "planner" else 
-                     ModelType.CRITIC if role == "critic" else 
-                     ModelType.EXECUTOR)
+        model_type = _ROLE_TO_TYPE.get(role, ModelType.EXECUTOR)
         
-        recommendations = role_mapper.get_model_recommendations(
+        recommendations = self.role_mapper.get_model_recommendations(
             model_type, system_constraints, max_count
         )
         
         return [
             {
-                'model_name': selection.model_name,
-                'score': selection.validation.score,
-                'capabilities': selection.capabilities,
-                'source': selection.source,
-                'validation': selection.validation
+                'model_name': model_name,
+                'score': validation.score,
+                'capabilities': capabilities,
+                'source': source,
+                'validation': validation
             }
-            for selection in recommendations
+            for model_name, capabilities, source, validation in map(_SELECTION_FIELDS, recommendations)
         ]
     
     def validate_model_for_role(self, model_name: str, role: str) -> Dict[str, Any]:
         """Validate if a model is suitable for a role"""
-        role_mapper = RoleMapper(self.model_registry)
         system_constraints = SystemConstraints.from_memory_manager(
             self.memory_manager, 
             self.model_registry
         )
         
-        model_type = (ModelType.PLANNER if role == "planner" else 
-                     ModelType.CRITIC if role == "critic" else 
-                     ModelType.EXECUTOR)
+        model_type = _ROLE_TO_TYPE.get(role, ModelType.EXECUTOR)
         
-        validation = role_mapper.validate_model_for_role(
+        validation = self.role_mapper.validate_model_for_role(
             model_name, model_type, system_constraints
         )
         
@@ -374,19 +614,17 @@ class AIStackConfig:
     
     def get_all_models(self) -> Dict[str, Dict[str, Any]]:
         """Get information about all available models"""
-        models_info = {}
-        
-        for model_name, model_info in self.model_registry.models.items():
-            if model_info.capabilities:
-                models_info[model_name] = {
-                    'name': model_name,
-                    'source': model_info.source,
-                    'validated': model_info.validated,
-                    'capabilities': model_info.capabilities.to_dict(),
-                    'memory_gb': model_info.capabilities.recommended_memory_gb
-                }
-        
-        return models_info
+        return {
+            model_name: {
+                'name': model_name,
+                'source': model_info.source,
+                'validated': model_info.validated,
+                'capabilities': capabilities.to_dict(),
+                'memory_gb': capabilities.recommended_memory_gb
+            }
+            for model_name, model_info in self.model_registry.models.items()
+            if (capabilities := model_info.capabilities)
+        }
     
     def get_available_models(self) -> Dict[str, Dict[str, Any]]:
         """Get all available models with information"""
@@ -395,21 +633,27 @@ class AIStackConfig:
     def export_configuration(self, export_path: str, include_profiles: bool = True) -> bool:
         """Export current configuration to file"""
         try:
-            export_data = {
-                'base_config': self.merged_config,
-                'active_profile': self.profile_manager.get_active_profile_name()
-            }
-            
-            if include_profiles:
-                export_data['profiles'] = {}
-                for profile in self.profile_manager.list_profiles():
-                    profile_name = profile['name']
-                    profile_obj = self.profile_manager.load_profile(profile_name)
-                    if profile_obj:
-                        export_data['profiles'][profile_name] = profile_obj.to_dict()
-            
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            # Written a key at a time so only one profile is serialized in memory at once;
+            # the output matches dumping the whole export with indent=2
+            with _atomic_write(export_path) as f:
+                f.write(b'{\n  "base_config": ')
+                f.write(_indent_json(_json_dumps(self.merged_config), 1))
+                f.write(b',\n  "active_profile": ')
+                f.write(_json_dumps(self.profile_manager.get_active_profile_name()))
+                
+                if include_profiles:
+                    f.write(b',\n  "profiles": {')
+                    separator = b'\n    '
+                    for profile in self.profile_manager.list_profiles():
+                        profile_name = profile['name']
+                        profile_obj = self.profile_manager.load_profile(profile_name)
+                        if profile_obj:
+                            f.write(separator + _json_dumps(profile_name) + b': ')
+                            f.write(_indent_json(_json_dumps(profile_obj.to_dict()), 2))
+                            separator = b',\n    '
+                    f.write(b'}' if separator == b'\n    ' else b'\n  }')
+                
+                f.write(b'\n}')
             
             return True
             
@@ -420,15 +664,15 @@ class AIStackConfig:
     def import_configuration(self, import_path: str) -> bool:
         """Import configuration from file"""
         try:
-            with open(import_path, 'r', encoding='utf-8') as f:
-                import_data = json.load(f)
+            with open(import_path, 'rb') as f:
+                import_data = _json_loads(f.read())
             
             # Import base configuration
             if 'base_config' in import_data:
                 # Save to user_models.json
                 user_config_path = "config/user_models.json"
-                with open(user_config_path, 'w', encoding='utf-8') as f:
-                    json.dump(import_data['base_config'], f, indent=2)
+                with _atomic_write(user_config_path) as f:
+                    f.write(_json_dumps(import_data['base_config']))
             
             # Import profiles
             if 'profiles' in import_data:
@@ -1,10 +1,25 @@
 """
 Simplified Controller - Basic model calling without complex workflows
 """
+import os
+import re
+import copy
 import json
 import time
+import string
+import asyncio
+import threading
 import subprocess
-from typing import Dict, Any, Optional
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+from typing import Callable, Dict, Any, Iterator, List, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from functools import cached_property
 from pathlib import Path
 
 from src.enhanced_config import AIStackConfig, ModelType
@@ -24,9 +39,60 @@ from src.cascade.execution_planner import ExecutionPlanner
 from src.cascade.progress_monitor import ProgressMonitor
 from src.cascade.prompt_adjuster import PromptAdjuster
 
+OLLAMA_DEFAULT_PORT = 11434
+OLLAMA_KEEP_ALIVE = "30m"
+# Keep in step with the server's OLLAMA_NUM_PARALLEL so batched calls interleave
+BATCH_CONCURRENCY = 8
+# Concurrent RAG lookups are collected into batches of up to this size...
+RAG_BATCH_MAX = 32
+# ...waiting at most this long (seconds) for a batch to fill
+RAG_BATCH_WAIT = 0.01
+# Seconds a health check result is reused before Ollama and memory are probed again
+HEALTH_CACHE_TTL = 5.0
+
+# Terminal colour/erase sequences the `ollama run` CLI writes to stdout
+_ANSI_RE = re.compile(r'\x1B\[[0-9;]*[mK]')
+
+
+def _ollama_base_url() -> str:
+    """Base URL of the Ollama server, honouring OLLAMA_HOST like the ollama CLI"""
+    host = os.environ.get("OLLAMA_HOST", "").strip() or "localhost"
+    if "://" not in host:
+        host = f"http://{host}"
+    parts = urlsplit(host.rstrip("/"))
+    # A bare host uses Ollama's port; an https URL without one keeps the scheme default
+    netloc = parts.netloc
+    if parts.port is None and parts.scheme == "http":
+        netloc = f"{netloc}:{OLLAMA_DEFAULT_PORT}"
+    return f"{parts.scheme}://{netloc}{parts.path}"
+
+
+_FORMATTER = string.Formatter()
+
+
+def _compile_template(template: str) -> Callable[[Mapping[str, Any]], str]:
+    """Parse a str.format template once into a function of its field values"""
+    segments = []
+    for literal, field, spec, conversion in _FORMATTER.parse(template):
+        # Anything beyond plain named fields keeps the regular formatter
+        if spec or conversion or (field is not None and not field.isidentifier()):
+            return template.format_map
+        if literal:
+            segments.append((True, literal))
+        if field is not None:
+            segments.append((False, field))
+    
+    def render(values: Mapping[str, Any]) -> str:
+        return "".join([text if is_literal else str(values[text]) for is_literal, text in segments])
+    
+    return render
+
 
 class WorkflowResult:
     """Result of a workflow execution"""
+    __slots__ = ("success", "plan", "critique", "output", "error",
+                 "execution_time", "memory_used", "metadata")
+    
     def __init__(self):
         self.success = False
         self.plan = None
@@ -35,7 +101,8 @@ class WorkflowResult:
         self.error = None
         self.execution_time = 0.0
         self.memory_used = 0.0
-        self.metadata = {}
+        # Only successful requests carry metadata
+        self.metadata = None
 
 
 class SimplifiedAIStackController:
@@ -44,17 +111,28 @@ class SimplifiedAIStackController:
     def __init__(self, config_path: Optional[str] = None, profile_name: Optional[str] = None, project_path: Optional[str] = None):
         # Initialize enhanced configuration system
         self.config = AIStackConfig(config_path, profile_name)
+        self.ollama_base_url = _ollama_base_url()
         self.memory_manager = MemoryManager()
         self.prompt_templates = PromptTemplates()
         
+        # Resolve each intent's prompt config and pre-parse its template once
+        self._prompt_configs = {intent: self._get_prompt_config_for_intent(intent) for intent in IntentType}
+        self._template_fns = {
+            intent: _compile_template(prompt_config.user_template)
+            for intent, prompt_config in self._prompt_configs.items()
+        }
+        
         # Initialize RAG components
         self.project_path = project_path
-        self.rag_retriever = None
+        self._rag_retriever = None
+        self._semantic_cache = None
+        self._rag_lock = threading.Lock()
         self.intent_router = IntentRouter()
+        self._rag_queue = None
+        self._rag_batcher_task = None
         
-        # Initialize RAG if project path is provided
-        if self.project_path:
-            self._initialize_rag()
+        # Locate the RAG index now; the embedder and index load on first use
+        self._rag_index_path = self._locate_rag_index() if self.project_path else None
         
         # Initialize cascade components
         self.ambiguity_detector = AmbiguityDetector()
@@ -71,48 +149,100 @@ class SimplifiedAIStackController:
         self.current_execution_plan = None
         self.current_monitoring_session = None
         
+        # (monotonic time, result) of the last health check
+        self._health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        
         # Take initial memory snapshot
         self.initial_memory = self.memory_manager.take_memory_snapshot()
     
+    @property
+    def rag_retriever(self) -> Optional[ContextRetriever]:
+        """RAG retriever for the project, loaded on first access"""
+        if self._rag_index_path is not None:
+            self._initialize_rag()
+        return self._rag_retriever
+    
+    @rag_retriever.setter
+    def rag_retriever(self, retriever: Optional[ContextRetriever]):
+        self._rag_index_path = None
+        self._rag_retriever = retriever
+    
+    @property
+    def semantic_cache(self):
+        """Semantic response cache sharing the RAG embedder, loaded on first access"""
+        if self._rag_index_path is not None:
+            self._initialize_rag()
+        return self._semantic_cache
+    
+    @semantic_cache.setter
+    def semantic_cache(self, cache):
+        self._semantic_cache = cache
+    
+    def _locate_rag_index(self) -> Optional[str]:
+        """Find the project's RAG index, returning its path without extension"""
+        project_dir = Path(self.project_path)
+        if not project_dir.exists():
+            print(f"Warning: Project path {self.project_path} does not exist")
+            return None
+        
+        # Look for index file (try both .ai-stack and .ai-stack-index locations)
+        index_path = str(project_dir / ".ai-stack-index")
+        
+        # Fallback to .ai-stack directory
+        if not Path(f"{index_path}.index").exists():
+            index_path = str(project_dir / ".ai-stack" / "code_index")
+        
+        if not Path(f"{index_path}.index").exists():
+            print(f"Warning: No RAG index found at {index_path}.index")
+            print("Run 'python main.py --index <path>' to create an index")
+            return None
+        
+        return index_path
+    
     def _initialize_rag(self):
         """Initialize RAG retriever for the project."""
-        try:
-            from src.rag import CodeEmbedder, FAISSVectorStore
-            
-            project_dir = Path(self.project_path)
-            if not project_dir.exists():
-                print(f"Warning: Project path {self.project_path} does not exist")
+        with self._rag_lock:
+            index_path = self._rag_index_path
+            if index_path is None:
                 return
+            # Attempt the load only once, whether or not it succeeds
+            self._rag_index_path = None
             
-            # Look for index file (try both .ai-stack and .ai-stack-index locations)
-            index_path = str(project_dir / ".ai-stack-index")
-            
-            # Fallback to .ai-stack directory
-            if not Path(f"{index_path}.index").exists():
-                index_path = str(project_dir / ".ai-stack" / "code_index")
-            
-            if not Path(f"{index_path}.index").exists():
-                print(f"Warning: No RAG index found at {index_path}.index")
-                print("Run 'python main.py --index <path>' to create an index")
-                return
-            
-            # Initialize embedder
-            embedder = CodeEmbedder(model_name="BAAI/bge-small-en-v1.5")
-            
-            # Initialize vector store and load index
-            vector_store = FAISSVectorStore(index_type="Flat", dimension=embedder.get_embedding_dimension())
-            vector_store.load(index_path)
-            
-            # Initialize retriever
-            self.rag_retriever = ContextRetriever(embedder, vector_store)
-            print(f"RAG initialized for project: {self.project_path}")
-            
-        except Exception as e:
-            print(f"Warning: Failed to initialize RAG: {e}")
-            self.rag_retriever = None
+            try:
+                from src.rag import CodeEmbedder, FAISSVectorStore, SemanticCache
+                
+                # Initialize embedder
+                embedder = CodeEmbedder(model_name="BAAI/bge-small-en-v1.5")
+                
+                # Initialize vector store and map the index instead of reading it into memory
+                # The saved index carries its own type; only the IVF probe count comes from config
+                vector_store = FAISSVectorStore(
+                    index_type="Flat",
+                    dimension=embedder.get_embedding_dimension(),
+                    nprobe=self.config.get_system_config().rag_nprobe
+                )
+                vector_store.load(index_path, mmap=True)
+                
+                # Initialize retriever
+                self._rag_retriever = ContextRetriever(embedder, vector_store)
+                print(f"RAG initialized for project: {self.project_path}")
+                
+                # Reuse the embedder so repeated questions skip generation entirely
+                try:
+                    self._semantic_cache = SemanticCache(embedder)
+                except Exception as e:
+                    print(f"Warning: Failed to initialize semantic cache: {e}")
+                
+            except Exception as e:
+                print(f"Warning: Failed to initialize RAG: {e}")
+                self._rag_retriever = None
     
     def health_check(self) -> Dict[str, Any]:
-        """Perform system health check"""
+        """Perform system health check, reusing a result younger than HEALTH_CACHE_TTL"""
+        # Callers get their own copy so changes to a result never leak into the cache
+        if self._health_cache and time.monotonic() - self._health_cache[0] < HEALTH_CACHE_TTL:
+            return copy.deepcopy(self._health_cache[1])
+        
         health = {
             "timestamp": time.time(),
             "ollama_running": False,
@@ -124,20 +254,9 @@ class SimplifiedAIStackController:
         
         # Check Ollama
         try:
-            result = subprocess.run(
-                ["ollama", "list"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            health["ollama_running"] = result.returncode == 0
-            
-            if result.returncode == 0:
-                models = []
-                for line in result.stdout.strip().split('\n')[1:]:
-                    if line.strip():
-                        model_name = line.split()[0]
-                        models.append(model_name)
+            models = self._list_ollama_models()
+            health["ollama_running"] = models is not None
+            if models is not None:
                 health["models_available"] = models
         except Exception:
             health["ollama_running"] = False
@@ -158,7 +277,32 @@ class SimplifiedAIStackController:
         elif health["system_memory"]["current"]["system_memory"]["percent_used"] > 85:
             health["overall_status"] = "memory_pressure"
         
-        return health
+        self._health_cache = (time.monotonic(), health)
+        return copy.deepcopy(health)
+    
+    def _list_ollama_models(self) -> Optional[List[str]]:
+        """List installed Ollama models, or None if Ollama is not responding"""
+        if requests is not None:
+            response = self.http_session.get(f"{self.ollama_base_url}/api/tags", timeout=10)
+            if response.status_code != 200:
+                return None
+            return [model["name"] for model in response.json().get("models", [])]
+        
+        # Without requests, fall back to the CLI listing
+        result = subprocess.run(
+            ["ollama", "list"],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        if result.returncode != 0:
+            return None
+        
+        models = []
+        for line in result.stdout.strip().split('\n')[1:]:
+            if line.strip():
+                models.append(line.split()[0])
+        return models
     
     def call_model(self, model_config, prompt: str, role: str) -> str:
         """Call a model using basic system"""
@@ -171,14 +315,69 @@ class SimplifiedAIStackController:
         except Exception as e:
             raise RuntimeError(f"Error calling model {model_config.name}: {e}")
     
+    @cached_property
+    def http_session(self) -> "requests.Session":
+        """Keep-alive session for the Ollama HTTP API"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=BATCH_CONCURRENCY)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
     def _call_ollama_model(self, ollama_name: str, prompt: str) -> str:
         """Call Ollama model"""
-        # Use ollama run with flags to suppress interactive output
-        cmd = ["ollama", "run", ollama_name, "--nowordwrap"]
+        if requests is None:
+            return self._call_ollama_cli(ollama_name, prompt)
+        
+        # Reuse the pooled connection and keep the model resident between calls
+        response = self.http_session.post(
+            f"{self.ollama_base_url}/api/generate",
+            json=self._generate_payload(ollama_name, prompt, stream=False),
+            timeout=60
+        )
+        
+        if response.status_code != 200:
+            raise RuntimeError(f"Ollama call failed: {response.text}")
         
-        # Execute the command
+        return response.json()["response"].strip()
+    
+    def _call_ollama_model_stream(self, ollama_name: str, prompt: str) -> Iterator[str]:
+        """Call Ollama model and yield response text as it is generated"""
+        if requests is None:
+            yield self._call_ollama_cli(ollama_name, prompt)
+            return
+        
+        with self.http_session.post(
+            f"{self.ollama_base_url}/api/generate",
+            json=self._generate_payload(ollama_name, prompt, stream=True),
+            timeout=60,
+            stream=True
+        ) as response:
+            if response.status_code != 200:
+                raise RuntimeError(f"Ollama call failed: {response.text}")
+            
+            # Ollama streams one JSON object per line
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                yield chunk.get("response", "")
+                if chunk.get("done"):
+                    break
+    
+    def _generate_payload(self, ollama_name: str, prompt: str, stream: bool) -> Dict[str, Any]:
+        """Build the /api/generate request body"""
+        return {
+            "model": ollama_name,
+            "prompt": prompt,
+            "stream": stream,
+            "keep_alive": OLLAMA_KEEP_ALIVE
+        }
+    
+    def _call_ollama_cli(self, ollama_name: str, prompt: str) -> str:
+        """Call Ollama through the CLI when the HTTP client is unavailable"""
         result = subprocess.run(
-            cmd,
+            ["ollama", "run", ollama_name, "--nowordwrap"],
             input=prompt,
             capture_output=True,
             text=True,
@@ -188,10 +387,9 @@ class SimplifiedAIStackController:
         if result.returncode != 0:
             raise RuntimeError(f"Ollama call failed: {result.stderr}")
         
-        # Clean up terminal escape sequences from output
-        import re
-        clean_output = re.sub(r'\x1B\[[0-9;]*[mK]', '', result.stdout.strip())
-        return clean_output
+        # Only scan for escape sequences when the output contains any
+        output = result.stdout.strip()
+        return _ANSI_RE.sub('', output) if '\x1b' in output else output
     
     def _call_cloud_model(self, model_name: str, prompt: str, role: str) -> str:
         """Call cloud model (placeholder for now)"""
@@ -199,6 +397,124 @@ class SimplifiedAIStackController:
         print(f"Cloud model call not yet implemented for {model_name}")
         return f"Cloud model {model_name} would process: {prompt}"
     
+    def _retrieve_context(self, user_input: str, query_embedding=None) -> str:
+        """Retrieve RAG context for a single request"""
+        rag_context = ""
+        if self.rag_retriever:
+            try:
+                rag_context = self.rag_retriever.retrieve_and_format(
+                    user_input, query_embedding=query_embedding
+                )
+                if rag_context:
+                    print(f"Retrieved {len(rag_context)} characters of code context")
+            except Exception as e:
+                print(f"Warning: Failed to retrieve RAG context: {e}")
+        return rag_context
+    
+    async def _rag_submit(self, user_input: str) -> str:
+        """Queue a RAG lookup for the background batcher and wait for its context"""
+        # The first access loads the embedder and index; do that in a worker thread
+        if self._rag_index_path is not None:
+            await asyncio.to_thread(self._initialize_rag)
+        if not self.rag_retriever:
+            return ""
+        
+        loop = asyncio.get_running_loop()
+        task = self._rag_batcher_task
+        # Each process_batch call runs its own event loop, so start a batcher per loop
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._rag_queue = asyncio.Queue()
+            self._rag_batcher_task = loop.create_task(self._rag_batcher(self._rag_queue))
+        
+        future = loop.create_future()
+        await self._rag_queue.put((user_input, future))
+        try:
+            rag_context = await future
+        except Exception as e:
+            print(f"Warning: Failed to retrieve RAG context: {e}")
+            return ""
+        
+        if rag_context:
+            print(f"Retrieved {len(rag_context)} characters of code context")
+        return rag_context
+    
+    async def _rag_batcher(self, queue: asyncio.Queue) -> None:
+        """Collect queued RAG lookups and resolve them with one batched retrieval"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + RAG_BATCH_WAIT
+            while len(batch) < RAG_BATCH_MAX:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                contexts = await asyncio.to_thread(
+                    self.rag_retriever.retrieve_and_format_batch, [query for query, _ in batch]
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, future), rag_context in zip(batch, contexts):
+                if not future.done():
+                    future.set_result(rag_context)
+    
+    def _build_prompt(self, user_input: str, rag_context: Optional[str] = None,
+                      query_embedding=None,
+                      intent_info: Optional[Dict[str, Any]] = None) -> Tuple[str, Dict[str, Any], str, PromptConfig]:
+        """Classify intent and retrieve RAG context unless given, then render the prompt"""
+        # Classify user intent
+        if intent_info is None:
+            intent_info = self.intent_router.get_intent_info(user_input)
+        intent = IntentType(intent_info["intent"])
+        
+        # Retrieve RAG context if available
+        if rag_context is None:
+            rag_context = self._retrieve_context(user_input, query_embedding)
+        
+        # Get appropriate prompt template based on intent
+        prompt_config = self._prompt_configs[intent]
+        
+        # Build prompt with context (rag_context is empty without RAG)
+        prompt = self._template_fns[intent]({
+            "user_input": user_input,
+            "rag_context": rag_context,
+            "plan": "",
+            "additional_context": ""
+        })
+        return prompt, intent_info, rag_context, prompt_config
+    
+    def _finish_request(self, result: WorkflowResult, response: str, intent_info: Dict[str, Any],
+                        rag_context: str, prompt_config: PromptConfig) -> None:
+        """Record the model response and request metadata on the result"""
+        result.output = response
+        result.success = True
+        
+        # Add metadata about intent and RAG usage
+        result.metadata = {
+            "intent": intent_info["intent"],
+            "intent_confidence": intent_info["confidence"],
+            "rag_used": bool(rag_context),
+            "rag_context_length": len(rag_context) if rag_context else 0,
+            "template_used": prompt_config.name
+        }
+    
+    def _record_usage(self, result: WorkflowResult, start_time: float) -> None:
+        """Fill in execution time and memory used since startup"""
+        result.execution_time = time.time() - start_time
+        
+        # Calculate memory used
+        final_memory = self.memory_manager.take_memory_snapshot()
+        result.memory_used = final_memory.used_gb - self.initial_memory.used_gb
+    
     def process_request(self, user_input: str, context: str = "", 
                      additional_context: str = "") -> WorkflowResult:
         """Process a simple request with RAG context and intent-based routing"""
@@ -206,73 +522,166 @@ class SimplifiedAIStackController:
         start_time = time.time()
         
         try:
-            # Classify user intent
-            intent_info = self.intent_router.get_intent_info(user_input)
-            intent = IntentType(intent_info["intent"])
-            
-            # Retrieve RAG context if available
-            rag_context = ""
-            if self.rag_retriever:
-                try:
-                    rag_context = self.rag_retriever.retrieve_and_format(user_input)
-                    if rag_context:
-                        print(f"Retrieved {len(rag_context)} characters of code context")
-                except Exception as e:
-                    print(f"Warning: Failed to retrieve RAG context: {e}")
-            
-            # Get appropriate prompt template based on intent
-            prompt_config = self._get_prompt_config_for_intent(intent)
-            
-            # Build prompt with context
-            if rag_context:
-                # Use RAG-aware template
-                prompt = prompt_config.user_template.format(
-                    user_input=user_input,
-                    rag_context=rag_context,
-                    plan="",
-                    additional_context=""
-                )
-            else:
-                # Use standard template
-                prompt = prompt_config.user_template.format(
-                    user_input=user_input,
-                    rag_context="",
-                    plan="",
-                    additional_context=""
-                )
-            
             # Get model configuration for executor role
             model_config = self.config.get_model_for_role("executor")
             if not model_config:
                 result.error = "Failed to get executor model configuration"
                 return result
             
+            intent_info = self.intent_router.get_intent_info(user_input)
+            
+            # Return an earlier answer to a near-identical question if the same
+            # model, profile and template produced it
+            cache_key = self._semantic_cache_key(user_input)
+            cache_scope = self._semantic_cache_scope(model_config, intent_info)
+            if cache_key is not None:
+                cached = self._semantic_cache_lookup(cache_key, cache_scope)
+                if cached is not None:
+                    return self._cache_hit_result(cached, start_time)
+            
+            # The cache key is the query embedding, so retrieval does not embed it again
+            prompt, intent_info, rag_context, prompt_config = self._build_prompt(
+                user_input, query_embedding=cache_key, intent_info=intent_info
+            )
+            
             # Call the model with the constructed prompt
             response = self.call_model(model_config, prompt, "executor")
+            self._finish_request(result, response, intent_info, rag_context, prompt_config)
             
-            result.output = response
-            result.success = True
-            
-            # Add metadata about intent and RAG usage
-            result.metadata = {
-                "intent": intent.value,
-                "intent_confidence": intent_info["confidence"],
-                "rag_used": bool(rag_context),
-                "rag_context_length": len(rag_context) if rag_context else 0,
-                "template_used": prompt_config.name
-            }
+            if cache_key is not None:
+                self._semantic_cache_add(cache_key, result, cache_scope)
             
         except Exception as e:
             result.error = f"Request processing failed: {e}"
         
+        self._record_usage(result, start_time)
+        return result
+    
+    def _semantic_cache_scope(self, model_config, intent_info: Dict[str, Any]) -> Tuple:
+        """Identify what a cached answer depends on besides the question itself"""
+        return (
+            model_config.name,
+            getattr(model_config, "temperature", None),
+            self.config.profile_manager.get_active_profile_name(),
+            intent_info["intent"]
+        )
+    
+    def _semantic_cache_key(self, user_input: str):
+        """Embed the request for the semantic cache, or None when it is unavailable"""
+        if not self.semantic_cache:
+            return None
+        try:
+            return self.semantic_cache.embed(user_input)
+        except Exception as e:
+            print(f"Warning: Semantic cache lookup failed: {e}")
+            return None
+    
+    def _semantic_cache_lookup(self, cache_key, cache_scope: Tuple) -> Optional[WorkflowResult]:
+        """Find a cached answer, treating a cache failure as a miss"""
+        try:
+            return self.semantic_cache.lookup(cache_key, cache_scope)
+        except Exception as e:
+            print(f"Warning: Semantic cache lookup failed: {e}")
+            return None
+    
+    def _semantic_cache_add(self, cache_key, result: WorkflowResult, cache_scope: Tuple) -> None:
+        """Store a copy of a finished result; a cache failure leaves the result untouched"""
+        cached = copy.copy(result)
+        cached.metadata = dict(result.metadata)
+        try:
+            self.semantic_cache.add(cache_key, cached, cache_scope)
+        except Exception as e:
+            print(f"Warning: Semantic cache update failed: {e}")
+    
+    def _cache_hit_result(self, cached: WorkflowResult, start_time: float) -> WorkflowResult:
+        """Copy a cached result, marking it as a cache hit"""
+        result = copy.copy(cached)
+        result.metadata = {**cached.metadata, "cache_hit": True}
         result.execution_time = time.time() - start_time
+        result.memory_used = 0.0
+        return result
+    
+    def process_request_stream(self, user_input: str, context: str = "",
+                               additional_context: str = "") -> Iterator[str]:
+        """Process a request like process_request, yielding the response as it is generated"""
+        prompt, intent_info, rag_context, prompt_config = self._build_prompt(user_input)
         
-        # Calculate memory used
-        final_memory = self.memory_manager.take_memory_snapshot()
-        result.memory_used = final_memory.used_gb - self.initial_memory.used_gb
+        model_config = self.config.get_model_for_role("executor")
+        if not model_config:
+            raise RuntimeError("Failed to get executor model configuration")
+        
+        if getattr(model_config, 'ollama_name', None):
+            try:
+                yield from self._call_ollama_model_stream(model_config.ollama_name, prompt)
+            except Exception as e:
+                raise RuntimeError(f"Error calling model {model_config.name}: {e}")
+        else:
+            # Cloud models have no streaming path yet; yield the whole response
+            yield self.call_model(model_config, prompt, "executor")
+    
+    async def aprocess_request(self, user_input: str, context: str = "",
+                               additional_context: str = "",
+                               limit: Optional[asyncio.Semaphore] = None,
+                               model_config=None) -> WorkflowResult:
+        """Async variant of process_request; the blocking steps run in worker threads"""
+        result = WorkflowResult()
+        start_time = time.time()
         
+        try:
+            # Model selection may run registry discovery, so keep it off the event loop
+            if model_config is None:
+                model_config = await asyncio.to_thread(self.config.get_model_for_role, "executor")
+            if not model_config:
+                result.error = "Failed to get executor model configuration"
+                return result
+            
+            rag_context = await self._rag_submit(user_input)
+            prompt, intent_info, rag_context, prompt_config = self._build_prompt(user_input, rag_context)
+            
+            if limit is None:
+                response = await asyncio.to_thread(self.call_model, model_config, prompt, "executor")
+            else:
+                async with limit:
+                    response = await asyncio.to_thread(self.call_model, model_config, prompt, "executor")
+            self._finish_request(result, response, intent_info, rag_context, prompt_config)
+            
+        except Exception as e:
+            result.error = f"Request processing failed: {e}"
+        
+        self._record_usage(result, start_time)
         return result
     
+    def process_batch(self, inputs: List[str],
+                      concurrency: int = BATCH_CONCURRENCY) -> List[WorkflowResult]:
+        """Process several requests concurrently, returning results in input order"""
+        async def run_all() -> List[WorkflowResult]:
+            # The default executor is sized by CPU count; these threads mostly wait on I/O
+            asyncio.get_running_loop().set_default_executor(
+                ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="batch-request")
+            )
+            limit = asyncio.Semaphore(concurrency)
+            
+            # Resolve the executor once for the whole batch, in a worker thread
+            try:
+                model_config = await asyncio.to_thread(self.config.get_model_for_role, "executor")
+            except Exception as e:
+                model_config = None
+                error = f"Request processing failed: {e}"
+            else:
+                error = "Failed to get executor model configuration"
+            if not model_config:
+                results = [WorkflowResult() for _ in inputs]
+                for result in results:
+                    result.error = error
+                return results
+            
+            return await asyncio.gather(
+                *(self.aprocess_request(user_input, limit=limit, model_config=model_config)
+                  for user_input in inputs)
+            )
+        
+        return asyncio.run(run_all())
+    
     def process_request_with_cascade(self, user_input: str, context: str = "",
                                     additional_context: str = "",
                                     enable_cascade: bool = True) -> WorkflowResult:
@@ -415,7 +824,7 @@ class SimplifiedAIStackController:
                 
                 # Add cascade metadata to result
                 result.metadata = {
-                    **standard_result.metadata,
+                    **(standard_result.metadata or {}),
                     "cascade_enabled": True,
                     "ambiguities_detected": len(ambiguities) if enable_cascade else 0,
                     "constraints_extracted": len(constraints) if enable_cascade else 0,
@@ -428,7 +837,7 @@ class SimplifiedAIStackController:
                 }
             else:
                 result.metadata = {
-                    **standard_result.metadata,
+                    **(standard_result.metadata or {}),
                     "cascade_enabled": False
                 }
             
@@ -567,7 +976,7 @@ class SimplifiedAIStackController:
         """Get comprehensive system status"""
         return {
             "health": self.health_check(),
-            "config": self.config.get_system_config().__dict__,
+            "config": asdict(self.config.get_system_config()),
             "models": self.config.get_all_models(),
             "profiles": self.config.get_available_profiles()
         }
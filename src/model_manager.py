@@ -2,6 +2,7 @@
 Model Manager - Handles loading, unloading, and monitoring Ollama models
 """
 import subprocess
+import threading
 import time
 try:
     import psutil
@@ -58,11 +59,12 @@ class ModelManager:
                         models.append(model_name)
                 return models
             return []
-        except subprocess.TimeoutExpired:
+        except (subprocess.TimeoutExpired, FileNotFoundError):
             return []
     
-    def load_model(self, model_name: str, timeout: int = 60) -> ModelState:
-        """Load a model with VRAM management"""
+    def load_model(self, model_name: str, timeout: int = 60,
+                   cancel: Optional[threading.Event] = None) -> ModelState:
+        """Load a model with VRAM management, giving up early once cancel is set"""
         if model_name in self.loaded_models:
             return ModelState.LOADED
         
@@ -83,6 +85,8 @@ class ModelManager:
             # Wait for model to be ready (first prompt appears)
             ready = False
             while not ready and (time.time() - start_time) < timeout:
+                if cancel is not None and cancel.is_set():
+                    break
                 if process.poll() is not None:
                     raise RuntimeError(f"Model loading failed: {process.stderr.read()}")
                 time.sleep(1)
@@ -124,6 +128,10 @@ class ModelManager:
             print(f"Error unloading model {model_name}: {e}")
             return False
     
+    def any_loaded(self) -> bool:
+        """Check if this manager has loaded any model that is still up"""
+        return bool(self.loaded_models)
+    
     def unload_all_models(self) -> None:
         """Unload all models to free maximum VRAM"""
         current_models = self.get_loaded_models()
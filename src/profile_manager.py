@@ -3,6 +3,7 @@ Profile Manager - User configuration profile management system
 """
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
@@ -10,6 +11,17 @@ from datetime import datetime
 
 # No ModelType import needed in profile_manager
 
+# Shared by every ProfileManager; created the first time several files are read
+_read_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _get_read_pool() -> ThreadPoolExecutor:
+    """Get the thread pool used to overlap profile file reads"""
+    global _read_pool
+    if _read_pool is None:
+        _read_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="profile-read")
+    return _read_pool
+
 
 @dataclass
 class UserProfile:
@@ -42,6 +54,15 @@ class UserProfile:
         data['modified_at'] = self.modified_at.isoformat()
         return data
     
+    def as_overlay(self) -> Dict[str, Any]:
+        """Get the config sections this profile overrides, for merging over the base config"""
+        return {
+            'role_mappings': self.role_mappings,
+            'system_settings': self.system_settings,
+            'selection_preferences': self.selection_preferences,
+            'cloud_settings': self.cloud_settings
+        }
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'UserProfile':
         """Create from dictionary"""
@@ -73,10 +94,18 @@ class ProfileManager:
         """Load all profiles from disk"""
         self._profiles_cache.clear()
         
-        for profile_file in self.profiles_dir.glob("*.json"):
+        profile_files = list(self.profiles_dir.glob("*.json"))
+        
+        # Overlap the file reads when there are several; parsing stays on this thread
+        if len(profile_files) > 1:
+            pool = _get_read_pool()
+            reads = [pool.submit(profile_file.read_bytes).result for profile_file in profile_files]
+        else:
+            reads = [profile_file.read_bytes for profile_file in profile_files]
+        
+        for profile_file, read in zip(profile_files, reads):
             try:
-                with open(profile_file, 'r', encoding='utf-8') as f:
-                    profile_data = json.load(f)
+                profile_data = json.loads(read())
                 
                 profile = UserProfile.from_dict(profile_data)
                 self._profiles_cache[profile.name] = profile
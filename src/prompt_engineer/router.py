@@ -63,6 +63,61 @@ class IntentRouter:
         self.debug_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.debug_keywords]
         self.generate_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.generate_keywords]
         self.explain_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.explain_keywords]
+        
+        keywords_by_intent = {
+            IntentType.DEBUG: self.debug_keywords,
+            IntentType.GENERATE: self.generate_keywords,
+            IntentType.EXPLAIN: self.explain_keywords,
+        }
+        self._patterns = {
+            IntentType.DEBUG: self.debug_patterns,
+            IntentType.GENERATE: self.generate_patterns,
+            IntentType.EXPLAIN: self.explain_patterns,
+        }
+        # One alternation per intent finds inputs that match none of its patterns in a single scan
+        self._any_pattern = {
+            intent: re.compile('|'.join(f'(?:{pattern})' for pattern in keywords), re.IGNORECASE)
+            for intent, keywords in keywords_by_intent.items()
+        }
+        # (compiled pattern, keywords named in its group) for reporting matched keywords
+        self._keyword_groups = {
+            intent: [
+                (compiled, self._pattern_keywords(pattern))
+                for pattern, compiled in zip(keywords, self._patterns[intent])
+            ]
+            for intent, keywords in keywords_by_intent.items()
+        }
+    
+    @staticmethod
+    def _pattern_keywords(pattern: str) -> list:
+        """Extract the alternatives listed in a pattern's first group."""
+        keyword_match = re.search(r'\(([^)]+)\)', pattern)
+        return keyword_match.group(1).split('|') if keyword_match else []
+    
+    def _score(self, user_input: str, intent: IntentType) -> int:
+        """Count how many of an intent's patterns match the input."""
+        if not self._any_pattern[intent].search(user_input):
+            return 0
+        return sum(1 for pattern in self._patterns[intent] if pattern.search(user_input))
+    
+    def _classify_scored(self, user_input: str):
+        """Classify the input, also returning the winning intent's match count."""
+        if not user_input:
+            return IntentType.GENERAL, 0
+        
+        # Count matches for each intent type
+        scores = {intent: self._score(user_input, intent) for intent in self._patterns}
+        
+        # Find the intent with the highest score
+        max_score = max(scores.values())
+        
+        if max_score == 0:
+            return IntentType.GENERAL, 0
+        
+        # If there's a tie, prefer DEBUG > GENERATE > EXPLAIN (dict order)
+        for intent, score in scores.items():
+            if score == max_score:
+                return intent, score
     
     def classify(self, user_input: str) -> IntentType:
         """
@@ -74,40 +129,7 @@ class IntentRouter:
         Returns:
             IntentType enum value
         """
-        if not user_input:
-            return IntentType.GENERAL
-        
-        # Count matches for each intent type
-        debug_score = sum(1 for pattern in self.debug_patterns if pattern.search(user_input))
-        generate_score = sum(1 for pattern in self.generate_patterns if pattern.search(user_input))
-        explain_score = sum(1 for pattern in self.explain_patterns if pattern.search(user_input))
-        
-        # Determine intent based on highest score
-        scores = {
-            IntentType.DEBUG: debug_score,
-            IntentType.GENERATE: generate_score,
-            IntentType.EXPLAIN: explain_score,
-            IntentType.GENERAL: 0
-        }
-        
-        # Find the intent with the highest score
-        max_score = max(scores.values())
-        
-        if max_score == 0:
-            return IntentType.GENERAL
-        
-        # Get all intents with the max score
-        top_intents = [intent for intent, score in scores.items() if score == max_score]
-        
-        # If there's a tie, prefer DEBUG > GENERATE > EXPLAIN > GENERAL
-        if IntentType.DEBUG in top_intents:
-            return IntentType.DEBUG
-        elif IntentType.GENERATE in top_intents:
-            return IntentType.GENERATE
-        elif IntentType.EXPLAIN in top_intents:
-            return IntentType.EXPLAIN
-        else:
-            return IntentType.GENERAL
+        return self._classify_scored(user_input)[0]
     
     def get_intent_info(self, user_input: str) -> Dict[str, Any]:
         """
@@ -119,11 +141,11 @@ class IntentRouter:
         Returns:
             Dictionary with intent information
         """
-        intent = self.classify(user_input)
+        intent, matches = self._classify_scored(user_input)
         
         return {
             "intent": intent.value,
-            "confidence": self._calculate_confidence(user_input, intent),
+            "confidence": self._confidence_from_matches(intent, matches),
             "matched_keywords": self._get_matched_keywords(user_input, intent),
             "suggested_template": self._get_suggested_template(intent)
         }
@@ -139,27 +161,19 @@ class IntentRouter:
         Returns:
             Confidence score between 0.0 and 1.0
         """
-        if intent == IntentType.GENERAL:
+        if intent not in self._patterns:
             return 0.5
         
-        # Get the appropriate patterns
-        if intent == IntentType.DEBUG:
-            patterns = self.debug_patterns
-        elif intent == IntentType.GENERATE:
-            patterns = self.generate_patterns
-        elif intent == IntentType.EXPLAIN:
-            patterns = self.explain_patterns
-        else:
+        return self._confidence_from_matches(intent, self._score(user_input, intent))
+    
+    def _confidence_from_matches(self, intent: IntentType, matches: int) -> float:
+        """Map an intent's pattern match count to a confidence score."""
+        if intent not in self._patterns:
             return 0.5
         
-        # Count matches
-        matches = sum(1 for pattern in patterns if pattern.search(user_input))
-        
         # Calculate confidence based on number of matches
         # More matches = higher confidence
-        confidence = min(0.5 + (matches * 0.15), 1.0)
-        
-        return confidence
+        return min(0.5 + (matches * 0.15), 1.0)
     
     def _get_matched_keywords(self, user_input: str, intent: IntentType) -> list:
         """
@@ -172,30 +186,17 @@ class IntentRouter:
         Returns:
             List of matched keywords
         """
-        if intent == IntentType.GENERAL:
-            return []
-        
-        # Get the appropriate patterns
-        if intent == IntentType.DEBUG:
-            patterns = self.debug_keywords
-        elif intent == IntentType.GENERATE:
-            patterns = self.generate_keywords
-        elif intent == IntentType.EXPLAIN:
-            patterns = self.explain_keywords
-        else:
+        if intent not in self._keyword_groups:
             return []
         
         # Find matched keywords
+        lowered = user_input.lower()
         matched = []
-        for pattern in patterns:
-            if re.search(pattern, user_input, re.IGNORECASE):
-                # Extract the keyword from the pattern
-                keyword_match = re.search(r'\(([^)]+)\)', pattern)
-                if keyword_match:
-                    keywords = keyword_match.group(1).split('|')
-                    for keyword in keywords:
-                        if keyword.lower() in user_input.lower():
-                            matched.append(keyword)
+        for pattern, keywords in self._keyword_groups[intent]:
+            if pattern.search(user_input):
+                for keyword in keywords:
+                    if keyword.lower() in lowered:
+                        matched.append(keyword)
         
         return matched
     
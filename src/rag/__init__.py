@@ -6,16 +6,20 @@ This module provides codebase context awareness through:
 - Embedding: Creating vector representations
 - Vector Store: Managing FAISS database connections
 - Retrieval: Searching and formatting context for prompts
+- Semantic Cache: Reusing responses for near-duplicate queries
 """
 
 from .indexer import CodeIndexer
 from .embedder import CodeEmbedder
-from .vector_store import FAISSVectorStore
+from .vector_store import FAISSVectorStore, index_type_for_size
 from .retriever import ContextRetriever
+from .semantic_cache import SemanticCache
 
 __all__ = [
     "CodeIndexer",
     "CodeEmbedder",
     "FAISSVectorStore",
+    "index_type_for_size",
     "ContextRetriever",
+    "SemanticCache",
 ]
\ No newline at end of file
@@ -27,20 +27,23 @@ class ContextRetriever:
         self.vector_store = vector_store
         self.max_context_length = max_context_length
     
-    def retrieve(self, query: str, k: int = 5) -> List[Dict[str, Any]]:
+    def retrieve(self, query: str, k: int = 5,
+                 query_embedding: Optional[np.ndarray] = None) -> List[Dict[str, Any]]:
         """
         Retrieve relevant code chunks for a query.
         
         Args:
             query: Query string
             k: Number of results to retrieve
+            query_embedding: Embedding of query if the caller already has one
             
         Returns:
             List of relevant code chunks with metadata
         """
         try:
             # Generate query embedding
-            query_embedding = self.embedder.embed_text(query)
+            if query_embedding is None:
+                query_embedding = self.embedder.embed_text(query)
             
             # Search vector store
             distances, results = self.vector_store.search(query_embedding, k)
@@ -51,6 +54,33 @@ class ContextRetriever:
             logger.error(f"Error retrieving context: {e}")
             return []
     
+    def retrieve_batch(self, queries: List[str], k: int = 5) -> List[List[Dict[str, Any]]]:
+        """
+        Retrieve relevant code chunks for several queries at once.
+        
+        The queries are embedded together and searched with one index call,
+        which is much cheaper than calling retrieve() for each of them.
+        
+        Args:
+            queries: Query strings
+            k: Number of results to retrieve per query
+            
+        Returns:
+            List of result lists, in the same order as queries
+        """
+        if not queries:
+            return []
+        
+        try:
+            query_embeddings = self.embedder.embed_texts(queries)
+            batch = self.vector_store.search_batch(query_embeddings, k)
+            
+            logger.info(f"Retrieved results for a batch of {len(queries)} queries")
+            return [results for _, results in batch]
+        except Exception as e:
+            logger.error(f"Error retrieving context: {e}")
+            return [[] for _ in queries]
+    
     def format_context(self, results: List[Dict[str, Any]]) -> str:
         """
         Format retrieved results into a context string for prompts.
@@ -101,16 +131,31 @@ File: {file_path} (lines {start_line}-{end_line})
         
         return context
     
-    def retrieve_and_format(self, query: str, k: int = 5) -> str:
+    def retrieve_and_format(self, query: str, k: int = 5,
+                            query_embedding: Optional[np.ndarray] = None) -> str:
         """
         Retrieve and format context in one step.
         
         Args:
             query: Query string
             k: Number of results to retrieve
+            query_embedding: Embedding of query if the caller already has one
             
         Returns:
             Formatted context string
         """
-        results = self.retrieve(query, k)
-        return self.format_context(results)
\ No newline at end of file
+        results = self.retrieve(query, k, query_embedding)
+        return self.format_context(results)
+    
+    def retrieve_and_format_batch(self, queries: List[str], k: int = 5) -> List[str]:
+        """
+        Retrieve and format context for several queries in one step.
+        
+        Args:
+            queries: Query strings
+            k: Number of results to retrieve per query
+            
+        Returns:
+            Formatted context strings, in the same order as queries
+        """
+        return [self.format_context(results) for results in self.retrieve_batch(queries, k)]
\ No newline at end of file
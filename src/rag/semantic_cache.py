@@ -0,0 +1,137 @@
+"""
+Semantic Cache for RAG functionality.
+
+Returns earlier responses for queries whose embeddings are near-duplicates,
+skipping retrieval and generation for repeated questions.
+"""
+
+import time
+import logging
+import threading
+from typing import Any, Dict, Hashable, Optional, Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Nearest neighbours inspected per lookup, so stale or other-scope entries do not hide a hit
+LOOKUP_CANDIDATES = 8
+
+
+class SemanticCache:
+    """Cache responses keyed by query embedding similarity."""
+    
+    def __init__(self, embedder, threshold: float = 0.95, max_entries: int = 10000,
+                 ttl_seconds: float = 3600):
+        """
+        Initialize the semantic cache.
+        
+        Args:
+            embedder: CodeEmbedder instance (shared with the retriever)
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum number of cached entries (oldest are evicted first)
+            ttl_seconds: Age after which an entry is treated as stale
+        """
+        self.embedder = embedder
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.index = None
+        # id -> (stored at, scope, payload); insertion-ordered, so the first key is the oldest
+        self._payloads: Dict[int, Tuple[float, Hashable, Any]] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self._initialize_index()
+    
+    def _initialize_index(self):
+        """Initialize the FAISS inner-product index."""
+        try:
+            import faiss
+            # Embeddings are normalized, so inner product is cosine similarity
+            dimension = self.embedder.get_embedding_dimension()
+            self.index = faiss.IndexIDMap2(faiss.IndexFlatIP(dimension))
+        except ImportError:
+            logger.error("faiss not installed. Install with: pip install faiss-cpu")
+            raise
+        except Exception as e:
+            logger.error(f"Error initializing semantic cache index: {e}")
+            raise
+    
+    def embed(self, query: str) -> np.ndarray:
+        """
+        Embed a query for lookup and insertion.
+        
+        Args:
+            query: Query string
+        
+        Returns:
+            float32 array with shape (1, embedding_dim)
+        """
+        # Embeddings are already float32, so this is a view rather than a copy
+        return np.ascontiguousarray(self.embedder.embed_text(query), dtype=np.float32).reshape(1, -1)
+    
+    def lookup(self, query_embedding: np.ndarray, scope: Hashable = None) -> Optional[Any]:
+        """
+        Find the cached payload for a near-duplicate query.
+        
+        Args:
+            query_embedding: Embedding returned by embed()
+            scope: Only entries added with an equal scope can match
+        
+        Returns:
+            The freshest-matching cached payload, or None on a miss
+        """
+        with self._lock:
+            if self.index.ntotal == 0:
+                return None
+            
+            scores, ids = self.index.search(query_embedding, min(LOOKUP_CANDIDATES, self.index.ntotal))
+            now = time.time()
+            stale = []
+            found = None
+            # Hits come back best first; stop at the first fresh one in scope
+            for score, entry_id in zip(scores[0], ids[0]):
+                entry_id = int(entry_id)
+                if entry_id < 0 or score < self.threshold:
+                    break
+                stored_at, entry_scope, payload = self._payloads[entry_id]
+                if now - stored_at > self.ttl_seconds:
+                    stale.append(entry_id)
+                elif entry_scope == scope:
+                    found = payload
+                    break
+            
+            for entry_id in stale:
+                self._evict(entry_id)
+            return found
+    
+    def add(self, query_embedding: np.ndarray, payload: Any, scope: Hashable = None):
+        """
+        Cache a payload under a query embedding.
+        
+        Args:
+            query_embedding: Embedding returned by embed()
+            payload: Value to return for similar queries
+            scope: Context the payload is only valid in, e.g. the model that produced it
+        """
+        with self._lock:
+            entry_id = self._next_id
+            self._next_id += 1
+            self.index.add_with_ids(query_embedding, np.array([entry_id], dtype='int64'))
+            self._payloads[entry_id] = (time.time(), scope, payload)
+            
+            while len(self._payloads) > self.max_entries:
+                self._evict(next(iter(self._payloads)))
+    
+    def _evict(self, entry_id: int):
+        """Remove one entry from the index and payload table."""
+        self.index.remove_ids(np.array([entry_id], dtype='int64'))
+        del self._payloads[entry_id]
+    
+    def get_size(self) -> int:
+        """
+        Get the number of cached entries.
+        
+        Returns:
+            Number of entries in the cache
+        """
+        return len(self._payloads)
@@ -12,20 +12,50 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Corpora smaller than this are searched exactly; a Flat scan is fast enough there
+ANN_MIN_VECTORS = 50000
+# FAISS factory prefixes built through index_factory rather than IndexFlatL2
+_FACTORY_PREFIXES = ("IVF", "HNSW")
+
+
+def index_type_for_size(num_vectors: int, dimension: int) -> str:
+    """
+    Pick an index type for a corpus of the given size.
+    
+    Args:
+        num_vectors: Number of embeddings that will be indexed
+        dimension: Dimension of the embedding vectors
+        
+    Returns:
+        "Flat" for small corpora, otherwise an IVF-PQ factory string
+    """
+    if num_vectors < ANN_MIN_VECTORS:
+        return "Flat"
+    
+    # About 4*sqrt(N) coarse lists (capped at 4096) keeps each list a few hundred vectors long
+    nlist = 1 << min(12, max(8, int(4 * num_vectors ** 0.5).bit_length() - 1))
+    # PQ needs a sub-quantizer count that divides the dimension; 8-bit codes each
+    m = next((m for m in (64, 48, 32, 16, 8) if dimension % m == 0), None)
+    if m is None:
+        return f"IVF{nlist},Flat"
+    return f"IVF{nlist},PQ{m}"
+
 
 class FAISSVectorStore:
     """Manage FAISS vector database for code embeddings."""
     
-    def __init__(self, index_type: str = "Flat", dimension: int = 384):
+    def __init__(self, index_type: str = "Flat", dimension: int = 384, nprobe: int = 8):
         """
         Initialize the FAISS vector store.
         
         Args:
-            index_type: Type of FAISS index (Flat, IVF, etc.)
+            index_type: "Flat", or a FAISS factory string such as "IVF4096,PQ64" or "HNSW32"
             dimension: Dimension of the embedding vectors
+            nprobe: Number of coarse lists an IVF index scans per query
         """
         self.index_type = index_type
         self.dimension = dimension
+        self.nprobe = nprobe
         self.index = None
         self.metadata = []
         self._initialize_index()
@@ -38,6 +68,9 @@ class FAISSVectorStore:
             
             if self.index_type == "Flat":
                 self.index = faiss.IndexFlatL2(self.dimension)
+            elif self.index_type.startswith(_FACTORY_PREFIXES):
+                self.index = faiss.index_factory(self.dimension, self.index_type)
+                self._apply_search_params()
             else:
                 logger.warning(f"Index type {self.index_type} not fully implemented, using Flat")
                 self.index = faiss.IndexFlatL2(self.dimension)
@@ -50,6 +83,55 @@ class FAISSVectorStore:
             logger.error(f"Error initializing FAISS index: {e}")
             raise
     
+    def _apply_search_params(self):
+        """Set nprobe on IVF indexes; other index types are left unchanged."""
+        import faiss
+        
+        try:
+            faiss.extract_index_ivf(self.index).nprobe = self.nprobe
+        except RuntimeError:
+            pass
+    
+    def min_training_size(self) -> int:
+        """
+        Get the number of vectors needed to train the index.
+        
+        Returns:
+            0 for indexes that need no training, else FAISS's recommended minimum
+        """
+        if self.index.is_trained:
+            return 0
+        
+        import faiss
+        
+        try:
+            nlist = faiss.extract_index_ivf(self.index).nlist
+        except RuntimeError:
+            # Non-IVF trainable indexes (e.g. HNSW over PQ) only need the PQ codebook
+            return 256
+        # k-means wants ~39 points per centroid; 8-bit PQ codebooks need at least 256
+        return max(nlist * 39, 256)
+    
+    def train(self, embeddings: np.ndarray):
+        """
+        Train the index on a representative set of embeddings.
+        
+        Args:
+            embeddings: numpy array of embeddings with shape (n, dimension), ideally the whole corpus
+        """
+        if self.index is None:
+            raise RuntimeError("Index not initialized")
+        
+        required = self.min_training_size()
+        if len(embeddings) < required:
+            raise ValueError(
+                f"{self.index_type} index needs at least {required} embeddings to train, "
+                f"got {len(embeddings)}; use a smaller nlist or a Flat index"
+            )
+        
+        logger.info(f"Training {self.index_type} index on {len(embeddings)} embeddings")
+        self.index.train(np.ascontiguousarray(embeddings, dtype=np.float32))
+    
     def add_embeddings(self, embeddings: np.ndarray, metadata: List[Dict[str, Any]]):
         """
         Add embeddings to the index.
@@ -64,6 +146,11 @@ class FAISSVectorStore:
         if len(embeddings) != len(metadata):
             raise ValueError("Number of embeddings must match number of metadata entries")
         
+        # IVF and PQ indexes learn their centroids and codebooks before the first add;
+        # train() explicitly on the full corpus first when adding in several batches
+        if not self.index.is_trained:
+            self.train(embeddings)
+        
         try:
             self.index.add(embeddings.astype('float32'))
             self.metadata.extend(metadata)
@@ -83,31 +170,48 @@ class FAISSVectorStore:
         Returns:
             Tuple of (distances, metadata_list)
         """
+        # Reshape query if needed
+        if query_embedding.ndim == 1:
+            query_embedding = query_embedding.reshape(1, -1)
+        
+        return self.search_batch(query_embedding, k)[0]
+    
+    def search_batch(self, query_embeddings: np.ndarray, k: int = 5) -> List[Tuple[np.ndarray, List[Dict[str, Any]]]]:
+        """
+        Search for several query embeddings with a single index lookup.
+        
+        Args:
+            query_embeddings: numpy array of query embeddings with shape (n, dimension)
+            k: Number of results to return per query
+            
+        Returns:
+            List of (distances, metadata_list) tuples, one per query
+        """
         if self.index is None:
             raise RuntimeError("Index not initialized")
         
         if self.index.ntotal == 0:
             logger.warning("Index is empty, no results to return")
-            return np.array([]), []
+            return [(np.array([]), []) for _ in range(len(query_embeddings))]
         
         try:
-            # Reshape query if needed
-            if query_embedding.ndim == 1:
-                query_embedding = query_embedding.reshape(1, -1)
-            
             # Search
-            distances, indices = self.index.search(query_embedding.astype('float32'), k)
+            distances, indices = self.index.search(np.ascontiguousarray(query_embeddings, dtype=np.float32), k)
             
             # Get metadata for results
-            results = []
-            for i, idx in enumerate(indices[0]):
-                if idx < len(self.metadata):
-                    results.append({
-                        **self.metadata[idx],
-                        'distance': float(distances[0][i])
-                    })
+            batch = []
+            for row_distances, row_indices in zip(distances, indices):
+                results = []
+                for i, idx in enumerate(row_indices):
+                    # IVF indexes pad missing results with -1
+                    if 0 <= idx < len(self.metadata):
+                        results.append({
+                            **self.metadata[idx],
+                            'distance': float(row_distances[i])
+                        })
+                batch.append((row_distances, results))
             
-            return distances[0], results
+            return batch
         except Exception as e:
             logger.error(f"Error searching index: {e}")
             raise
@@ -141,12 +245,13 @@ class FAISSVectorStore:
             logger.error(f"Error saving index: {e}")
             raise
     
-    def load(self, file_path: str):
+    def load(self, file_path: str, mmap: bool = False):
         """
         Load the index from disk.
         
         Args:
             file_path: Path to load the index from (without extension)
+            mmap: Memory-map the index read-only so the OS page cache holds the vectors
         """
         try:
             import faiss
@@ -157,7 +262,15 @@ class FAISSVectorStore:
             if not os.path.exists(index_path):
                 raise FileNotFoundError(f"Index file not found: {index_path}")
             
-            self.index = faiss.read_index(index_path)
+            if mmap:
+                try:
+                    self.index = faiss.read_index(index_path, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+                except RuntimeError as e:
+                    # Not every index type can be mapped; fall back to reading it into memory
+                    logger.warning(f"Could not memory-map index, loading it instead: {e}")
+                    self.index = faiss.read_index(index_path)
+            else:
+                self.index = faiss.read_index(index_path)
             
             # Load metadata
             metadata_path = f"{file_path}.metadata"
@@ -169,6 +282,7 @@ class FAISSVectorStore:
             
             # Update dimension
             self.dimension = self.index.d
+            self._apply_search_params()
             
             logger.info(f"Index loaded from {index_path}")
             logger.info(f"Metadata loaded from {metadata_path}")
@@ -182,6 +182,36 @@ def test_path_generator():
     logger.info("✓ Path generator working correctly")
 
 
+def test_path_generator_prunes_dominated():
+    """Test that dominated paths are dropped from the candidate set."""
+    from cascade.path_generator import PathGenerator, PathType
+
+    generator = PathGenerator()
+    paths = generator.generate_paths("Write a Python script", [])
+
+    # Built-in path types trade quality for speed, so none dominate each other
+    assert {p.path_type for p in paths} == {
+        PathType.ALTERNATIVE, PathType.WORKAROUND, PathType.MINIMAL
+    }, "Should keep all non-dominated paths"
+
+    # A slower, less confident copy of a path is dominated
+    best = paths[0]
+    worse = generator._generate_path(
+        best.path_type, "Write a Python script", [],
+        best.steps, best.base_skills, best.base_resources
+    )
+    worse.estimated_time += 1.0
+    worse.confidence -= 0.1
+    pruned = generator._prune_dominated([best, worse])
+    assert pruned == [best], "Should drop the dominated path"
+
+    # Identical candidates do not eliminate each other
+    twin = generator._prune_dominated([best, best])
+    assert len(twin) == 2, "Should keep ties"
+
+    logger.info("✓ Path dominance pruning working correctly")
+
+
 def test_execution_planner():
     """Test execution planning."""
     from cascade.constraint_extractor import ConstraintExtractor
@@ -246,6 +276,164 @@ def test_progress_monitor():
     logger.info("✓ Progress monitor working correctly")
 
 
+def test_progress_monitor_report_counters():
+    """Test that incremental report counters match the plan state."""
+    from cascade.constraint_extractor import ConstraintExtractor
+    from cascade.execution_planner import ExecutionPlanner, TaskStatus
+    from cascade.progress_monitor import ProgressMonitor, ObstacleType
+
+    extractor = ConstraintExtractor()
+    planner = ExecutionPlanner(test_mode=True)
+    monitor = ProgressMonitor()
+
+    constraints = extractor.extract("Complete this in 2 hours")
+    plan = planner.create_plan("Write a Python script", constraints)
+    monitor.start_monitoring(plan)
+
+    # Planner-then-monitor updates should not force a full rebuild
+    rebuilds = []
+    sync_counters = monitor._sync_counters
+    monitor._sync_counters = lambda p: (rebuilds.append(p), sync_counters(p))
+
+    first, second = plan.subtasks[0], plan.subtasks[1]
+    for subtask_id, status, error in [
+        (first.id, TaskStatus.IN_PROGRESS, None),
+        (second.id, TaskStatus.IN_PROGRESS, None),
+        (first.id, TaskStatus.COMPLETED, None),
+        (second.id, TaskStatus.FAILED, "Request timed out"),
+    ]:
+        planner.update_subtask_status(plan, subtask_id, status)
+        report = monitor.update_progress(plan, subtask_id, status, error=error)
+
+        completed = sum(1 for s in plan.subtasks if s.status == TaskStatus.COMPLETED)
+        current = next((s.id for s in plan.subtasks
+                        if s.status == TaskStatus.IN_PROGRESS), None)
+        assert report.completed_subtasks == completed, "Completed count should match plan"
+        assert report.current_subtask == current, "Current subtask should match plan"
+
+    pending = sum(s.estimated_time * 3600 for s in plan.subtasks
+                  if s.status == TaskStatus.PENDING)
+    assert abs(monitor._pending_time_remaining - pending) < 1e-6, \
+        "Pending time should cover pending subtasks"
+    assert not rebuilds, "Counters should be updated in place"
+
+    summary = monitor.get_summary()
+    assert summary['total_obstacles'] == 1, "Should record the timeout obstacle"
+    assert report.obstacles[0].obstacle_type == ObstacleType.TIMEOUT, "Should classify timeout"
+
+    logger.info("✓ Progress monitor counters working correctly")
+
+
+def test_progress_monitor_retry_resyncs_counters():
+    """Test that reports follow status changes made through the planner alone."""
+    from cascade.constraint_extractor import ConstraintExtractor
+    from cascade.execution_planner import ExecutionPlanner, TaskStatus
+    from cascade.progress_monitor import ProgressMonitor
+
+    extractor = ConstraintExtractor()
+    planner = ExecutionPlanner(test_mode=True)
+    monitor = ProgressMonitor()
+
+    constraints = extractor.extract("Complete this in 2 hours")
+    plan = planner.create_plan("Write a Python script", constraints)
+    monitor.start_monitoring(plan)
+
+    first, second = plan.subtasks[0], plan.subtasks[1]
+    for subtask_id, status in [(first.id, TaskStatus.COMPLETED), (second.id, TaskStatus.FAILED)]:
+        planner.update_subtask_status(plan, subtask_id, status)
+        monitor.update_progress(plan, subtask_id, status, error="Worker crashed")
+    before = monitor.generate_report(plan)
+
+    planner.retry_failed_subtasks(plan)
+    planner.update_subtask_status(plan, first.id, TaskStatus.PENDING)
+    after = monitor.generate_report(plan)
+
+    pending = sum(s.estimated_time * 3600 for s in plan.subtasks
+                  if s.status == TaskStatus.PENDING)
+    assert before.completed_subtasks == 1, "Should count the completed subtask"
+    assert after.completed_subtasks == 0, "Should see the planner reset the subtask"
+    assert after.estimated_time_remaining > before.estimated_time_remaining, \
+        "Retried subtasks should count towards the time remaining"
+    assert abs(monitor._pending_time_remaining - pending) < 1e-6, \
+        "Pending time should cover retried subtasks"
+
+    logger.info("✓ Progress monitor counters follow planner retries")
+
+
+def test_progress_monitor_batch_updates():
+    """Test that batched updates produce a single consistent report."""
+    from cascade.constraint_extractor import ConstraintExtractor
+    from cascade.execution_planner import ExecutionPlanner, TaskStatus
+    from cascade.progress_monitor import ProgressMonitor
+
+    extractor = ConstraintExtractor()
+    planner = ExecutionPlanner(test_mode=True)
+    monitor = ProgressMonitor()
+
+    constraints = extractor.extract("Complete this in 2 hours")
+    plan = planner.create_plan("Write a Python script", constraints)
+    monitor.start_monitoring(plan)
+
+    first, second = plan.subtasks[0], plan.subtasks[1]
+    events = [
+        (first.id, TaskStatus.IN_PROGRESS, None, None),
+        (first.id, TaskStatus.COMPLETED, "done", None),
+        (second.id, TaskStatus.FAILED, None, "Dependency failed"),
+    ]
+    for subtask_id, status, _, _ in events:
+        planner.update_subtask_status(plan, subtask_id, status)
+
+    report = monitor.update_progress_many(plan, events)
+    assert report.completed_subtasks == 1, "Should count the completed subtask"
+    assert len(report.obstacles) == 1, "Should record the dependency failure"
+    assert len(report.alerts) == 1, "Should expose one alert per obstacle"
+    assert first.id in monitor.subtask_durations, "Should time the completed subtask"
+
+    logger.info("✓ Progress monitor batch updates working correctly")
+
+
+def test_progress_monitor_concurrent_updates():
+    """Test that concurrent updates from several threads are not lost."""
+    import threading
+    from cascade.execution_planner import ExecutionPlan, Subtask, TaskStatus, TaskPriority
+    from cascade.progress_monitor import ProgressMonitor
+
+    subtasks = [
+        Subtask(
+            id=f"task-{i}", description=f"Subtask {i}", status=TaskStatus.PENDING,
+            priority=TaskPriority.MEDIUM, dependencies=[], estimated_time=1.0,
+            required_model="mistral:latest", prompt="", output_format="text", context={}
+        )
+        for i in range(40)
+    ]
+    plan = ExecutionPlan(
+        task_id="task-concurrent", task_description="Concurrent updates",
+        subtasks=subtasks, total_estimated_time=40.0, workflow_type="parallel",
+        parallelizable=True, checkpoint_interval=1
+    )
+
+    monitor = ProgressMonitor()
+    monitor.start_monitoring(plan)
+
+    def worker(chunk):
+        for subtask in chunk:
+            monitor.update_progress(plan, subtask.id, TaskStatus.IN_PROGRESS)
+            monitor.update_progress(plan, subtask.id, TaskStatus.FAILED, error="Worker crashed")
+
+    threads = [threading.Thread(target=worker, args=(subtasks[i::4],)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    summary = monitor.get_summary()
+    assert summary['total_obstacles'] == len(subtasks), "Should record every failure"
+    assert summary['completed_subtasks'] == len(subtasks), "Should time every subtask"
+    assert monitor.should_stop_execution(), "Should stop after repeated errors"
+
+    logger.info("✓ Progress monitor concurrent updates working correctly")
+
+
 def test_prompt_adjuster():
     """Test prompt adjustment."""
     from cascade.execution_planner import ExecutionPlanner, Subtask, TaskStatus, TaskPriority
@@ -289,6 +477,9 @@ def test_prompt_adjuster():
     best = adjuster.select_best_adjustment(adjustments, obstacle)
     assert best is not None, "Should select best adjustment"
     
+    # Building only the winner should give the same adjustment
+    assert adjuster.select_best(obstacle, subtask) == best, "select_best should match select_best_adjustment"
+    
     logger.info("✓ Prompt adjuster working correctly")
 
 
@@ -342,8 +533,13 @@ def main():
         ("Constraint Extractor", test_constraint_extractor),
         ("Feasibility Validator", test_feasibility_validator),
         ("Path Generator", test_path_generator),
+        ("Path Dominance", test_path_generator_prunes_dominated),
         ("Execution Planner", test_execution_planner),
         ("Progress Monitor", test_progress_monitor),
+        ("Progress Counters", test_progress_monitor_report_counters),
+        ("Progress Retry Resync", test_progress_monitor_retry_resyncs_counters),
+        ("Progress Batch Updates", test_progress_monitor_batch_updates),
+        ("Progress Concurrent Updates", test_progress_monitor_concurrent_updates),
         ("Prompt Adjuster", test_prompt_adjuster),
         ("Integration Test", test_integration),
     ]
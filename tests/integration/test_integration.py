@@ -5,9 +5,10 @@ import pytest
 import json
 import subprocess
 import time
+from dataclasses import FrozenInstanceError
 
 from src.controller import AIStackController, WorkflowResult
-from src.config import AIStackConfig
+from src.config import AIStackConfig, MemoryConfig
 
 
 class TestIntegration:
@@ -109,6 +110,10 @@ class TestIntegration:
         assert executor_config.type.value == "executor"
         assert executor_config.ollama_name == "qwen2.5:14b"
         
+        # Exact Ollama names resolve to their own config, not a family match
+        assert config.get_model_config("qwen2.5:7b") is config.models["qwen2.5-7b"]
+        assert config.get_model_config("mistral:latest") is planner_config
+        
         # Test configuration validation
         issues = config.validate_configuration()
         assert isinstance(issues, list)
@@ -119,6 +124,22 @@ class TestIntegration:
         assert "memory_management" in settings
         assert "thermal_management" in settings
     
+    def test_configuration_immutable(self):
+        """Test that config sections are hashable and only change via update_setting"""
+        config = self.controller.config
+        
+        # Frozen configs can key caches
+        planner_config = config.get_planner_config()
+        assert {planner_config: "planner"}[config.get_model_config("mistral")] == "planner"
+        assert hash(config.memory) == hash(MemoryConfig())
+        
+        with pytest.raises(FrozenInstanceError):
+            config.memory.safety_buffer_gb = 1.0
+        
+        config.update_setting("memory", "safety_buffer_gb", 1.0)
+        assert config.memory.safety_buffer_gb == 1.0
+        assert config.memory != MemoryConfig()
+    
     @pytest.mark.slow
     def test_end_to_end_workflow_mock(self):
         """Test end-to-end workflow with mocked model calls"""
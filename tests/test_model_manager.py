@@ -2,6 +2,7 @@
 Tests for Model Manager
 """
 import pytest
+import threading
 import time
 from unittest.mock import Mock, patch
 
@@ -68,4 +69,31 @@ class TestModelManager:
         # Test with no models
         mock_run.return_value = Mock(returncode=0, stdout="NAME ID SIZE")
         models = self.manager.get_loaded_models()
-        assert len(models) == 0
\ No newline at end of file
+        assert len(models) == 0
+    
+    @patch('subprocess.Popen')
+    @patch('subprocess.run')
+    def test_load_model_cancel(self, mock_run, mock_popen):
+        """Test that a cancelled load stops waiting and kills the ollama process"""
+        mock_run.return_value = Mock(returncode=0, stdout="NAME ID SIZE")
+        process = mock_popen.return_value
+        process.poll.return_value = None
+        
+        cancel = threading.Event()
+        cancel.set()
+        assert self.manager.load_model("mistral:latest", cancel=cancel) == ModelState.ERROR
+        process.terminate.assert_called_once()
+        assert self.manager.any_loaded() == False
+    
+    @patch('subprocess.run')
+    def test_any_loaded(self, mock_run):
+        """Test tracking whether any model is still loaded"""
+        mock_run.return_value = Mock(returncode=0, stdout="")
+        assert self.manager.any_loaded() == False
+        
+        self.manager.loaded_models.add("mistral:latest")
+        assert self.manager.any_loaded() == True
+        
+        with patch('time.sleep'):
+            self.manager.unload_model("mistral:latest")
+        assert self.manager.any_loaded() == False
@@ -0,0 +1,80 @@
+"""
+Unit tests for RAG Semantic Cache component.
+
+Tests the SemanticCache class for reusing responses to near-duplicate queries.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("faiss")
+
+from src.rag.semantic_cache import SemanticCache
+
+
+class TestSemanticCache:
+    """Test suite for SemanticCache class."""
+    
+    @pytest.fixture
+    def embedder(self):
+        """Create an embedder mapping each query to a fixed unit vector."""
+        vectors = {
+            "how do I fix this": np.array([1.0, 0.0, 0.0, 0.0]),
+            "how do i fix this?": np.array([0.99, 0.14, 0.0, 0.0]),
+            "write a parser": np.array([0.0, 1.0, 0.0, 0.0]),
+            "explain the cache": np.array([0.0, 0.0, 1.0, 0.0]),
+        }
+        embedder = Mock()
+        embedder.get_embedding_dimension.return_value = 4
+        embedder.embed_text.side_effect = lambda text: vectors[text] / np.linalg.norm(vectors[text])
+        return embedder
+    
+    def test_hit_for_near_duplicate(self, embedder):
+        """Test that a similar query returns the cached payload."""
+        cache = SemanticCache(embedder)
+        cache.add(cache.embed("how do I fix this"), "answer")
+        
+        assert cache.lookup(cache.embed("how do i fix this?")) == "answer"
+        assert cache.lookup(cache.embed("write a parser")) is None
+    
+    def test_stale_entry_is_dropped(self, embedder):
+        """Test that entries older than the TTL are treated as misses."""
+        cache = SemanticCache(embedder, ttl_seconds=10)
+        with patch("src.rag.semantic_cache.time.time", return_value=100.0):
+            cache.add(cache.embed("write a parser"), "answer")
+        
+        with patch("src.rag.semantic_cache.time.time", return_value=111.0):
+            assert cache.lookup(cache.embed("write a parser")) is None
+        assert cache.get_size() == 0
+    
+    def test_fifo_eviction(self, embedder):
+        """Test that the oldest entry is evicted past max_entries."""
+        cache = SemanticCache(embedder, max_entries=2)
+        cache.add(cache.embed("how do I fix this"), "fix")
+        cache.add(cache.embed("write a parser"), "parser")
+        cache.add(cache.embed("explain the cache"), "cache")
+        
+        assert cache.get_size() == 2
+        assert cache.lookup(cache.embed("how do I fix this")) is None
+        assert cache.lookup(cache.embed("explain the cache")) == "cache"
+    
+    def test_scope_must_match(self, embedder):
+        """Test that answers from another model or template are not returned."""
+        cache = SemanticCache(embedder)
+        cache.add(cache.embed("how do I fix this"), "mistral answer", scope=("mistral", "debug"))
+        
+        assert cache.lookup(cache.embed("how do I fix this"), scope=("qwen", "debug")) is None
+        assert cache.lookup(cache.embed("how do I fix this"), scope=("mistral", "debug")) == "mistral answer"
+    
+    def test_fresh_match_behind_stale_nearest(self, embedder):
+        """Test that a stale nearest entry does not hide a fresh match."""
+        cache = SemanticCache(embedder, ttl_seconds=10)
+        with patch("src.rag.semantic_cache.time.time", return_value=100.0):
+            cache.add(cache.embed("how do I fix this"), "old")
+        with patch("src.rag.semantic_cache.time.time", return_value=105.0):
+            cache.add(cache.embed("how do i fix this?"), "new")
+        
+        with patch("src.rag.semantic_cache.time.time", return_value=111.0):
+            assert cache.lookup(cache.embed("how do I fix this")) == "new"
+        assert cache.get_size() == 1
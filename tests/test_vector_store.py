@@ -331,4 +331,42 @@ class TestFAISSVectorStore:
         vector_store.add_embeddings(large_embeddings, large_metadata)
         
         assert vector_store.get_size() == 1000
-        assert len(vector_store.metadata) == 1000
\ No newline at end of file
+        assert len(vector_store.metadata) == 1000
+    
+    def test_ivf_index_trained_before_add(self):
+        """Test that IVF-PQ indexes train on the first add and search with nprobe."""
+        faiss = pytest.importorskip("faiss")
+        from src.rag.vector_store import FAISSVectorStore
+        
+        vector_store = FAISSVectorStore(index_type="IVF16,PQ8", dimension=32, nprobe=4)
+        assert vector_store.min_training_size() == 16 * 39
+        
+        rng = np.random.default_rng(0)
+        embeddings = rng.random((2000, 32), dtype=np.float32)
+        vector_store.add_embeddings(embeddings, [{'id': i} for i in range(2000)])
+        
+        assert vector_store.index.is_trained
+        assert faiss.extract_index_ivf(vector_store.index).nprobe == 4
+        distances, results = vector_store.search(embeddings[7], k=5)
+        assert results[0]['id'] == 7
+    
+    def test_ivf_index_rejects_too_little_training_data(self):
+        """Test that training an IVF index on too few vectors raises a clear error."""
+        pytest.importorskip("faiss")
+        from src.rag.vector_store import FAISSVectorStore
+        
+        vector_store = FAISSVectorStore(index_type="IVF16,PQ8", dimension=32)
+        embeddings = np.random.rand(100, 32).astype(np.float32)
+        
+        with pytest.raises(ValueError, match="at least 624"):
+            vector_store.add_embeddings(embeddings, [{'id': i} for i in range(100)])
+        assert vector_store.get_size() == 0
+    
+    def test_index_type_for_size(self):
+        """Test that large corpora get an IVF-PQ index and small ones stay Flat."""
+        from src.rag.vector_store import index_type_for_size, ANN_MIN_VECTORS
+        
+        assert index_type_for_size(ANN_MIN_VECTORS - 1, 384) == "Flat"
+        assert index_type_for_size(10_000_000, 384) == "IVF4096,PQ64"
+        # No sub-quantizer count divides 100, so vectors are stored unquantized
+        assert index_type_for_size(ANN_MIN_VECTORS, 100).endswith(",Flat")